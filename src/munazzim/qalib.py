@@ -7,7 +7,7 @@ import re
 from typing import Iterable, Sequence
 
 from .models import DayTemplate, Event, FixedEvent, PrayerEvent, PrayerBoundEvent, Task
-from .timeutils import format_duration, format_hhmm, parse_hhmm
+from .timeutils import format_duration, format_hhmm, parse_hhmm, parse_prayer_offset
 
 
 class QalibParseError(RuntimeError):
@@ -16,7 +16,6 @@ class QalibParseError(RuntimeError):
 
 _DURATION_TOKEN = re.compile(r"^(?:\d+(?::\d{2})?|\d+\.\d{1,2}|\.\d{1,2})$")
 _TIME_TOKEN = re.compile(r"^\d{1,2}[:.]\d{2}$")
-_PRAYER_OFFSET_TOKEN = re.compile(r"^(?P<prayer>[A-Za-z]+)(?P<sign>[+-])(?P<minutes>\d{1,3})$")
 _PRAYER_ALIASES = {
     "fajr": "fajr",
     "dhuhr": "dhuhr",
@@ -46,12 +45,10 @@ def _parse_time_or_prayer(token: str) -> time | str | None:
         return None
     if _is_time_token(cleaned):
         return parse_hhmm(cleaned)
-    offset_match = _PRAYER_OFFSET_TOKEN.match(cleaned)
-    if offset_match:
-        prayer = _normalize_prayer_token(offset_match.group("prayer"))
-        sign = offset_match.group("sign")
-        minutes = offset_match.group("minutes")
-        return f"{prayer}{sign}{minutes}"
+    offset = parse_prayer_offset(cleaned)
+    if offset:
+        prayer, sign, minutes = offset
+        return f"{_normalize_prayer_token(prayer)}{sign}{minutes}"
     if _is_prayer_token(cleaned):
         return _normalize_prayer_token(cleaned)
     raise QalibParseError(f"Unsupported time/prayer token '{token}'")
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Mapping
@@ -7,7 +8,8 @@ from typing import Mapping
 from google.auth.transport.requests import Request  # type: ignore[import]
 from google.oauth2.credentials import Credentials  # type: ignore[import]
 from google_auth_oauthlib.flow import InstalledAppFlow  # type: ignore[import]
-from googleapiclient.discovery import build  # type: ignore[import]
+
+from .google_http import build_service
 
 
 SCOPES = ["https://www.googleapis.com/auth/calendar"]
@@ -30,6 +32,24 @@ class CalendarEvent:
     recurring_event_id: str | None = None
 
 
+# Google's batch endpoint accepts at most this many calls per request.
+BATCH_LIMIT = 50
+# Batches sent at once when a bulk call needs several.
+MAX_CONCURRENT_BATCHES = 4
+
+
+def _calendar_event(data: dict) -> CalendarEvent:
+    return CalendarEvent(
+        id=data.get("id"),
+        summary=data.get("summary", ""),
+        start=data.get("start"),
+        end=data.get("end"),
+        recurrence=data.get("recurrence"),
+        extended_properties=data.get("extendedProperties"),
+        recurring_event_id=data.get("recurringEventId"),
+    )
+
+
 class GoogleCalendarService:
     def __init__(self, client_secrets_path: str | Path | None = None, token_path: str | Path | None = None):
         self.client_secrets_path = Path(client_secrets_path) if client_secrets_path else Path.home() / ".config" / "munazzim" / "google_client_secret.json"
@@ -57,11 +77,12 @@ class GoogleCalendarService:
             with self.token_path.open("w", encoding="utf-8") as fh:
                 fh.write(creds.to_json())
         self._creds = creds
-        self._service = build("calendar", "v3", credentials=creds)
+        self._service = build_service("calendar", "v3", creds)
 
     def list_calendars(self) -> list[Calendar]:
         self._ensure_authenticated()
-        results = self._service.calendarList().list(maxResults=200).execute()
+        # Calendar only carries the id and summary; skip the rest of the resource
+        results = self._service.calendarList().list(maxResults=200, fields="items(id,summary)").execute()
         items = results.get("items", [])
         return [Calendar(id=item["id"], summary=item.get("summary", "")) for item in items]
 
@@ -73,7 +94,18 @@ class GoogleCalendarService:
         created = self._service.calendars().insert(body=body).execute()
         return Calendar(id=created.get("id"), summary=created.get("summary", ""))
 
-    def list_events(self, calendar_id: str = "primary", timeMin: str | None = None, timeMax: str | None = None) -> list[CalendarEvent]:
+    def list_events(
+        self,
+        calendar_id: str = "primary",
+        timeMin: str | None = None,
+        timeMax: str | None = None,
+        fields: str | None = None,
+    ) -> list[CalendarEvent]:
+        """List event instances in the time range.
+
+        ``fields`` is passed through as the API's partial-response mask; event
+        attributes left out of it come back empty.
+        """
         self._ensure_authenticated()
         kwargs: dict = {"calendarId": calendar_id}
         if timeMin:
@@ -83,46 +115,88 @@ class GoogleCalendarService:
         # List event instances in the time range so recurring events are expanded
         kwargs["singleEvents"] = True
         kwargs["orderBy"] = "startTime"
+        if fields:
+            kwargs["fields"] = fields
         results = self._service.events().list(**kwargs).execute()
-        items = results.get("items", [])
-        out: list[CalendarEvent] = []
-        for it in items:
-            out.append(
-                CalendarEvent(
-                    id=it.get("id"),
-                    summary=it.get("summary", ""),
-                    start=it.get("start"),
-                    end=it.get("end"),
-                    recurrence=it.get("recurrence"),
-                    extended_properties=it.get("extendedProperties"),
-                    recurring_event_id=it.get("recurringEventId"),
-                )
-            )
-        return out
+        return [_calendar_event(it) for it in results.get("items", [])]
 
     def create_event(self, calendar_id: str, event_body: dict) -> CalendarEvent:
         self._ensure_authenticated()
         created = self._service.events().insert(calendarId=calendar_id, body=event_body).execute()
-        return CalendarEvent(
-            id=created.get("id"),
-            summary=created.get("summary", ""),
-            start=created.get("start"),
-            end=created.get("end"),
-            recurrence=created.get("recurrence"),
-            extended_properties=created.get("extendedProperties"),
+        return _calendar_event(created)
+
+    def _run_batches(self, items: list, make_request, callback) -> None:
+        """Send one request per item, grouped into batches of BATCH_LIMIT.
+
+        Several batches go out concurrently. Requests are built on the
+        thread that sends them so each batch uses that thread's connection.
+        Each request's id is the item's index in ``items``.
+        """
+        offsets = range(0, len(items), BATCH_LIMIT)
+
+        def _send(offset: int) -> None:
+            batch = self._service.new_batch_http_request(callback=callback)
+            for index, item in enumerate(items[offset : offset + BATCH_LIMIT], start=offset):
+                batch.add(make_request(item), request_id=str(index))
+            batch.execute()
+
+        if len(offsets) <= 1:
+            for offset in offsets:
+                _send(offset)
+            return
+        with ThreadPoolExecutor(max_workers=min(len(offsets), MAX_CONCURRENT_BATCHES)) as executor:
+            list(executor.map(_send, offsets))
+
+    def create_events_bulk(self, calendar_id: str, event_bodies: list[dict]) -> tuple[list[CalendarEvent], list[Exception]]:
+        """Create several events using batched HTTP requests.
+
+        Returns the created events, in ``event_bodies`` order, and the errors
+        of any failed calls, so one rejected event doesn't abort the rest.
+        """
+        self._ensure_authenticated()
+        created: dict[int, CalendarEvent] = {}
+        errors: list[Exception] = []
+
+        def _collect(request_id, response, exception) -> None:
+            if exception is not None:
+                errors.append(exception)
+            else:
+                created[int(request_id)] = _calendar_event(response)
+
+        self._run_batches(
+            event_bodies,
+            lambda body: self._service.events().insert(calendarId=calendar_id, body=body),
+            _collect,
+        )
+        return [created[index] for index in sorted(created)], errors
+
+    def delete_events_bulk(self, calendar_id: str, event_ids: list[str]) -> tuple[int, list[Exception]]:
+        """Delete several events using batched HTTP requests.
+
+        Returns the number of deleted events and the errors of any failed
+        calls, like ``create_events_bulk``.
+        """
+        self._ensure_authenticated()
+        deleted: list[str] = []
+        errors: list[Exception] = []
+
+        def _collect(request_id, response, exception) -> None:
+            if exception is not None:
+                errors.append(exception)
+            else:
+                deleted.append(request_id)
+
+        self._run_batches(
+            event_ids,
+            lambda event_id: self._service.events().delete(calendarId=calendar_id, eventId=event_id),
+            _collect,
         )
+        return len(deleted), errors
 
     def update_event(self, calendar_id: str, event_id: str, body: dict) -> CalendarEvent:
         self._ensure_authenticated()
         updated = self._service.events().patch(calendarId=calendar_id, eventId=event_id, body=body).execute()
-        return CalendarEvent(
-            id=updated.get("id"),
-            summary=updated.get("summary", ""),
-            start=updated.get("start"),
-            end=updated.get("end"),
-            recurrence=updated.get("recurrence"),
-            extended_properties=updated.get("extendedProperties"),
-        )
+        return _calendar_event(updated)
 
     def delete_event(self, calendar_id: str, event_id: str) -> None:
         self._ensure_authenticated()
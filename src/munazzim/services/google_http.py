@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import threading
+
+import google_auth_httplib2  # type: ignore[import]
+import httplib2  # type: ignore[import]
+from googleapiclient.discovery import build  # type: ignore[import]
+from googleapiclient.http import HttpRequest  # type: ignore[import]
+
+
+def build_service(api: str, version: str, credentials):
+    """Build a Google API client whose requests reuse pooled connections.
+
+    ``httplib2.Http`` keeps one keep-alive connection per host but is not
+    thread-safe, and the TUI issues calls from worker threads. Each thread
+    therefore gets its own authorized ``Http`` which is reused for every
+    request made on that thread, avoiding a TCP/TLS handshake per call.
+    """
+    local = threading.local()
+
+    def _thread_http():
+        http = getattr(local, "http", None)
+        if http is None:
+            http = local.http = google_auth_httplib2.AuthorizedHttp(credentials, http=httplib2.Http())
+        return http
+
+    def _request_builder(http, *args, **kwargs):
+        return HttpRequest(_thread_http(), *args, **kwargs)
+
+    return build(api, version, http=_thread_http(), requestBuilder=_request_builder)
@@ -6,7 +6,8 @@ from pathlib import Path
 from google.auth.transport.requests import Request  # type: ignore[import]
 from google.oauth2.credentials import Credentials  # type: ignore[import]
 from google_auth_oauthlib.flow import InstalledAppFlow  # type: ignore[import]
-from googleapiclient.discovery import build  # type: ignore[import]
+
+from .google_http import build_service
 
 
 SCOPES = ["https://www.googleapis.com/auth/tasks"]
@@ -28,6 +29,32 @@ class TaskItem:
     recurrence: list[str] | None
 
 
+# Google's batch endpoint accepts at most this many calls per request.
+BATCH_LIMIT = 50
+
+
+def _task_item(data: dict) -> TaskItem:
+    return TaskItem(
+        id=data.get("id"),
+        title=data.get("title", ""),
+        due=data.get("due"),
+        notes=data.get("notes"),
+        status=data.get("status", "needsAction"),
+        recurrence=data.get("recurrence"),
+    )
+
+
+def _task_payload(title: str, due: str | None = None, notes: str | None = None, recurrence: list[str] | None = None) -> dict:
+    payload: dict = {"title": title}
+    if notes:
+        payload["notes"] = notes
+    if due:
+        payload["due"] = due
+    if recurrence:
+        payload["recurrence"] = recurrence
+    return payload
+
+
 class GoogleTasksService:
     """Abstraction over Google Tasks API.
 
@@ -65,7 +92,7 @@ class GoogleTasksService:
                 fh.write(creds.to_json())
         self._creds = creds
         # Build service lazily and store
-        self._service = build("tasks", "v1", credentials=creds)
+        self._service = build_service("tasks", "v1", creds)
 
     def list_tasklists(self) -> list[TaskList]:
         self._ensure_authenticated()
@@ -83,39 +110,67 @@ class GoogleTasksService:
         self._ensure_authenticated()
         # fields: id, title, due, notes, status, recurrence
         results = self._service.tasks().list(tasklist=tasklist_id, showCompleted=show_completed, maxResults=200).execute()
-        items = results.get("items", [])
-        output: list[TaskItem] = []
-        for it in items:
-            output.append(
-                TaskItem(
-                    id=it.get("id"),
-                    title=it.get("title", ""),
-                    due=it.get("due"),
-                    notes=it.get("notes"),
-                    status=it.get("status", "needsAction"),
-                    recurrence=it.get("recurrence"),
+        return [_task_item(it) for it in results.get("items", [])]
+
+    def batch_list_tasks(self, tasklist_ids: list[str], show_completed: bool = True) -> dict[str, list[TaskItem]]:
+        """List tasks for several lists using batched HTTP requests.
+
+        Returns a mapping of list id to its tasks. Lists whose call failed are
+        omitted so callers can fall back to ``list_tasks`` for them.
+        """
+        self._ensure_authenticated()
+        results: dict[str, list[TaskItem]] = {}
+
+        def _collect(request_id, response, exception) -> None:
+            if exception is None:
+                results[request_id] = [_task_item(it) for it in response.get("items", [])]
+
+        ids = list(dict.fromkeys(tasklist_ids))
+        for offset in range(0, len(ids), BATCH_LIMIT):
+            batch = self._service.new_batch_http_request(callback=_collect)
+            for tasklist_id in ids[offset : offset + BATCH_LIMIT]:
+                batch.add(
+                    self._service.tasks().list(tasklist=tasklist_id, showCompleted=show_completed, maxResults=200),
+                    request_id=tasklist_id,
                 )
-            )
-        return output
+            batch.execute()
+        return results
 
     def create_task(self, tasklist_id: str, title: str, due: str | None = None, notes: str | None = None, recurrence: list[str] | None = None) -> TaskItem:
         self._ensure_authenticated()
-        payload: dict = {"title": title}
-        if notes:
-            payload["notes"] = notes
-        if due:
-            payload["due"] = due
-        if recurrence:
-            payload["recurrence"] = recurrence
+        payload = _task_payload(title, due=due, notes=notes, recurrence=recurrence)
         created = self._service.tasks().insert(tasklist=tasklist_id, body=payload).execute()
-        return TaskItem(
-            id=created.get("id"),
-            title=created.get("title", ""),
-            due=created.get("due"),
-            notes=created.get("notes"),
-            status=created.get("status", "needsAction"),
-            recurrence=created.get("recurrence"),
-        )
+        return _task_item(created)
+
+    def create_tasks_bulk(self, tasklist_id: str, specs: list[dict]) -> list[TaskItem]:
+        """Create several tasks in one list using batched HTTP requests.
+
+        Each spec holds the ``create_task`` keyword arguments (``title`` and
+        optionally ``due``, ``notes``, ``recurrence``). Created tasks are
+        returned in spec order; the first failed call is raised after all
+        batches have run.
+        """
+        self._ensure_authenticated()
+        created: dict[str, TaskItem] = {}
+        errors: list[Exception] = []
+
+        def _collect(request_id, response, exception) -> None:
+            if exception is not None:
+                errors.append(exception)
+            else:
+                created[request_id] = _task_item(response)
+
+        for offset in range(0, len(specs), BATCH_LIMIT):
+            batch = self._service.new_batch_http_request(callback=_collect)
+            for index, spec in enumerate(specs[offset : offset + BATCH_LIMIT], start=offset):
+                batch.add(
+                    self._service.tasks().insert(tasklist=tasklist_id, body=_task_payload(**spec)),
+                    request_id=str(index),
+                )
+            batch.execute()
+        if errors:
+            raise errors[0]
+        return [created[str(index)] for index in range(len(specs))]
 
     def update_task(self, tasklist_id: str, task_id: str, **kwargs) -> TaskItem:
         self._ensure_authenticated()
@@ -124,14 +179,7 @@ class GoogleTasksService:
             if key in kwargs:
                 body[key] = kwargs[key]
         updated = self._service.tasks().patch(tasklist=tasklist_id, task=task_id, body=body).execute()
-        return TaskItem(
-            id=updated.get("id"),
-            title=updated.get("title", ""),
-            due=updated.get("due"),
-            notes=updated.get("notes"),
-            status=updated.get("status", "needsAction"),
-            recurrence=updated.get("recurrence"),
-        )
+        return _task_item(updated)
 
     def delete_task(self, tasklist_id: str, task_id: str) -> None:
         self._ensure_authenticated()
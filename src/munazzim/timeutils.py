@@ -37,6 +37,30 @@ def parse_duration(value: str) -> timedelta:
     raise ValueError(f"Unsupported duration format: {value}")
 
 
+def parse_prayer_offset(token: str) -> tuple[str, str, int] | None:
+    """Split a ``prayer+MM``/``prayer-MM`` token into (prayer, sign, minutes).
+
+    The prayer must be ASCII letters (returned lowercased) and the offset
+    1-3 digits; anything else returns None.
+    """
+    split = token.find("+")
+    if split < 0:
+        split = token.find("-")
+    if split <= 0:
+        return None
+    prayer = token[:split]
+    digits = token[split + 1:]
+    if not (
+        prayer.isascii()
+        and prayer.isalpha()
+        and 0 < len(digits) <= 3
+        and digits.isascii()
+        and digits.isdigit()
+    ):
+        return None
+    return prayer.lower(), token[split], int(digits)
+
+
 def format_hhmm(value: time) -> str:
     return value.strftime("%H:%M")
 
@@ -8,10 +8,17 @@ import json
 import shlex
 import shutil
 import subprocess
+import tempfile
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
 from dataclasses import dataclass
-from datetime import date, datetime, timedelta
+from datetime import date, datetime, timedelta, timezone
+from functools import partial
+from operator import itemgetter
 from pathlib import Path
 from typing import Callable
+from zoneinfo import ZoneInfo
 
 from textual.app import App, ComposeResult  # type: ignore[import]
 from textual.binding import Binding  # type: ignore[import]
@@ -58,7 +65,7 @@ class PlanContext:
     day_label: str
 
 
-WEEKDAY_ORDER = [
+WEEKDAY_ORDER = (
     "monday",
     "tuesday",
     "wednesday",
@@ -66,7 +73,115 @@ WEEKDAY_ORDER = [
     "friday",
     "saturday",
     "sunday",
-]
+)
+_WEEKDAY_INDEX = {day_name: index for index, day_name in enumerate(WEEKDAY_ORDER)}
+# RRULE BYDAY codes for the weekly calendar events
+_WEEKDAY_BYDAY = tuple(day_name[:2].upper() for day_name in WEEKDAY_ORDER)
+# The only parts of listed calendar events the sync reads
+_SYNC_EVENT_FIELDS = "items(id,recurringEventId,start,end,extendedProperties/private)"
+
+
+def _scheduled_event_name(scheduled: object) -> str | None:
+    """Return the event name of a scheduled plan row, or None."""
+    event = getattr(scheduled, "event", None)
+    return getattr(event, "name", None) if event is not None else None
+
+
+def _tasks_fingerprint(tasks: list) -> int:
+    """Hash the task fields shown in the todo view."""
+    return hash(tuple((t.id, t.status, t.due, t.title, t.notes) for t in tasks))
+
+
+def _event_series_ids(events: list) -> list[str]:
+    """Return the id of each listed event's series, or of the event itself."""
+    return [
+        event_id
+        for ev in events
+        if (
+            event_id := getattr(ev, "recurring_event_id", None)
+            or getattr(ev, "recurringEventId", None)
+            or getattr(ev, "id", None)
+        )
+    ]
+
+
+def _event_time(value) -> datetime | None:
+    """Parse the ``dateTime`` of an event's start or end, if it has one."""
+    try:
+        return datetime.fromisoformat(value["dateTime"])
+    except Exception:
+        return None
+
+
+def _diff_weekly_events(existing: list, planned: list[dict]) -> tuple[set[str], list[dict]]:
+    """Match planned payloads against the events already in the calendar.
+
+    An existing event is reused for a payload with the same signature and
+    the same start and end. Returns the series ids to keep and the payloads
+    that still have to be created.
+    """
+    reusable: dict[str, list[tuple[str, datetime | None, datetime | None]]] = {}
+    for ev in existing:
+        private = (getattr(ev, "extended_properties", None) or {}).get("private") or {}
+        sig = private.get("munazzim_signature")
+        event_id = (
+            getattr(ev, "recurring_event_id", None)
+            or getattr(ev, "recurringEventId", None)
+            or getattr(ev, "id", None)
+        )
+        if sig and event_id:
+            reusable.setdefault(sig, []).append(
+                (event_id, _event_time(getattr(ev, "start", None)), _event_time(getattr(ev, "end", None)))
+            )
+    kept: set[str] = set()
+    to_create: list[dict] = []
+    for payload in planned:
+        candidates = reusable.get(payload["extendedProperties"]["private"]["munazzim_signature"])
+        times = (_event_time(payload["start"]), _event_time(payload["end"]))
+        match = next((c for c in candidates if c[1:] == times), None) if candidates else None
+        if match is None or None in times:
+            to_create.append(payload)
+            continue
+        candidates.remove(match)
+        kept.add(match[0])
+    return kept, to_create
+
+
+def _week_dates(day: date) -> list[date]:
+    """Return the dates of the Monday-to-Sunday week containing ``day``."""
+    monday = day.toordinal() - day.weekday()
+    return [date.fromordinal(monday + offset) for offset in range(7)]
+
+
+def _midnight(day: date, tz) -> datetime:
+    """Return the start of ``day`` in ``tz``."""
+    return datetime(day.year, day.month, day.day, tzinfo=tz)
+
+
+def _weekly_event_payload(sched: object, weekday: int, tz, tzname: str | None) -> dict:
+    """Build the recurring Google Calendar event body for ``sched``.
+
+    The event repeats on ``weekday`` (Monday is 0) every week. Naive times
+    are taken to be in ``tz``.
+    """
+    byday = _WEEKDAY_BYDAY[weekday]
+    ev_name = sched.display_name
+    start = sched.start
+    local_time = start.replace(tzinfo=tz) if start.tzinfo is None else start.astimezone(tz)
+    sig = f"{ev_name}|{byday}|{local_time.hour:02d}:{local_time.minute:02d}"
+    end = getattr(sched, "end", None)
+    if end:
+        end_local = end.replace(tzinfo=tz) if end.tzinfo is None else end.astimezone(tz)
+    else:
+        end_local = local_time + sched.event.duration
+    time_zone = tzname or "UTC"
+    return {
+        "summary": ev_name,
+        "start": {"dateTime": local_time.isoformat(), "timeZone": time_zone},
+        "end": {"dateTime": end_local.isoformat(), "timeZone": time_zone},
+        "recurrence": [f"RRULE:FREQ=WEEKLY;BYDAY={byday}"],
+        "extendedProperties": {"private": {"munazzim_signature": sig, "munazzim_event": getattr(sched.event, 'name', '')}},
+    }
 
 
 class StatusLine(Static):
@@ -837,6 +952,7 @@ class MunazzimApp(App):
         Binding("f", "focus_tasks", "Tasks"),
     Binding("e", "edit_plan", "Open Template"),
     Binding("C", "sync_google_calendar_week", "Sync Calendar (Week)"),
+    Binding("W", "force_sync_google_calendar_week", "Force Sync Calendar (Week)"),
     Binding("Y", "force_sync_google_calendar_today", "Force Sync Calendar (Today)"),
         # Resize layout: ctrl+h/l adjust vertical split (plan/side).
         Binding("ctrl+h", "resize_left", "Decrease Plan Width"),
@@ -859,6 +975,11 @@ class MunazzimApp(App):
         self.active_template_name = self._resolve_template_name(self.current_date, names)
         self.prayer_service = PrayerService(self.config, config_manager=self.config_manager)
         self.scheduler = Scheduler(self.config, prayer_service=self.prayer_service)
+        # Resolved configured timezone (None when unset or invalid); see _resolve_tz.
+        self._tz_name: str | None = None
+        self._tz: ZoneInfo | None = None
+        self._tz_resolved = False
+        self._resolve_tz()
         self.task_store = TaskStore()
         self.plan_table: PlanTable | None = None
         self.plan_header: Static | None = None
@@ -887,8 +1008,34 @@ class MunazzimApp(App):
 
         self.selected_google_tasklist = self.config.planner.google_task_list or ""
         # Cache Google Tasks list items to avoid repetitive network calls
-        self._google_tasks_cache: dict[str, tuple[float, list]] = {}
+        # Entries past the TTL are still served (stale-while-revalidate)
+        # while a background refresh runs; the least recently used entries
+        # are evicted once the cache holds more than _google_tasks_cache_max lists.
+        self._google_tasks_cache: OrderedDict[str, tuple[float, list]] = OrderedDict()
         self._google_tasks_cache_ttl = 30.0  # seconds
+        self._google_tasks_cache_max = 64
+        # Built TodoDisplay rows per list: (tasks fingerprint, (event, start), rows)
+        self._todo_view_cache: dict[str, tuple[int, tuple, list[TodoDisplay]]] = {}
+        # List ids with a background refresh in flight, so repeated cursor
+        # moves over the same event don't stack up identical API calls.
+        self._inflight_refresh: set[str] = set()
+        # Task lists are cached as (timestamp, lists, lists indexed by title)
+        # so event-name lookups on cursor movement are a dict hit.
+        self._google_tasklists_cache: tuple[float, list, dict[str, object]] | None = None
+        self._tasklists_lock = threading.Lock()
+        # Titles of every task list seen so far, by id. Not expired with the
+        # list cache; titles are only used to match lists to plan events.
+        self._tasklist_titles: dict[str, str] = {}
+        # ((date, templates fingerprint), event name -> starts) for this week
+        self._week_occurrence_cache: tuple[tuple, dict[str, list[datetime]]] | None = None
+        # Sync-time day plans keyed by (template name, date); see _get_day_plan
+        self._day_plan_cache: dict[tuple[str, date], DayPlan] = {}
+        # Template file digests keyed by path: (mtime_ns, size, sha256)
+        self._file_hash_cache: dict[Path, tuple[int, int, str]] = {}
+        # Google calendar ids by name; see _resolve_calendar_id
+        self._cal_id_cache: dict[str, str] = {}
+        # Resolved editor command; see _editor_command
+        self._editor_cmd: list[str] | None = None
         # Used to prevent the refresh auto-fallback from overriding a list
         # the user explicitly just selected in this session. This flag is
         # cleared after we attempt to use the selection once.
@@ -902,6 +1049,12 @@ class MunazzimApp(App):
             on_external_toggle=self._on_google_task_toggled,
         )
         self._is_refreshing = False
+        # Pending coalesced refresh (see _schedule_refresh)
+        self._pending_refresh: asyncio.TimerHandle | None = None
+        self._pending_template_reload = False
+        # Config writes are coalesced so rapid navigation hits disk once.
+        self._config_dirty = False
+        self._pending_config_flush: asyncio.TimerHandle | None = None
         self._todo_view_active = False
         # Track last time the user navigated the plan manually so auto-highlighting
         # won't steal focus while they're actively moving through the plan.
@@ -915,18 +1068,23 @@ class MunazzimApp(App):
         # vertical/fr ratios for main content areas (controls height of plan and week tables)
         self._plan_table_fr = 1.0
         self._week_table_fr = 1.0
+        # Panels and tables resized by _apply_layout_ratios; see _layout_widgets
+        self._layout_widget_cache: tuple[Widget, Widget, Widget, Widget] | None = None
 
-    def action_sync_google_calendar_week(self) -> None:
+    def action_sync_google_calendar_week(self, force: bool = False) -> None:
         """Sync the currently assigned week into Google Calendar.
 
         This creates (or updates) recurring weekly events in the configured
         calendar for each scheduled event within the current week. Recurrences
         are intentionally left open-ended (no UNTIL) so they continue forever.
+        Unchanged events are kept unless ``force`` rebuilds the whole week.
         """
         # Guard: if calendar service isn't available, show an informative message
         if not getattr(self, "google_calendar_service", None):
             self._display_error("Google Calendar", "Google Calendar service not configured or missing dependencies")
             return
+        # Build plans fresh once per sync; the helpers then share them
+        self._day_plan_cache.clear()
 
         # Run sync in a background thread so UI remains responsive.
         try:
@@ -934,7 +1092,7 @@ class MunazzimApp(App):
         except RuntimeError:
             # No running loop (tests or non-async contexts): run sync inline
             try:
-                created_count = self._sync_week_to_google_calendar()
+                created_count = self._sync_week_to_google_calendar(force=force)
                 try:
                     if isinstance(created_count, int):
                         if created_count > 0:
@@ -952,7 +1110,7 @@ class MunazzimApp(App):
         def _worker() -> None:
             created_count = 0
             try:
-                created_count = self._sync_week_to_google_calendar()
+                created_count = self._sync_week_to_google_calendar(force=force)
             except Exception as exc:  # capture exceptions and schedule UI notification
                 loop.call_soon_threadsafe(lambda: self._calendar_sync_finished(False, str(exc)))
             else:
@@ -966,6 +1124,14 @@ class MunazzimApp(App):
         t = threading.Thread(target=_worker, daemon=True)
         t.start()
 
+    def action_force_sync_google_calendar_week(self) -> None:
+        """Delete and recreate every Munazzim event of the current week.
+
+        Use when the calendar has drifted from the plan in ways the regular
+        sync, which keeps unchanged events, does not repair.
+        """
+        self.action_sync_google_calendar_week(force=True)
+
     def action_force_sync_google_calendar_today(self) -> None:
         """Force sync today's scheduled events to Google Calendar.
 
@@ -977,6 +1143,9 @@ class MunazzimApp(App):
         if not getattr(self, "google_calendar_service", None):
             self._display_error("Google Calendar", "Google Calendar service not configured or missing dependencies")
             return
+        # A forced resync re-resolves the calendar in case it was removed remotely
+        self._invalidate_cal_cache()
+        self._day_plan_cache.clear()
 
         # Run the sync in a background thread like the weekly sync
         try:
@@ -1107,6 +1276,9 @@ class MunazzimApp(App):
         self._apply_layout_ratios()
         self.refresh_plan()
 
+    def on_unmount(self) -> None:
+        self._flush_config()
+
     def refresh_plan(self, *, target_date: date | None = None) -> None:
         if self._is_refreshing:
             return
@@ -1259,12 +1431,12 @@ class MunazzimApp(App):
                 # default to first list when not configured
                 try:
                     if not list_id:
-                        lists = self.google_tasks_service.list_tasklists()
+                        lists = self._list_tasklists()
                         if lists:
                             list_id = lists[0].id
                             self.selected_google_tasklist = list_id
                             self.config.planner.google_task_list = list_id
-                            self.config_manager.save(self.config)
+                            self._mark_config_dirty()
                 except Exception:
                     list_id = None
                 if list_id:
@@ -1289,64 +1461,21 @@ class MunazzimApp(App):
                         # a generic 'Google Tasks'. If the list title is unknown,
                         # fall back to the generic provider label.
                         try:
-                            lists = self.google_tasks_service.list_tasklists()
+                            lists = self._list_tasklists()
                             list_title = next((l.title for l in lists if l.id == list_id), "Google Tasks")
                         except Exception:
                             list_title = "Google Tasks"
                         # Map event name to scheduled start within current plan
                         event_start_map: dict[str, datetime] = {}
                         for scheduled in plan.items:
-                            try:
-                                key = scheduled.event.name if hasattr(scheduled.event, "name") else None
-                            except Exception:
-                                key = None
+                            key = _scheduled_event_name(scheduled)
                             if key:
                                 event_start_map.setdefault(key, scheduled.start)
 
-                        g_todos = []
-                        for t in g_tasks:
-                            # If the task belongs to a list equal to a scheduled
-                            # event name for this plan, prefer that event's start
-                            # time for the due display (the Tasks API discards
-                            # time information, so we reconstruct it from the
-                            # plan).
-                            due_val = t.due
-                            if list_title in event_start_map:
-                                # Convert start to RFC3339 UTC string so downstream
-                                # behavior is consistent (this string will be parsed
-                                # and displayed as local time by the UI formatter).
-                                from zoneinfo import ZoneInfo
-                                from datetime import timezone as _tz, datetime as _dt
-
-                                start_dt = event_start_map[list_title]
-                                tzname = self.config.location.timezone if getattr(self.config, 'location', None) and getattr(self.config.location, 'timezone', None) else None
-                                try:
-                                    tz = ZoneInfo(tzname) if tzname else _dt.now().astimezone().tzinfo
-                                except Exception:
-                                    tz = _dt.now().astimezone().tzinfo
-                                if start_dt.tzinfo is None:
-                                    start_aware = start_dt.replace(tzinfo=tz)
-                                else:
-                                    start_aware = start_dt
-                                due_val = start_aware.astimezone(_tz.utc).isoformat().replace("+00:00", "Z")
-
-                            g_todos.append(
-                                TodoDisplay(
-                                    task=t.title,
-                                    event=list_title,
-                                    note=t.notes,
-                                    due=due_val,
-                                    task_id=t.id,
-                                    assignment_id=None,
-                                    total=None,
-                                    ordinal=None,
-                                    checked=(t.status == "completed"),
-                                    toggleable=True,
-                                    last_completed=None,
-                                    provider="google",
-                                )
-                            )
-                        todos = g_todos
+                        # Tasks in a list named after a scheduled event use that
+                        # event's start as their due value (the Tasks API discards
+                        # time information, so we reconstruct it from the plan).
+                        todos = self._todo_view(list_id, g_tasks, list_title, event_start_map)
                     except Exception as exc:  # pragma: no cover - network faults
                         # If the user explicitly selected this list during this
                         # session, don't override it just because the API reports
@@ -1360,7 +1489,7 @@ class MunazzimApp(App):
                             # was removed/renamed). If we can find a new first list
                             # then use it and retry listing tasks; otherwise show an error.
                             try:
-                                lists = self.google_tasks_service.list_tasklists()
+                                lists = self._list_tasklists(refresh=True)
                             except Exception:
                                 self._display_error("Google Tasks", str(exc))
                                 lists = []
@@ -1369,27 +1498,10 @@ class MunazzimApp(App):
                             if new_id != list_id:
                                 self.selected_google_tasklist = new_id
                                 self.config.planner.google_task_list = new_id
-                                self.config_manager.save(self.config)
+                                self._mark_config_dirty()
                                 try:
                                     g_tasks = self.google_tasks_service.list_tasks(new_id)
-                                    g_todos = [
-                                        TodoDisplay(
-                                            task=t.title,
-                                            event=list_title,
-                                            note=t.notes,
-                                            due=t.due,
-                                            task_id=t.id,
-                                            assignment_id=None,
-                                            total=None,
-                                            ordinal=None,
-                                            checked=(t.status == "completed"),
-                                            toggleable=True,
-                                            last_completed=None,
-                                            provider="google",
-                                        )
-                                        for t in g_tasks
-                                    ]
-                                    todos = g_todos
+                                    todos = self._tasks_to_todos(g_tasks, list_title, None)
                                 except Exception as exc2:
                                     self._display_error("Google Tasks", str(exc2))
                         else:
@@ -1403,6 +1515,8 @@ class MunazzimApp(App):
             self.status_line.show(self._make_status_context())
             # Send todos to the week planner's Todo box rather than replacing the plan
             self.week_panel.set_todos(todos)
+            # Warm the task cache for the other events the user is likely to visit
+            self._schedule_event_tasks_prefetch(plan)
             if overrides_found and self.status_line:
                 try:
                     self.status_line.update(f"Prayer overrides applied: {', '.join(overrides_found)}")
@@ -1433,11 +1547,18 @@ class MunazzimApp(App):
         self.refresh_plan(target_date=self.current_date)
 
     def action_refresh(self) -> None:
+        self._flush_config()
         self.config = self.config_manager.load()
+        self._tz_resolved = False
+        self._resolve_tz()
+        self._todo_view_cache.clear()
+        self._week_occurrence_cache = None
+        self._invalidate_cal_cache()
+        self._editor_cmd = None
         self._config_errors = self.config_manager.errors()
         self._config_errors_shown = False
         self.week_assignments = dict(self.config.planner.week_templates)
-        self.templates.reload()
+        self._reload_templates()
         self.task_engine.refresh()
         self.prayer_service = PrayerService(self.config, config_manager=self.config_manager)
         self.active_template_name = self._resolve_template_name(self.current_date, self.templates.template_names())
@@ -1574,28 +1695,16 @@ class MunazzimApp(App):
             try:
                 if self.google_tasks_service and getattr(self, "plan_table", None) and getattr(self.plan_table, "cursor_row", None) is not None:
                     # Fetch the scheduled event under the cursor to infer the name
-                    try:
-                        scheduled = list(getattr(self.plan_table, "_row_metadata", []))[self.plan_table.cursor_row]
-                    except Exception:
-                        scheduled = None
-                    event_name = None
-                    try:
-                        if scheduled and hasattr(scheduled, "event"):
-                            event_name = scheduled.event.name if hasattr(scheduled.event, "name") else None
-                    except Exception:
-                        event_name = None
+                    scheduled = self._scheduled_at_row(self.plan_table.cursor_row)
+                    event_name = _scheduled_event_name(scheduled)
                     # If we have an event name, look for a matching task list
                     if event_name:
                         try:
-                            lists = self.google_tasks_service.list_tasklists()
-                            match = next((l for l in lists if l.title == event_name), None)
+                            match = self._tasklist_by_title(event_name)
                             if match:
                                 self.selected_google_tasklist = match.id
                                 self.config.planner.google_task_list = match.id
-                                try:
-                                    self.config_manager.save(self.config)
-                                except Exception:
-                                    pass
+                                self._mark_config_dirty()
                                 # Lock the selection to avoid the next refresh changing it
                                 self._selected_list_locked = match.id
                         except Exception:
@@ -1607,14 +1716,11 @@ class MunazzimApp(App):
             # If there's no selected list yet, default to the first list (non-destructive)
             try:
                 if not self.selected_google_tasklist and self.google_tasks_service:
-                    lists = self.google_tasks_service.list_tasklists()
+                    lists = self._list_tasklists()
                     if lists:
                         self.selected_google_tasklist = lists[0].id
                         self.config.planner.google_task_list = lists[0].id
-                        try:
-                            self.config_manager.save(self.config)
-                        except Exception:
-                            pass
+                        self._mark_config_dirty()
             except Exception:
                 pass
             self._todo_view_active = True
@@ -1634,28 +1740,15 @@ class MunazzimApp(App):
         configured list and refresh the whole plan as needed.
         """
         try:
-            if not self.plan_table:
-                return
-            if cursor_row is None:
+            if not self.plan_table or cursor_row is None:
                 return
-            # Defensive: keep our stored plan list in sync
-            try:
-                scheduled = list(getattr(self.plan_table, "_row_metadata", []))[cursor_row]
-            except Exception:
-                scheduled = None
+            scheduled = self._scheduled_at_row(cursor_row)
             if not scheduled:
                 # No scheduled event under cursor: refresh the plan so todo
                 # box reflects any changes
                 self.refresh_plan()
                 return
-            # Extract event name if present
-            event_name = None
-            try:
-                if hasattr(scheduled, "event"):
-                    event_name = scheduled.event.name if hasattr(scheduled.event, "name") else None
-            except Exception:
-                event_name = None
-            # If we have a matching Google Tasks list for this event, select it
+            event_name = _scheduled_event_name(scheduled)
             # If user moved recently, avoid doing heavy refreshes here.
             import time
             recently_navigated = (
@@ -1667,86 +1760,10 @@ class MunazzimApp(App):
                 if cached is not None:
                     self.week_panel.set_todos(cached)
                     return
-
-            if event_name and self.google_tasks_service and not getattr(self, "_selected_list_locked", None):
-                try:
-                    lists = self._get_cached_tasklists() or self.google_tasks_service.list_tasklists()
-                    match = next((l for l in lists if l.title == event_name), None)
-                    if match:
-                        self.selected_google_tasklist = match.id
-                        self.config.planner.google_task_list = match.id
-                        try:
-                            self.config_manager.save(self.config)
-                        except Exception:
-                            pass
-                        # Fetch tasks for this list and show them in the todo box
-                        try:
-                            # Use cached tasks where possible, don't block UI.
-                            g_tasks = self._get_cached_tasks(match.id)
-                            if g_tasks is None:
-                                # schedule refresh; allow sync in headless contexts
-                                self._schedule_tasklist_refresh(match.id, None, allow_sync=True)
-                                return
-                            if not g_tasks:
-                                self.week_panel.set_todos([])
-                                return
-                            # otherwise we have immediate results
-                            # Build a map of event name -> scheduled start time
-                            event_start_map: dict[str, datetime] = {}
-                            for s in getattr(self.plan_table, "_row_metadata", []) or []:
-                                try:
-                                    key = s.event.name if hasattr(s, "event") and hasattr(s.event, "name") else None
-                                except Exception:
-                                    key = None
-                                if key and key not in event_start_map:
-                                    event_start_map[key] = s.start
-                            g_todos: list[TodoDisplay] = []
-                            from zoneinfo import ZoneInfo
-                            from datetime import timezone as _tz, datetime as _dt
-
-                            for t in g_tasks:
-                                due_val = t.due
-                                if event_name in event_start_map:
-                                    tzname = self.config.location.timezone if getattr(self.config, 'location', None) and getattr(self.config.location, 'timezone', None) else None
-                                    try:
-                                        tz = ZoneInfo(tzname) if tzname else _dt.now().astimezone().tzinfo
-                                    except Exception:
-                                        tz = _dt.now().astimezone().tzinfo
-                                    start_dt = event_start_map[event_name]
-                                    if start_dt.tzinfo is None:
-                                        start_aware = start_dt.replace(tzinfo=tz)
-                                    else:
-                                        start_aware = start_dt
-                                    due_val = start_aware.astimezone(_tz.utc).isoformat().replace("+00:00", "Z")
-                                g_todos.append(
-                                    TodoDisplay(
-                                        task=t.title,
-                                        event=event_name,
-                                        note=t.notes,
-                                        due=due_val,
-                                        task_id=t.id,
-                                        assignment_id=None,
-                                        total=None,
-                                        ordinal=None,
-                                        checked=(t.status == "completed"),
-                                        toggleable=True,
-                                        last_completed=None,
-                                        provider="google",
-                                    )
-                                )
-                            self.week_panel.set_todos(g_todos)
-                            return
-                        except Exception:
-                            # If any network error occurs, fall through to a full
-                            # refresh so the user sees the best-effort view.
-                            pass
-                    else:
-                        # No matching list for this event: show empty view.
-                        self.week_panel.set_todos([])
-                        return
-                except Exception:
-                    # Ignore API errors and fallback to refresh
-                    pass
+            # If we have a matching Google Tasks list for this event, select it
+            if event_name and self.google_tasks_service and not self._selected_list_locked:
+                if self._show_event_tasks(event_name):
+                    return
             # Default behavior: refresh the plan (which will update the todo box)
             if recently_navigated:
                 return
@@ -1755,6 +1772,38 @@ class MunazzimApp(App):
             # Never raise from cursor movement
             return
 
+    def _show_event_tasks(self, event_name: str) -> bool:
+        """Select the task list named after ``event_name`` and show its tasks.
+
+        Returns False when the lookup failed (API error) so the caller can
+        fall back to a full refresh.
+        """
+        try:
+            match = self._tasklist_by_title(event_name)
+        except Exception:
+            # Ignore API errors and fallback to refresh
+            return False
+        if not match:
+            # No matching list for this event: show empty view.
+            self.week_panel.set_todos([])
+            return True
+        self.selected_google_tasklist = match.id
+        self.config.planner.google_task_list = match.id
+        self._mark_config_dirty()
+        # Use cached tasks where possible, don't block UI.
+        g_tasks = self._get_cached_tasks(match.id)
+        if g_tasks is None:
+            # schedule refresh; allow sync in headless contexts
+            self._schedule_tasklist_refresh(
+                match.id,
+                self._plan_event_start_map(),
+                event_name=event_name,
+                allow_sync=True,
+            )
+        else:
+            self.week_panel.set_todos(self._todo_view(match.id, g_tasks, event_name, self._plan_event_start_map()))
+        return True
+
     def action_edit_plan(self) -> None:
         if not self.active_template_name:
             return
@@ -1775,7 +1824,7 @@ class MunazzimApp(App):
         launched = self._launch_editor(directory, target)
         if not launched:
             return
-        self.templates.reload()
+        self._reload_templates()
         self.task_engine.refresh()
         self.active_template_name = self._resolve_template_name(self.current_date, self.templates.template_names())
         self.refresh_plan()
@@ -1795,14 +1844,11 @@ class MunazzimApp(App):
         except Exception:
             self.bell()
             return
-        try:
-            scheduled = list(getattr(self.plan_table, "_row_metadata", []))[row_index]
-        except Exception:
-            scheduled = None
+        scheduled = self._scheduled_at_row(row_index)
         if not scheduled:
             self.bell()
             return
-        event_name = scheduled.event.name if hasattr(scheduled, "event") else None
+        event_name = _scheduled_event_name(scheduled)
         if not event_name:
             self.bell()
             return
@@ -1812,36 +1858,68 @@ class MunazzimApp(App):
             self._display_error("Google Tasks", "Google Tasks service not configured or missing dependencies")
             return
         try:
-            lists = self.google_tasks_service.list_tasklists()
-        except Exception as exc:
-            self._display_error("Google Tasks", str(exc))
-            return
-        # Find an existing list matching the event name or create one
-        list_id = None
-        for l in lists:
-            if l.title == event_name:
-                list_id = l.id
-                break
-        if not list_id:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No running loop (tests or non-async contexts): run inline
             try:
-                created = self.google_tasks_service.create_tasklist(event_name)
-                list_id = created.id
+                list_id = self._ensure_event_tasklist(event_name)
             except Exception as exc:
                 self._display_error("Google Tasks", str(exc))
                 return
-        self.selected_google_tasklist = list_id
-        self.config.planner.google_task_list = list_id
+            self._select_event_tasklist(list_id)
+            # Ensure the list contains items from the template-derived definitions
+            # and use the synchronous helper to attach due times based on the
+            # scheduled start if present.
+            try:
+                warning = self._sync_event_tasks_to_google(event_name, scheduled.start)
+            except Exception as exc:
+                self._display_error("Google Tasks", str(exc))
+            else:
+                self._notify_tasks_sync_warning(warning)
+            self._show_event_tasklist(list_id)
+            return
         try:
-            self.config_manager.save(self.config)
+            self.status_line.update("Syncing tasks…")
         except Exception:
             pass
-        # Ensure the list contains items from the template-derived definitions
-        # and use the synchronous helper to attach due times based on the
-        # scheduled start if present.
+        loop.create_task(self._open_event_tasks_background(event_name, scheduled.start))
+
+    async def _open_event_tasks_background(self, event_name: str, scheduled_start: datetime) -> None:
+        """Run the Google Tasks calls of action_open_event_tasks off the UI thread."""
+        try:
+            list_id = await asyncio.to_thread(self._ensure_event_tasklist, event_name)
+        except Exception as exc:
+            self._display_error("Google Tasks", str(exc))
+            return
+        self._select_event_tasklist(list_id)
         try:
-            self._sync_event_tasks_to_google(event_name, scheduled.start)
+            warning = await asyncio.to_thread(self._sync_event_tasks_to_google, event_name, scheduled_start)
         except Exception as exc:
             self._display_error("Google Tasks", str(exc))
+        else:
+            # Back on the loop thread, so the modal can be pushed safely
+            self._notify_tasks_sync_warning(warning)
+        self._show_event_tasklist(list_id)
+
+    def _ensure_event_tasklist(self, event_name: str) -> str:
+        """Return the id of the task list named after the event, creating it if needed.
+
+        Blocking (network); API errors propagate to the caller.
+        """
+        match = self._tasklist_by_title(event_name)
+        if match:
+            return match.id
+        created = self.google_tasks_service.create_tasklist(event_name)
+        self._google_tasklists_cache = None
+        self._tasklist_titles[created.id] = event_name
+        return created.id
+
+    def _select_event_tasklist(self, list_id: str) -> None:
+        self.selected_google_tasklist = list_id
+        self.config.planner.google_task_list = list_id
+        self._mark_config_dirty()
+
+    def _show_event_tasklist(self, list_id: str) -> None:
         # Focus todo view for this list and refresh
         self._selected_list_locked = list_id
         self._show_task_view()
@@ -1856,7 +1934,7 @@ class MunazzimApp(App):
         launched = self._launch_editor(directory)
         if not launched:
             return
-        self.templates.reload()
+        self._reload_templates()
         self.task_engine.refresh()
         self.active_template_name = self._resolve_template_name(self.current_date, self.templates.template_names())
         self.refresh_plan()
@@ -1882,18 +1960,20 @@ class MunazzimApp(App):
     def _highlight_current_event(self, plan: DayPlan) -> None:
         if not self.plan_table or not plan.items:
             return
-        now = datetime.combine(plan.generated_for, datetime.now().time())
-        target_index = 0
-        for idx, scheduled in enumerate(plan.items):
-            if scheduled.start <= now < scheduled.end:
-                target_index = idx
-                break
         # If the user has recently navigated the plan, avoid resetting their
         # cursor to the currently active event. Only auto-highight if the
         # last user navigation was long enough ago.
         import time
         if self._last_user_navigation is not None and time.time() - self._last_user_navigation < self._auto_highlight_suppress_secs:
             return
+        # Plan items are not ordered by start time (fixed events and prayer
+        # anchors can move the cursor backwards), so scan them in row order.
+        now = datetime.combine(plan.generated_for, datetime.now().time())
+        target_index = 0
+        for idx, scheduled in enumerate(plan.items):
+            if scheduled.start <= now < scheduled.end:
+                target_index = idx
+                break
         self.plan_table.jump_to_row(target_index)
 
     def on_user_navigated(self) -> None:
@@ -1907,151 +1987,297 @@ class MunazzimApp(App):
         except Exception:
             self._last_user_navigation = None
 
-    def _get_cached_tasks(self, list_id: str):
-        import time
-
+    def _get_cached_tasks(self, list_id: str, *, allow_stale: bool = False):
         entry = self._google_tasks_cache.get(list_id)
         if not entry:
             return None
         ts, items = entry
-        if time.time() - ts > self._google_tasks_cache_ttl:
+        if not allow_stale and self._is_stale(list_id):
             return None
+        self._google_tasks_cache.move_to_end(list_id)
         return items
 
-    def _get_cached_tasklists(self):
+    def _is_stale(self, list_id: str) -> bool:
         import time
 
-        if not getattr(self, "_google_tasklists_cache", None):
-            return None
-        ts, items = self._google_tasklists_cache
-        if time.time() - ts > self._google_tasks_cache_ttl:
+        entry = self._google_tasks_cache.get(list_id)
+        if not entry:
+            return True
+        return time.time() - entry[0] > self._google_tasks_cache_ttl
+
+    def _fresh_tasklists_entry(self) -> tuple[float, list, dict[str, object]] | None:
+        import time
+
+        # Read the cache once: worker threads may reset it between reads
+        entry = self._google_tasklists_cache
+        if entry is None or time.time() - entry[0] > self._google_tasks_cache_ttl:
             return None
-        return items
+        return entry
+
+    def _set_cached_tasklists(self, lists: list) -> tuple[float, list, dict[str, object]]:
+        import time
+
+        by_title: dict[str, object] = {}
+        for l in lists:
+            # Keep the first list for a title, matching the previous scan order
+            by_title.setdefault(getattr(l, "title", None), l)
+            self._tasklist_titles[l.id] = l.title
+        entry = (time.time(), lists, by_title)
+        self._google_tasklists_cache = entry
+        return entry
+
+    def _tasklist_by_title(self, name: str):
+        """Return the Google Tasks list titled ``name`` (or None).
+
+        Lists are fetched once per TTL window and indexed by title, so this
+        is a dict lookup on the navigation path. API errors propagate.
+        """
+        return self._tasklists_entry()[2].get(name)
+
+    def _list_tasklists(self, *, refresh: bool = False) -> list:
+        """Return the Google Tasks lists, fetching at most once per TTL window.
+
+        A copy is returned so callers can't alter the cached list. API errors
+        propagate.
+        """
+        return list(self._tasklists_entry(refresh=refresh)[1])
+
+    def _tasklists_entry(self, *, refresh: bool = False) -> tuple[float, list, dict[str, object]]:
+        """Return the ``(timestamp, lists, by_title)`` cache entry, fetching if stale.
+
+        Concurrent misses (e.g. from worker threads) wait on one fetch rather
+        than each calling the API.
+        """
+        if not refresh:
+            entry = self._fresh_tasklists_entry()
+            if entry is not None:
+                return entry
+        with self._tasklists_lock:
+            entry = None if refresh else self._fresh_tasklists_entry()
+            if entry is None:
+                entry = self._set_cached_tasklists(self.google_tasks_service.list_tasklists())
+        return entry
 
     def _get_cached_tasks_for_event(self, event_name: str) -> list[TodoDisplay] | None:
         """Return a cached TodoDisplay list for a Google Tasks list matching event_name."""
         # Find the matching list id from cached list titles
-        lists = self._get_cached_tasklists()
-        if not lists:
-            try:
-                lists = self.google_tasks_service.list_tasklists() if self.google_tasks_service else []
-                import time as _time
-                self._google_tasklists_cache = (_time.time(), lists)
-            except Exception:
-                lists = []
-        match = next((l for l in lists if getattr(l, "title", None) == event_name), None)
+        if not self.google_tasks_service:
+            return None
+        try:
+            match = self._tasklist_by_title(event_name)
+        except Exception:
+            match = None
         if not match:
             return None
-        tasks = self._get_cached_tasks(match.id)
+        tasks = self._get_cached_tasks(match.id, allow_stale=True)
         if tasks is None:
             return None
-        # Convert to TodoDisplay objects similar to _schedule_tasklist_refresh
-        from zoneinfo import ZoneInfo
-        from datetime import timezone as _tz, datetime as _dt
-        g_todos = []
-        try:
-            tzname = self.config.location.timezone if getattr(self.config, 'location', None) and getattr(self.config.location, 'timezone', None) else None
+        event_start_map = self._plan_event_start_map()
+        if self._is_stale(match.id):
+            # Serve the stale rows now and revalidate in the background
             try:
-                tz = ZoneInfo(tzname) if tzname else _dt.now().astimezone().tzinfo
+                self._schedule_tasklist_refresh(match.id, event_start_map, event_name=event_name, allow_sync=False)
             except Exception:
-                tz = _dt.now().astimezone().tzinfo
-            for t in tasks:
-                due_val = getattr(t, "due", None)
-                g_todos.append(
-                    TodoDisplay(
-                        task=t.title,
-                        event=event_name,
-                        note=getattr(t, "notes", None),
-                        due=due_val,
-                        task_id=getattr(t, "id", None),
-                        assignment_id=None,
-                        total=None,
-                        ordinal=None,
-                        checked=(getattr(t, "status", None) == "completed"),
-                        toggleable=True,
-                        last_completed=None,
-                        provider="google",
-                    )
-                )
-            return g_todos
+                pass
+        try:
+            return self._todo_view(match.id, tasks, event_name, event_start_map)
         except Exception:
             return None
 
+    def _plan_event_start_map(self) -> dict[str, datetime]:
+        """Map each event name in the displayed plan to its first start time."""
+        event_start_map: dict[str, datetime] = {}
+        for s in getattr(self.plan_table, "_row_metadata", None) or []:
+            key = _scheduled_event_name(s)
+            if key and key not in event_start_map:
+                event_start_map[key] = s.start
+        return event_start_map
+
+    def _resolve_tz(self):
+        """Return the configured timezone, falling back to the system zone.
+
+        The configured zone is resolved once and reused until its name
+        changes (config reloads or edits), so hot loops don't rebuild it.
+        The system zone is looked up per call so a DST change while the app
+        runs is picked up.
+        """
+        tzname = getattr(getattr(self.config, "location", None), "timezone", None) or None
+        if not self._tz_resolved or tzname != self._tz_name:
+            self._tz_name = tzname
+            self._tz_resolved = True
+            try:
+                self._tz = ZoneInfo(tzname) if tzname else None
+            except Exception:
+                self._tz = None
+        if self._tz is None:
+            return datetime.now().astimezone().tzinfo
+        return self._tz
+
+    def _format_rfc3339(self, dt: datetime) -> str:
+        """Return ``dt`` as an RFC3339 UTC string ('2025-12-31T10:00:00Z').
+
+        Naive datetimes are taken to be in the configured timezone.
+        """
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=self._resolve_tz())
+        return dt.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
+
+    def _tasks_to_todos(
+        self,
+        tasks: list,
+        event_name: str | None,
+        event_start_map: dict[str, datetime] | None,
+    ) -> list[TodoDisplay]:
+        """Build TodoDisplay rows for Google tasks in a single pass.
+
+        When ``event_name`` has a start time in ``event_start_map`` that start
+        (as an RFC3339 UTC string) is used as the due value, since the Tasks
+        API drops the time component. Without an event name each task's own
+        title is used for the Event column.
+        """
+        event_due: str | None = None
+        if event_name and event_start_map and event_name in event_start_map:
+            event_due = self._format_rfc3339(event_start_map[event_name])
+        return [
+            TodoDisplay(
+                task=t.title,
+                event=event_name or t.title,
+                note=t.notes,
+                due=event_due or t.due,
+                task_id=t.id,
+                assignment_id=None,
+                total=None,
+                ordinal=None,
+                checked=(t.status == "completed"),
+                toggleable=True,
+                last_completed=None,
+                provider="google",
+            )
+            for t in tasks
+        ]
+
+    def _schedule_event_tasks_prefetch(self, plan: DayPlan) -> None:
+        if not self.google_tasks_service:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Headless/test contexts fetch lazily on cursor movement instead
+            return
+        loop.create_task(self._prefetch_event_tasks(plan))
+
+    async def _prefetch_event_tasks(self, plan: DayPlan) -> None:
+        """Fetch tasks for every plan event with a matching list in one batch.
+
+        Lists that are already cached (and fresh) or being refreshed are
+        skipped. Services without ``batch_list_tasks`` are queried per list.
+        """
+        service = self.google_tasks_service
+        if not service:
+            return
+        try:
+            entry = self._fresh_tasklists_entry()
+            if entry is None:
+                entry = self._set_cached_tasklists(await asyncio.to_thread(service.list_tasklists))
+        except Exception:
+            return
+        by_title = entry[2]
+        list_ids: list[str] = []
+        for scheduled in plan.items:
+            match = by_title.get(getattr(scheduled.event, "name", None))
+            if match is None or match.id in list_ids or match.id in self._inflight_refresh:
+                continue
+            if self._get_cached_tasks(match.id) is None:
+                list_ids.append(match.id)
+        if not list_ids:
+            return
+        self._inflight_refresh.update(list_ids)
+        try:
+            batch_list_tasks = getattr(service, "batch_list_tasks", None)
+            results: dict[str, list] = {}
+            if batch_list_tasks is not None:
+                try:
+                    results = await asyncio.to_thread(batch_list_tasks, list_ids)
+                except Exception:
+                    results = {}
+            for list_id in list_ids:
+                if list_id not in results:
+                    try:
+                        results[list_id] = await asyncio.to_thread(service.list_tasks, list_id)
+                    except Exception:
+                        continue
+            for list_id, tasks in results.items():
+                self._set_cached_tasks(list_id, tasks)
+        finally:
+            self._inflight_refresh.difference_update(list_ids)
+
     def _set_cached_tasks(self, list_id: str, items: list) -> None:
         import time
 
         self._google_tasks_cache[list_id] = (time.time(), items)
+        self._google_tasks_cache.move_to_end(list_id)
+        view = self._todo_view_cache.get(list_id)
+        if view is not None and view[0] != _tasks_fingerprint(items):
+            del self._todo_view_cache[list_id]
+        while len(self._google_tasks_cache) > self._google_tasks_cache_max:
+            evicted, _ = self._google_tasks_cache.popitem(last=False)
+            self._todo_view_cache.pop(evicted, None)
 
     def _invalidate_tasklist_cache(self, list_id: str | None = None) -> None:
         if list_id is None:
             self._google_tasks_cache.clear()
+            self._todo_view_cache.clear()
+            self._google_tasklists_cache = None
             return
         self._google_tasks_cache.pop(list_id, None)
+        self._todo_view_cache.pop(list_id, None)
+
+    def _todo_view(
+        self,
+        list_id: str,
+        tasks: list,
+        event_name: str | None,
+        event_start_map: dict[str, datetime] | None,
+    ) -> list[TodoDisplay]:
+        """Return TodoDisplay rows for the cached tasks of ``list_id``.
+
+        The rows are rebuilt only when the tasks change (see
+        ``_set_cached_tasks``) or are shown for a different event start.
+        """
+        start = event_start_map.get(event_name) if event_name and event_start_map else None
+        key = (event_name, start)
+        entry = self._todo_view_cache.get(list_id)
+        if entry is not None and entry[1] == key:
+            return entry[2]
+        fingerprint = entry[0] if entry is not None else _tasks_fingerprint(tasks)
+        todos = self._tasks_to_todos(tasks, event_name, event_start_map)
+        self._todo_view_cache[list_id] = (fingerprint, key, todos)
+        return todos
 
     def _schedule_tasklist_refresh(
         self,
         list_id: str,
         event_start_map: dict[str, datetime] | None = None,
         *,
+        event_name: str | None = None,
         allow_sync: bool = True,
     ) -> None:
+        if event_name is None and event_start_map:
+            event_name = next(iter(event_start_map), None)
         try:
             loop = asyncio.get_running_loop()
         except RuntimeError:
+            # No running loop; only refresh inline when blocking is allowed.
             if not allow_sync:
-                # No running loop; avoid blocking synchronous refresh.
                 return
-            # No running loop - refresh synchronously
             try:
                 tasks = self.google_tasks_service.list_tasks(list_id)
             except Exception:
                 return
-            self._set_cached_tasks(list_id, tasks)
-            # Build TodoDisplay list
-            g_todos = []
-            try:
-                from zoneinfo import ZoneInfo
-                from datetime import timezone as _tz, datetime as _dt
+            self._apply_refreshed_tasks(list_id, tasks, event_name, event_start_map)
+            return
 
-                event_start_map = event_start_map or {}
-                tzname = self.config.location.timezone if getattr(self.config, 'location', None) and getattr(self.config.location, 'timezone', None) else None
-                try:
-                    tz = ZoneInfo(tzname) if tzname else _dt.now().astimezone().tzinfo
-                except Exception:
-                    tz = _dt.now().astimezone().tzinfo
-                for t in tasks:
-                    due_val = t.due
-                    # If the list maps to an event name and we have a start time, infer the due
-                    if t and event_start_map:
-                        # Use the first matching event if available
-                        title = t.title
-                        if title in event_start_map:
-                            start_dt = event_start_map[title]
-                            if start_dt.tzinfo is None:
-                                start_aware = start_dt.replace(tzinfo=tz)
-                            else:
-                                start_aware = start_dt
-                            due_val = start_aware.astimezone(_tz.utc).isoformat().replace("+00:00", "Z")
-                    g_todos.append(
-                        TodoDisplay(
-                            task=t.title,
-                            event=(t.title if not event_start_map else next(iter(event_start_map.keys()))),
-                            note=t.notes,
-                            due=due_val,
-                            task_id=t.id,
-                            assignment_id=None,
-                            total=None,
-                            ordinal=None,
-                            checked=(t.status == "completed"),
-                            toggleable=True,
-                            last_completed=None,
-                            provider="google",
-                        )
-                    )
-                # Update the UI when we have a new result
-                self.week_panel.set_todos(g_todos)
-            except Exception:
-                return
+        if list_id in self._inflight_refresh:
             return
 
         async def _refresh():
@@ -2059,58 +2285,37 @@ class MunazzimApp(App):
                 tasks = await asyncio.to_thread(self.google_tasks_service.list_tasks, list_id)
             except Exception:
                 return
-            self._set_cached_tasks(list_id, tasks)
-            # Build TodoDisplay list
-            g_todos = []
-            try:
-                from zoneinfo import ZoneInfo
-                from datetime import timezone as _tz, datetime as _dt
-
-                event_start_map = event_start_map or {}
-                tzname = self.config.location.timezone if getattr(self.config, 'location', None) and getattr(self.config.location, 'timezone', None) else None
-                try:
-                    tz = ZoneInfo(tzname) if tzname else _dt.now().astimezone().tzinfo
-                except Exception:
-                    tz = _dt.now().astimezone().tzinfo
-                for t in tasks:
-                    due_val = t.due
-                    if t and event_start_map:
-                        title = t.title
-                        if title in event_start_map:
-                            start_dt = event_start_map[title]
-                            if start_dt.tzinfo is None:
-                                start_aware = start_dt.replace(tzinfo=tz)
-                            else:
-                                start_aware = start_dt
-                            due_val = start_aware.astimezone(_tz.utc).isoformat().replace("+00:00", "Z")
-                    g_todos.append(
-                        TodoDisplay(
-                            task=t.title,
-                            event=(t.title if not event_start_map else next(iter(event_start_map.keys()))),
-                            note=t.notes,
-                            due=due_val,
-                            task_id=t.id,
-                            assignment_id=None,
-                            total=None,
-                            ordinal=None,
-                            checked=(t.status == "completed"),
-                            toggleable=True,
-                            last_completed=None,
-                            provider="google",
-                        )
-                    )
-                # Update the UI - we are in the loop so it's safe
-                try:
-                    self.week_panel.set_todos(g_todos)
-                except Exception:
-                    pass
-            except Exception:
-                return
+            finally:
+                self._inflight_refresh.discard(list_id)
+            self._apply_refreshed_tasks(list_id, tasks, event_name, event_start_map)
 
+        self._inflight_refresh.add(list_id)
         loop.create_task(_refresh())
 
+    def _apply_refreshed_tasks(
+        self,
+        list_id: str,
+        tasks: list,
+        event_name: str | None,
+        event_start_map: dict[str, datetime] | None,
+    ) -> None:
+        """Cache freshly fetched tasks for ``list_id`` and show them."""
+        self._set_cached_tasks(list_id, tasks)
+        try:
+            self.week_panel.set_todos(self._todo_view(list_id, tasks, event_name, event_start_map))
+        except Exception:
+            pass
+
     # helpers
 
+    def _scheduled_at_row(self, row: int):
+        """Return the scheduled event for a plan row without copying the metadata."""
+        try:
+            meta = getattr(self.plan_table, "_row_metadata", None)
+            return meta[row] if meta is not None and 0 <= row < len(meta) else None
+        except (IndexError, TypeError):
+            return None
+
     def _show_plan_view(self) -> None:
         # Ensure the plan panel is the active/focused view
         self._todo_view_active = False
@@ -2138,7 +2343,8 @@ class MunazzimApp(App):
         self.plan_header.update(prefix)
 
     def _weekday_key(self, day: date) -> str:
-        return day.strftime("%A").lower()
+        # Index instead of strftime("%A"): cheaper and not locale-dependent
+        return WEEKDAY_ORDER[day.weekday()]
 
     def _resolve_template_name(self, day: date, available: list[str]) -> str:
         if not available:
@@ -2159,7 +2365,7 @@ class MunazzimApp(App):
             day_key = self._weekday_key(self.current_date)
             self.week_assignments[day_key] = name
             self.config.planner.week_templates = dict(self.week_assignments)
-            self.config_manager.save(self.config)
+            self._mark_config_dirty()
         self.refresh_plan()
 
     def _cycle_template(self, delta: int) -> None:
@@ -2177,24 +2383,84 @@ class MunazzimApp(App):
         self.week_assignments = dict(assignments)
         if persist:
             self.config.planner.week_templates = dict(assignments)
-            self.config_manager.save(self.config)
+            self._mark_config_dirty()
             self.active_template_name = self._resolve_template_name(
                 self.current_date,
                 self.templates.template_names(),
             )
             self.refresh_plan()
 
+    def _schedule_refresh(self, delay: float = 0.05, *, reload_templates: bool = False) -> None:
+        """Refresh the plan once after ``delay`` seconds.
+
+        Repeated calls within the window collapse into a single refresh so
+        rapid toggling re-renders once. ``reload_templates`` also reloads the
+        templates and task engine first; it sticks until the refresh runs.
+        Without a running loop (tests or headless use) the refresh runs
+        immediately.
+        """
+        if reload_templates:
+            self._pending_template_reload = True
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._run_pending_refresh()
+            return
+        if self._pending_refresh is not None:
+            self._pending_refresh.cancel()
+        self._pending_refresh = loop.call_later(delay, self._run_pending_refresh)
+
+    def _run_pending_refresh(self) -> None:
+        self._pending_refresh = None
+        if self._pending_template_reload:
+            self._pending_template_reload = False
+            self._reload_templates()
+            self.task_engine.refresh()
+        self.refresh_plan()
+
+    def _mark_config_dirty(self, delay: float = 1.0) -> None:
+        """Record a config change and save it after ``delay`` seconds.
+
+        Changes made within the window share one write. Without a running
+        loop the config is saved immediately.
+        """
+        self._config_dirty = True
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._flush_config()
+            return
+        if self._pending_config_flush is None:
+            self._pending_config_flush = loop.call_later(delay, self._flush_config)
+
+    def _flush_config(self) -> None:
+        if self._pending_config_flush is not None:
+            self._pending_config_flush.cancel()
+            self._pending_config_flush = None
+        if not self._config_dirty:
+            return
+        self._config_dirty = False
+        try:
+            self.config_manager.save(self.config)
+        except OSError as exc:
+            # Keep the change pending so the next flush retries the write
+            self._config_dirty = True
+            try:
+                self.status_line.update(f"[red]Config save failed: {exc}[/red]")
+            except Exception:
+                pass
+
     def _on_task_logged(self, task_id: str) -> None:
         self.task_engine.complete_task(task_id)
-        self.refresh_plan()
+        self._schedule_refresh()
 
     def _on_task_unlogged(self, task_id: str) -> None:
         self.task_engine.unlog_task(task_id)
-        self.refresh_plan()
+        self._schedule_refresh()
 
     def _on_assignment_toggled(self, assignment_id: str, completed: bool) -> None:
         self.task_engine.toggle_assignment(assignment_id, completed)
-        self.refresh_plan()
+        self._schedule_refresh()
 
     # Google Tasks integration -------------------------------------------------
     def action_select_task_list(self) -> None:
@@ -2203,7 +2469,7 @@ class MunazzimApp(App):
             self.bell()
             return
         try:
-            lists = self.google_tasks_service.list_tasklists()
+            lists = self._list_tasklists(refresh=True)
         except Exception as exc:  # pragma: no cover - interactive failures
             self._display_error("Google Tasks", str(exc))
             return
@@ -2220,7 +2486,7 @@ class MunazzimApp(App):
         self.selected_google_tasklist = selection
         # Persist to config
         self.config.planner.google_task_list = selection
-        self.config_manager.save(self.config)
+        self._mark_config_dirty()
         # Lock the selected list for the next refresh so an immediately
         # triggered refresh won't auto-select another list on network error.
         self._selected_list_locked = selection
@@ -2233,26 +2499,57 @@ class MunazzimApp(App):
         list_id = self.selected_google_tasklist
         if not list_id:
             # If user didn't select a list, default to first available
-            lists = self.google_tasks_service.list_tasklists()
+            lists = self._list_tasklists()
             if not lists:
                 self.bell()
                 return
             list_id = lists[0].id
             self.selected_google_tasklist = list_id
             self.config.planner.google_task_list = list_id
-            self.config_manager.save(self.config)
+            self._mark_config_dirty()
         if not task_id:
             return
         status = "completed" if completed else "needsAction"
+        self._run_google_tasks_call(list_id, self.google_tasks_service.update_task, list_id, task_id, status=status)
+
+    def _run_google_tasks_call(self, list_id: str, call: Callable, *args, **kwargs) -> None:
+        """Run a blocking Google Tasks ``call`` for ``list_id``, then refresh.
+
+        With a running loop the call (and the refetch of the list) happens on
+        a worker thread so the UI stays responsive; otherwise it runs inline.
+        Failures are shown to the user and skip the refresh.
+        """
         try:
-            self.google_tasks_service.update_task(list_id, task_id, status=status)
-        except Exception as exc:
-            self._display_error("Google Tasks", str(exc))
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            try:
+                call(*args, **kwargs)
+            except Exception as exc:
+                self._display_error("Google Tasks", str(exc))
+                return
+            self._invalidate_tasklist_cache(list_id)
+            self.refresh_plan()
             return
-        self.refresh_plan()
 
-    def action_add_task(self) -> None:
-        if not self.google_tasks_service:
+        async def _run() -> None:
+            try:
+                await asyncio.to_thread(call, *args, **kwargs)
+            except Exception as exc:
+                self._display_error("Google Tasks", str(exc))
+                return
+            self._invalidate_tasklist_cache(list_id)
+            try:
+                tasks = await asyncio.to_thread(self.google_tasks_service.list_tasks, list_id)
+            except Exception:
+                pass
+            else:
+                self._set_cached_tasks(list_id, tasks)
+            self.refresh_plan()
+
+        loop.create_task(_run())
+
+    def action_add_task(self) -> None:
+        if not self.google_tasks_service:
             self.bell()
             return
         # Ask the user for a task title (with due date/recurrence) and create it in the selected list
@@ -2269,46 +2566,52 @@ class MunazzimApp(App):
         if not title:
             return
         list_id = self.selected_google_tasklist
+        list_title: str | None = None
         try:
             if not list_id:
-                lists = self.google_tasks_service.list_tasklists()
+                lists = self._list_tasklists()
                 if not lists:
                     self._display_error("Google Tasks", "No task lists available")
                     return
-                list_id = lists[0].id
+                list_id, list_title = lists[0].id, lists[0].title
                 self.selected_google_tasklist = list_id
                 self.config.planner.google_task_list = list_id
-                self.config_manager.save(self.config)
-            due_val = self._resolve_due_for_list(list_id, None)
-            self.google_tasks_service.create_task(list_id, title=title, due=due_val)
-            self._invalidate_tasklist_cache(list_id)
+                self._mark_config_dirty()
         except Exception as exc:
             self._display_error("Google Tasks", str(exc))
             return
-        self.refresh_plan()
+
+        def _create() -> None:
+            due_val = self._resolve_due_for_list(list_id, None, list_title=list_title)
+            self.google_tasks_service.create_task(list_id, title=title, due=due_val)
+
+        self._run_google_tasks_call(list_id, _create)
 
     def _on_new_task(self, data: dict | None) -> None:
         if not data or "title" not in data or not data["title"]:
             return
         list_id = self.selected_google_tasklist
+        list_title: str | None = None
         try:
             if not list_id:
-                lists = self.google_tasks_service.list_tasklists()
+                lists = self._list_tasklists()
                 if not lists:
                     self._display_error("Google Tasks", "No task lists available")
                     return
-                list_id = lists[0].id
+                list_id, list_title = lists[0].id, lists[0].title
                 self.selected_google_tasklist = list_id
                 self.config.planner.google_task_list = list_id
-                self.config_manager.save(self.config)
-            # Compute due from event occurrence for the list (if available)
-            due_val = self._resolve_due_for_list(list_id, None)
-            self.google_tasks_service.create_task(list_id, title=data["title"], due=due_val, notes=data.get("notes"))
-            self._invalidate_tasklist_cache(list_id)
+                self._mark_config_dirty()
         except Exception as exc:
             self._display_error("Google Tasks", str(exc))
             return
-        self.refresh_plan()
+
+        def _create() -> None:
+            # Compute due from event occurrence for the list (if available)
+            due_val = self._resolve_due_for_list(list_id, None, list_title=list_title)
+            self.google_tasks_service.create_task(list_id, title=data["title"], due=due_val, notes=data.get("notes"))
+
+        self._run_google_tasks_call(list_id, _create)
 
     def action_delete_task(self) -> None:
         # Delete the selected google task if present
@@ -2322,17 +2625,11 @@ class MunazzimApp(App):
         if not todo or not todo.provider or todo.provider != "google":
             self.bell()
             return
-        list_id = self.selected_google_tasklist or (self.google_tasks_service.list_tasklists() or [None])[0]
+        list_id = self.selected_google_tasklist or (self._list_tasklists() or [None])[0]
         if not list_id:
             self.bell()
             return
-        try:
-            self.google_tasks_service.delete_task(list_id, todo.task_id or "")
-            self._invalidate_tasklist_cache(list_id)
-        except Exception as exc:
-            self._display_error("Google Tasks", str(exc))
-            return
-        self.refresh_plan()
+        self._run_google_tasks_call(list_id, self.google_tasks_service.delete_task, list_id, todo.task_id or "")
 
     def action_edit_task(self) -> None:
         # Edit a selected Google task's details
@@ -2360,11 +2657,12 @@ class MunazzimApp(App):
     def _on_task_edited(self, task_id: str | None, data: dict | None) -> None:
         if not data or not task_id:
             return
-        list_id = self.selected_google_tasklist or (self.google_tasks_service.list_tasklists() or [None])[0]
+        list_id = self.selected_google_tasklist or (self._list_tasklists() or [None])[0]
         if not list_id:
             self.bell()
             return
-        try:
+
+        def _update() -> None:
             kwargs: dict = {}
             if "title" in data and data["title"]:
                 kwargs["title"] = data["title"]
@@ -2376,164 +2674,99 @@ class MunazzimApp(App):
                 kwargs["notes"] = data["notes"]
             if kwargs:
                 self.google_tasks_service.update_task(list_id, task_id, **kwargs)
-                self._invalidate_tasklist_cache(list_id)
-        except Exception as exc:
-            self._display_error("Google Tasks", str(exc))
-            return
-        self.refresh_plan()
 
-    def _sync_event_tasks_to_google(self, event_name: str, scheduled_start: "datetime.datetime" | None = None) -> None:
+        self._run_google_tasks_call(list_id, _update)
+
+    def _sync_event_tasks_to_google(self, event_name: str, scheduled_start: "datetime.datetime" | None = None) -> str | None:
         """Create or sync a Google Tasks list for the event.
 
         The behavior is simple: ensure a task list exists that matches the
         event name. For each bullet in the event file, ensure a task exists in
         that list — create missing tasks. Do not delete extra tasks.
+
+        May run on a worker thread, so it does not touch the UI; a warning for
+        the user is returned instead.
         """
         if not self.google_tasks_service:
-            return
+            return None
         # parse event file using the task engine helper
         defs = self.task_engine.parse_event_file(event_name)
         if not defs:
-            return
-        # Find an existing list with the same title or create one
-        try:
-            lists = self.google_tasks_service.list_tasklists()
-        except Exception as exc:
-            raise
-        list_id: str | None = None
-        for l in lists:
-            if l.title == event_name:
-                list_id = l.id
-                break
-        if not list_id:
-            # Create one
-            created = self.google_tasks_service.create_tasklist(event_name)
-            list_id = created.id
+            return None
+        # Find an existing list with the same title (via the cached title
+        # index) or create one
+        list_id = self._ensure_event_tasklist(event_name)
         # List current tasks
         remote = self.google_tasks_service.list_tasks(list_id)
         existing_titles = {t.title for t in remote}
+        to_create = [defn for defn in defs if defn.label not in existing_titles]
+        if not to_create:
+            # Every bullet already has a task; no due time to resolve.
+            self._invalidate_tasklist_cache(list_id)
+            return None
         # Determine an appropriate scheduled start to attach to created tasks.
         # If we were given an explicit scheduled_start and it is today, use it.
         # Otherwise search this week's assigned templates for an occurrence
         # of the named event and prefer the nearest future occurrence. If
         # none found, notify the user that the tasks may be hanging/unlinked
         # to the current schedule and proceed without attaching a due time.
-        resolved_start: "datetime.datetime" | None = None
-        try:
-            today = self.current_date
-        except Exception:
-            from datetime import date as _date
-
-            today = _date.today()
-
-        if scheduled_start is not None and getattr(scheduled_start, "date", lambda: None)() == today:
-            resolved_start = scheduled_start
+        resolved_start = self._find_event_occurrence(event_name, scheduled_start)
+        warning = None
+        if resolved_start is None:
+            # No occurrence found this week — likely a hanging todo
+            warning = f"No scheduled occurrence for '{event_name}' found this week; tasks may be unrelated to the ongoing schedule."
+        # Use an RFC3339 timestamp for the due value. If the scheduled time is
+        # naive, attach the configured timezone (or system default) before
+        # converting to UTC. Google Tasks expects an RFC3339-style datetime
+        # string (e.g. '2025-12-31T10:00:00Z').
+        due_val = self._format_rfc3339(resolved_start) if resolved_start is not None else None
+        # Create missing tasks, persisting count info in notes when available
+        specs = [
+            {
+                "title": defn.label,
+                "notes": (
+                    (defn.note or "") + f" (count: {defn.total_occurrences})"
+                    if defn.total_occurrences is not None
+                    else defn.note or None
+                ),
+                "due": due_val,
+            }
+            for defn in to_create
+        ]
+        create_bulk = getattr(self.google_tasks_service, "create_tasks_bulk", None)
+        if create_bulk is not None:
+            create_bulk(list_id, specs)
         else:
-            # Search the week's templates for an event with this name
-            from datetime import datetime as _dt, timedelta as _td
-
-            occurrences: list[_dt] = []
-            now = _dt.now()
-            for day_name in WEEKDAY_ORDER:
-                tpl_name = self.week_assignments.get(day_name)
-                if not tpl_name:
-                    continue
-                try:
-                    tpl = self.templates.get(tpl_name)
-                except Exception:
-                    continue
-                # compute the date for this weekday in the current week
-                try:
-                    target_index = WEEKDAY_ORDER.index(day_name)
-                    # Compute Monday of the current week then offset by target_index
-                    start_of_week = today - _td(days=today.weekday())
-                    target_date = start_of_week + _td(days=target_index)
-                except Exception:
-                    continue
-                try:
-                    prayer_schedule = self.prayer_service.get_schedule(target_date)
-                    plan = self.scheduler.build_plan(tpl, plan_date=target_date, prayer_schedule=prayer_schedule)
-                except Exception:
-                    continue
-                for sched in plan.items:
-                    try:
-                        ev_name = sched.event.name if hasattr(sched.event, "name") else None
-                    except Exception:
-                        ev_name = None
-                    if ev_name == event_name:
-                        occurrences.append(sched.start)
-            if occurrences:
-                # prefer the nearest future occurrence, otherwise closest overall
-                future = [o for o in occurrences if o >= now]
-                if future:
-                    resolved_start = min(future)
-                else:
-                    resolved_start = min(occurrences, key=lambda o: abs((o - now).total_seconds()))
-            else:
-                # Notify user that no occurrence found this week — likely a hanging todo
-                try:
-                    self._display_error(
-                        "Tasks Sync",
-                        f"No scheduled occurrence for '{event_name}' found this week; tasks may be unrelated to the ongoing schedule.",
-                    )
-                except Exception:
-                    # Fallback: update status line if UI not mounted
-                    try:
-                        self.status_line.update(
-                            f"[yellow]No scheduled occurrence for '{event_name}' found this week; tasks may be hanging.[/yellow]"
-                        )
-                    except Exception:
-                        pass
-                resolved_start = None
-        # Create missing tasks
-        for defn in defs:
-            if defn.label in existing_titles:
-                continue
-            notes = defn.note or None
-            # Persist count info in notes when available
-            if defn.total_occurrences is not None:
-                notes = (notes or "") + f" (count: {defn.total_occurrences})"
-            try:
-                due_val: str | None = None
-                if resolved_start is not None:
-                    # Use RFC3339 timestamp. If the scheduled time is naive,
-                    # attach the configured timezone (or system default) before
-                    # converting to UTC. Google Tasks expects an RFC3339-style
-                    # datetime string (e.g. '2025-12-31T10:00:00Z').
-                    from zoneinfo import ZoneInfo
-                    from datetime import timezone as _tz, datetime as _dt
-
-                    tzname = self.config.location.timezone if getattr(self.config, 'location', None) and getattr(self.config.location, 'timezone', None) else None
-                    try:
-                        tz = ZoneInfo(tzname) if tzname else _dt.now().astimezone().tzinfo
-                    except Exception:
-                        tz = _dt.now().astimezone().tzinfo
-
-                    # If naive, attach the configured timezone
-                    if resolved_start.tzinfo is None:
-                        scheduled_aware = resolved_start.replace(tzinfo=tz)
-                    else:
-                        scheduled_aware = resolved_start
-                    # Convert to UTC and use 'Z' suffix
-                    due_val = scheduled_aware.astimezone(_tz.utc).isoformat().replace("+00:00", "Z")
-                self.google_tasks_service.create_task(list_id, title=defn.label, notes=notes, due=due_val)
-            except Exception as exc:
-                # non-fatal: continue but surface error at the end
-                raise
+            for spec in specs:
+                self.google_tasks_service.create_task(list_id, **spec)
         # Invalidate cache after creating missing tasks so next view refresh
         # picks up the new items.
         try:
             self._invalidate_tasklist_cache(list_id)
         except Exception:
             pass
+        return warning
 
-    def _sync_week_to_google_calendar(self) -> int:
+    def _notify_tasks_sync_warning(self, warning: str | None) -> None:
+        if not warning:
+            return
+        try:
+            self._display_error("Tasks Sync", warning)
+        except Exception:
+            # Fallback: update status line if UI not mounted
+            try:
+                self.status_line.update(f"[yellow]{warning}[/yellow]")
+            except Exception:
+                pass
+
+    def _sync_week_to_google_calendar(self, force: bool = False) -> int:
         """Sync scheduled events for the current week to Google Calendar.
 
         This only syncs events for the current week (Monday..Sunday) and
         creates recurring weekly events (no end date) for each scheduled
         occurrence. Existing events created by Munazzim (identified via
-        extendedProperties.private) are not duplicated.
+        extendedProperties.private) are not duplicated. With ``force`` they
+        are all deleted and recreated.
         """
         # If no google_calendar_service is available, skip.
         if not getattr(self, "google_calendar_service", None):
@@ -2547,19 +2780,15 @@ class MunazzimApp(App):
     # Determine calendar to use: config.planner.google_calendar else 'Munazzim'
         cal_name = self.config.planner.google_calendar or "Munazzim"
         # Compute timezone once up front so create_calendar can receive it
-        tzname = self.config.location.timezone if getattr(self.config, 'location', None) and getattr(self.config.location, 'timezone', None) else None
-        from zoneinfo import ZoneInfo
-        try:
-            tz = ZoneInfo(tzname) if tzname else datetime.now().astimezone().tzinfo
-        except Exception:
-            tz = datetime.now().astimezone().tzinfo
-        try:
-            cals = self.google_calendar_service.list_calendars()
-        except Exception as exc:
-            raise
-        cal_id: str | None = None
-        # APPLY: Always apply the nuke+create behavior for the week.
-        stats = self._sync_week_to_google_calendar_apply()
+        tz = self._resolve_tz()
+        tzname = self._tz_name
+        self._resolve_calendar_id(cal_name)
+        # APPLY: replace the week's events, keeping the ones that are unchanged
+        # unless a full rebuild was forced.
+        if force:
+            stats = self._sync_week_to_google_calendar_apply(force=True)
+        else:
+            stats = self._sync_week_to_google_calendar_apply()
         # If there were errors, surface an error modal; keep behavior best-effort.
         if stats.get("errors"):
             try:
@@ -2580,6 +2809,147 @@ class MunazzimApp(App):
         return created
         # NOTE: end of _sync_week_to_google_calendar
 
+    def _resolve_calendar_id(
+        self,
+        cal_name: str,
+        *,
+        create_if_missing: bool = False,
+        tzname: str | None = None,
+    ) -> str | None:
+        """Return the id of the Google calendar named ``cal_name``.
+
+        Ids are cached for the session so the sync helpers share a single
+        ``list_calendars`` round-trip; see ``_invalidate_cal_cache``. When
+        the calendar doesn't exist it is created if ``create_if_missing``
+        is set, otherwise None is returned. Service errors propagate.
+        """
+        cal_id = self._cal_id_cache.get(cal_name)
+        if cal_id:
+            return cal_id
+        for c in self.google_calendar_service.list_calendars():
+            if c.summary == cal_name:
+                cal_id = c.id
+                break
+        if not cal_id and create_if_missing:
+            try:
+                created_cal = self.google_calendar_service.create_calendar(cal_name, time_zone=(tzname or 'UTC'))
+            except TypeError:
+                # Older service or fake may not accept tz param; call without it
+                created_cal = self.google_calendar_service.create_calendar(cal_name)
+            cal_id = created_cal.id
+        if cal_id:
+            self._cal_id_cache[cal_name] = cal_id
+        return cal_id
+
+    def _invalidate_cal_cache(self) -> None:
+        self._cal_id_cache.clear()
+
+    def _get_day_plan(self, tpl_name: str, tpl, target_date: date) -> DayPlan:
+        """Return the plan of template ``tpl`` for ``target_date``.
+
+        Plans are reused across the tasks and calendar sync paths until the
+        templates are reloaded, so each day's prayer schedule is fetched and
+        its plan built only once. Errors propagate to the caller.
+        """
+        key = (tpl_name, target_date)
+        plan = self._day_plan_cache.get(key)
+        if plan is None:
+            prayer_schedule = self.prayer_service.get_schedule(target_date)
+            plan = self.scheduler.build_plan(tpl, plan_date=target_date, prayer_schedule=prayer_schedule)
+            if len(self._day_plan_cache) >= 64:
+                self._day_plan_cache.clear()
+            self._day_plan_cache[key] = plan
+        return plan
+
+    def _reload_templates(self) -> None:
+        self.templates.reload()
+        self._day_plan_cache.clear()
+
+    def _sync_has_templates(self) -> bool:
+        """Whether any weekday can resolve a template for calendar sync."""
+        return bool(self.week_assignments or self.active_template_name or self.config.planner.default_template)
+
+    def _warm_week_day_plans(self, week_dates: list[date]) -> None:
+        """Build the calendar sync's uncached day plans concurrently.
+
+        ``week_dates`` runs Monday to Sunday. Failures are ignored here; the
+        sync loops meet them again through _get_day_plan and report them.
+        """
+        jobs = []
+        for day_name, target_date in zip(WEEKDAY_ORDER, week_dates):
+            tpl_name = (
+                self.week_assignments.get(day_name)
+                or self.active_template_name
+                or self.config.planner.default_template
+            )
+            if not tpl_name or (tpl_name, target_date) in self._day_plan_cache:
+                continue
+            try:
+                jobs.append((tpl_name, self.templates.get(tpl_name), target_date))
+            except Exception:
+                continue
+        if len(jobs) < 2:
+            return
+
+        def _warm(job: tuple) -> None:
+            with suppress(Exception):
+                self._get_day_plan(*job)
+
+        with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+            list(executor.map(_warm, jobs))
+
+    def _build_day_plan(self, day_name: str, today: date) -> DayPlan | None:
+        """Build the plan assigned to ``day_name`` in the week containing ``today``."""
+        tpl_name = self.week_assignments.get(day_name)
+        if not tpl_name:
+            return None
+        try:
+            tpl = self.templates.get(tpl_name)
+        except Exception:
+            return None
+        # Monday of the current week offset by the weekday index
+        target_date = date.fromordinal(today.toordinal() - today.weekday() + _WEEKDAY_INDEX[day_name])
+        try:
+            return self._get_day_plan(tpl_name, tpl, target_date)
+        except Exception:
+            return None
+
+    def _build_week_plans(self, today: date) -> list[DayPlan]:
+        """Build this week's assigned plans in weekday order.
+
+        Each day is built on its own worker thread since prayer schedule
+        lookups may hit the network.
+        """
+        days = [day_name for day_name in WEEKDAY_ORDER if self.week_assignments.get(day_name)]
+        if not days:
+            return []
+        with ThreadPoolExecutor(max_workers=len(days)) as executor:
+            plans = list(executor.map(partial(self._build_day_plan, today=today), days))
+        return [plan for plan in plans if plan is not None]
+
+    def _week_occurrence_index(self, today: date) -> dict[str, list[datetime]]:
+        """Map event names to their start times across this week's plans.
+
+        The index is kept until the day or the templates fingerprint changes,
+        so looking up several events costs one set of plan builds.
+        """
+        try:
+            fingerprint = self._compute_templates_fingerprint()
+        except Exception:
+            fingerprint = None
+        key = (today, fingerprint)
+        cached = self._week_occurrence_cache
+        if fingerprint is not None and cached is not None and cached[0] == key:
+            return cached[1]
+        index: dict[str, list[datetime]] = {}
+        for plan in self._build_week_plans(today):
+            for sched in plan.items:
+                name = _scheduled_event_name(sched)
+                if name:
+                    index.setdefault(name, []).append(sched.start)
+        self._week_occurrence_cache = (key, index)
+        return index
+
     def _find_event_occurrence(self, event_name: str, scheduled_start: "datetime.datetime" | None = None) -> "datetime.datetime" | None:
         """Find a scheduled occurrence (datetime) for an event name.
 
@@ -2588,8 +2958,7 @@ class MunazzimApp(App):
         2. Search the week's templates to find scheduled occurrences and prefer the nearest future occurrence, otherwise the closest occurrence.
         3. Return None if no occurrence found.
         """
-        from datetime import datetime as _dt, timedelta as _td
-        from zoneinfo import ZoneInfo
+        from datetime import datetime as _dt
 
         # Prefer explicit scheduled_start when it matches today's date
         try:
@@ -2599,34 +2968,8 @@ class MunazzimApp(App):
         if scheduled_start is not None and getattr(scheduled_start, "date", lambda: None)() == today:
             return scheduled_start
 
-        occurrences: list[_dt] = []
+        occurrences: list[_dt] = self._week_occurrence_index(today).get(event_name, [])
         now = _dt.now()
-        for day_name in WEEKDAY_ORDER:
-            tpl_name = self.week_assignments.get(day_name)
-            if not tpl_name:
-                continue
-            try:
-                tpl = self.templates.get(tpl_name)
-            except Exception:
-                continue
-            try:
-                target_index = WEEKDAY_ORDER.index(day_name)
-                start_of_week = today - _td(days=today.weekday())
-                target_date = start_of_week + _td(days=target_index)
-            except Exception:
-                continue
-            try:
-                prayer_schedule = self.prayer_service.get_schedule(target_date)
-                plan = self.scheduler.build_plan(tpl, plan_date=target_date, prayer_schedule=prayer_schedule)
-            except Exception:
-                continue
-            for sched in plan.items:
-                try:
-                    ev_name = sched.event.name if hasattr(sched.event, "name") else None
-                except Exception:
-                    ev_name = None
-                if ev_name == event_name:
-                    occurrences.append(sched.start)
         if not occurrences:
             return None
         future = [o for o in occurrences if o >= now]
@@ -2634,36 +2977,37 @@ class MunazzimApp(App):
             return min(future)
         return min(occurrences, key=lambda o: abs((o - now).total_seconds()))
 
-    def _resolve_due_for_list(self, list_id: str | None, scheduled_start: "datetime.datetime" | None = None) -> str | None:
+    def _resolve_due_for_list(
+        self,
+        list_id: str | None,
+        scheduled_start: "datetime.datetime" | None = None,
+        *,
+        list_title: str | None = None,
+    ) -> str | None:
         """Return an RFC3339 UTC string for the due time associated with the
         given list (if it maps to a scheduled event in this week's plan), or
         None if no mapping can be found.
+
+        Callers that already hold the list's title pass it as ``list_title``
+        so the task lists don't have to be looked up again.
         """
         if not list_id or not getattr(self, "google_tasks_service", None):
             return None
-        try:
-            lists = self.google_tasks_service.list_tasklists()
-        except Exception:
-            return None
-        list_title = next((l.title for l in lists if l.id == list_id), None)
+        if list_title is None:
+            list_title = self._tasklist_titles.get(list_id)
+        if list_title is None:
+            try:
+                lists = self._list_tasklists()
+            except Exception:
+                return None
+            list_title = next((l.title for l in lists if l.id == list_id), None)
         if not list_title:
             return None
         occ = self._find_event_occurrence(list_title, scheduled_start)
         if not occ:
             return None
-        # Convert to UTC/Z-based RFC3339
-        from zoneinfo import ZoneInfo
-        from datetime import timezone as _tz, datetime as _dt
-
-        tzname = self.config.location.timezone if getattr(self.config, 'location', None) and getattr(self.config.location, 'timezone', None) else None
         try:
-            tz = ZoneInfo(tzname) if tzname else _dt.now().astimezone().tzinfo
-        except Exception:
-            tz = _dt.now().astimezone().tzinfo
-        if occ.tzinfo is None:
-            occ = occ.replace(tzinfo=tz)
-        try:
-            return occ.astimezone(_tz.utc).isoformat().replace("+00:00", "Z")
+            return self._format_rfc3339(occ)
         except Exception:
             return None
 
@@ -2712,8 +3056,7 @@ class MunazzimApp(App):
             try:
                 rec = self.templates.record(name)
                 if rec.path and rec.path.exists():
-                    data = rec.path.read_bytes()
-                    templates_map[name] = hashlib.sha256(data).hexdigest()
+                    templates_map[name] = self._file_sha256(rec.path)
                 else:
                     # Fallback: use template representation
                     templates_map[name] = hashlib.sha256(str(rec.template).encode("utf-8")).hexdigest()
@@ -2727,15 +3070,25 @@ class MunazzimApp(App):
         serialized = json.dumps(payload, sort_keys=True, separators=(",", ":"))
         return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
 
+    def _file_sha256(self, path: Path) -> str:
+        """Return the SHA-256 of a file, rehashing only when its mtime or size changes."""
+        st = path.stat()
+        key = (st.st_mtime_ns, st.st_size)
+        cached = self._file_hash_cache.get(path)
+        if cached is not None and cached[:2] == key:
+            return cached[2]
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        self._file_hash_cache[path] = (*key, digest)
+        return digest
+
     def _state_file_path(self) -> Path:
         return Path.home() / ".config" / "munazzim" / "google_calendar_sync_state.json"
 
     def _read_last_fingerprint(self) -> str | None:
-        path = self._state_file_path()
-        if not path.exists():
-            return None
         try:
-            data = json.loads(path.read_text(encoding="utf-8"))
+            # json.loads detects the encoding of bytes itself; a missing
+            # file lands in the except arm, saving a separate stat call.
+            data = json.loads(self._state_file_path().read_bytes())
             return data.get("last_fingerprint")
         except Exception:
             return None
@@ -2743,8 +3096,18 @@ class MunazzimApp(App):
     def _write_last_fingerprint(self, fingerprint: str) -> None:
         path = self._state_file_path()
         path.parent.mkdir(parents=True, exist_ok=True)
-        data = {"last_fingerprint": fingerprint, "last_synced": datetime.utcnow().isoformat()}
-        path.write_text(json.dumps(data, sort_keys=True), encoding="utf-8")
+        data = {"last_fingerprint": fingerprint, "last_synced": datetime.now(timezone.utc).isoformat()}
+        # Write a sibling temp file and swap it in, so a crash mid-write
+        # can't leave a truncated state file behind.
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".sync-state-")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(json.dumps(data, sort_keys=True).encode("utf-8"))
+            os.replace(tmp, path)
+        except BaseException:
+            with suppress(OSError):
+                os.unlink(tmp)
+            raise
 
     def _collect_weekly_event_payloads(self) -> list[dict]:
         """Return the planned event payloads that would be created by sync.
@@ -2753,77 +3116,29 @@ class MunazzimApp(App):
         event payloads as the sync function but does not call the Google API.
         """
         payloads: list[dict] = []
-        if not getattr(self, "google_calendar_service", None):
+        if not getattr(self, "google_calendar_service", None) or not self._sync_has_templates():
             return payloads
         cal_name = self.config.planner.google_calendar or "Munazzim"
         try:
-            cals = self.google_calendar_service.list_calendars()
+            # No calendar yet (None): still compute the proposed payloads for the week
+            self._resolve_calendar_id(cal_name)
         except Exception:
             # Can't list calendars; gracefully return empty list
             return payloads
-        cal_id: str | None = None
-        for c in cals:
-            if c.summary == cal_name:
-                cal_id = c.id
-                break
-        if not cal_id:
-            # No calendar yet: still compute the proposed payloads for the week
-            cal_id = None
-
-        # Build existing signatures for dedupe so dry run matches actual behavior
-        try:
-            now_dt = datetime.now()
-            from datetime import timedelta as _td
-            tzname = self.config.location.timezone if getattr(self.config, 'location', None) and getattr(self.config.location, 'timezone', None) else None
-            from zoneinfo import ZoneInfo
-            try:
-                tz = ZoneInfo(tzname) if tzname else datetime.now().astimezone().tzinfo
-            except Exception:
-                tz = datetime.now().astimezone().tzinfo
-            from datetime import timezone as _tz
-            try:
-                today = self.current_date
-            except Exception:
-                from datetime import date as _date
-
-                today = _date.today()
-            from datetime import timezone as _tz
-            start_of_week_date = today - _td(days=today.weekday())
-            start_dt = datetime.combine(start_of_week_date, datetime.min.time()).replace(tzinfo=tz)
-            end_dt = (start_dt + _td(days=7)).replace(tzinfo=tz)
-            time_min = start_dt.astimezone(_tz.utc).isoformat().replace("+00:00", "Z")
-            time_max = end_dt.astimezone(_tz.utc).isoformat().replace("+00:00", "Z")
-            existing = self.google_calendar_service.list_events(cal_id or "primary", timeMin=time_min, timeMax=time_max)
-        except Exception:
-            existing = []
-        existing_signatures = set()
-        for ev in existing:
-            try:
-                props = getattr(ev, 'extended_properties', None) or {}
-                private = (props.get("private") or {})
-                sig = private.get("munazzim_signature")
-                if sig:
-                    existing_signatures.add(sig)
-            except Exception:
-                continue
+        # Remote events are not fetched: planned payloads are never filtered
+        # by what already exists, since the sync recreates them all.
+        tz = self._resolve_tz()
+        tzname = self._tz_name
 
         # Reuse the same logic as the sync: compute payloads without creating them
-        weekday_map = {
-            "monday": "MO",
-            "tuesday": "TU",
-            "wednesday": "WE",
-            "thursday": "TH",
-            "friday": "FR",
-            "saturday": "SA",
-            "sunday": "SU",
-        }
-        from datetime import timedelta as _td
         try:
             today = self.current_date
         except Exception:
             from datetime import date as _date
             today = _date.today()
-        for day_name in WEEKDAY_ORDER:
+        week_dates = _week_dates(today)
+        self._warm_week_day_plans(week_dates)
+        for day_name, target_date in zip(WEEKDAY_ORDER, week_dates):
             tpl_name = self.week_assignments.get(day_name)
             if not tpl_name:
                 tpl_name = self.active_template_name or self.config.planner.default_template
@@ -2834,44 +3149,16 @@ class MunazzimApp(App):
             except Exception:
                 continue
             try:
-                target_index = WEEKDAY_ORDER.index(day_name)
-                start_of_week_date = today - _td(days=today.weekday())
-                target_date = start_of_week_date + _td(days=target_index)
-            except Exception:
-                continue
-            try:
-                prayer_schedule = self.prayer_service.get_schedule(target_date)
-                plan = self.scheduler.build_plan(tpl, plan_date=target_date, prayer_schedule=prayer_schedule)
+                plan = self._get_day_plan(tpl_name, tpl, target_date)
             except Exception:
                 continue
+            weekday = target_date.weekday()
             for sched in plan.items:
+                # Do not filter planned payloads based on remote existence
                 try:
-                    ev_name = sched.display_name
+                    payloads.append(_weekly_event_payload(sched, weekday, tz, tzname))
                 except Exception:
                     continue
-                byday = weekday_map.get(day_name, None)
-                if not byday:
-                    continue
-                local_time = sched.start.replace(tzinfo=tz) if sched.start.tzinfo is None else sched.start.astimezone(tz)
-                sig = f"{ev_name}|{byday}|{local_time.strftime('%H:%M')}"
-                # Do not filter planned daily payloads based on remote existence
-                start_iso = local_time.isoformat()
-                if getattr(sched, "end", None):
-                    end_local = sched.end.replace(tzinfo=tz) if sched.end.tzinfo is None else sched.end.astimezone(tz)
-                else:
-                    end_local = (local_time + sched.event.duration)
-                    if end_local.tzinfo is None:
-                        end_local = end_local.replace(tzinfo=tz)
-                end_iso = end_local.isoformat()
-                rrule = f"RRULE:FREQ=WEEKLY;BYDAY={byday}"
-                payload = {
-                    "summary": ev_name,
-                    "start": {"dateTime": start_iso, "timeZone": (tzname or 'UTC')},
-                    "end": {"dateTime": end_iso, "timeZone": (tzname or 'UTC')},
-                    "recurrence": [rrule],
-                    "extendedProperties": {"private": {"munazzim_signature": sig, "munazzim_event": getattr(sched.event, 'name', '')}},
-                }
-                payloads.append(payload)
         return payloads
 
     def _collect_daily_event_payloads(self, target_date) -> list[dict]:
@@ -2885,62 +3172,13 @@ class MunazzimApp(App):
             return payloads
         cal_name = self.config.planner.google_calendar or "Munazzim"
         try:
-            cals = self.google_calendar_service.list_calendars()
+            self._resolve_calendar_id(cal_name)
         except Exception:
             return payloads
-        cal_id: str | None = None
-        for c in cals:
-            if c.summary == cal_name:
-                cal_id = c.id
-                break
-        if not cal_id:
-            cal_id = None
-
-        # Build existing signatures for dedupe so dry run matches actual behavior
-        try:
-            tzname = self.config.location.timezone if getattr(self.config, 'location', None) and getattr(self.config.location, 'timezone', None) else None
-            from zoneinfo import ZoneInfo
-            from datetime import timezone as _tz
-            try:
-                tz = ZoneInfo(tzname) if tzname else datetime.now().astimezone().tzinfo
-            except Exception:
-                tz = datetime.now().astimezone().tzinfo
-            from datetime import timezone as _tz
-            start_dt = datetime.combine(target_date, datetime.min.time()).replace(tzinfo=tz)
-            end_dt = (start_dt + timedelta(days=1)).replace(tzinfo=tz)
-            time_min = start_dt.astimezone(_tz.utc).isoformat().replace("+00:00", "Z")
-            time_max = end_dt.astimezone(_tz.utc).isoformat().replace("+00:00", "Z")
-            existing = self.google_calendar_service.list_events(cal_id or "primary", timeMin=time_min, timeMax=time_max)
-        except Exception:
-            existing = []
-        existing_signatures = set()
-        for ev in existing:
-            try:
-                props = getattr(ev, 'extended_properties', None) or {}
-                private = (props.get("private") or {})
-                sig = private.get("munazzim_signature")
-                if sig:
-                    existing_signatures.add(sig)
-            except Exception:
-                continue
 
         # Build payloads for the given date only
-        weekday_map = {
-            "monday": "MO",
-            "tuesday": "TU",
-            "wednesday": "WE",
-            "thursday": "TH",
-            "friday": "FR",
-            "saturday": "SA",
-            "sunday": "SU",
-        }
-        try:
-            today = target_date
-        except Exception:
-            from datetime import date as _date
-            today = _date.today()
-        # For each day, but we only care about the one day passed in, compare
-        day_name = today.strftime('%A').lower()
+        weekday = target_date.weekday()
+        day_name = WEEKDAY_ORDER[weekday]
         tpl_name = self.week_assignments.get(day_name)
         if not tpl_name:
             tpl_name = self.active_template_name or self.config.planner.default_template
@@ -2951,44 +3189,56 @@ class MunazzimApp(App):
         except Exception:
             return payloads
         try:
-            prayer_schedule = self.prayer_service.get_schedule(today)
-            plan = self.scheduler.build_plan(tpl, plan_date=today, prayer_schedule=prayer_schedule)
+            plan = self._get_day_plan(tpl_name, tpl, target_date)
         except Exception:
             return payloads
+        tz = self._resolve_tz()
+        tzname = self._tz_name
         for sched in plan.items:
             try:
-                ev_name = sched.display_name
+                payloads.append(_weekly_event_payload(sched, weekday, tz, tzname))
             except Exception:
                 continue
-            byday = weekday_map.get(day_name, None)
-            if not byday:
+        return payloads
+
+    def _plan_week_payloads(self, tz, tzname: str | None, results: dict) -> list[dict]:
+        """Return this week's event payloads from Monday to Sunday.
+
+        Within each day events keep the scheduler's order. Template and plan
+        failures are recorded in ``results["errors"]`` and skipped.
+        """
+        payloads: list[dict] = []
+        if not self._sync_has_templates():
+            return payloads
+        try:
+            today = self.current_date
+        except Exception:
+            from datetime import date as _date
+            today = _date.today()
+        week_dates = _week_dates(today)
+        self._warm_week_day_plans(week_dates)
+        for day_name, target_date in zip(WEEKDAY_ORDER, week_dates):
+            tpl_name = self.week_assignments.get(day_name)
+            if not tpl_name:
+                tpl_name = self.active_template_name or self.config.planner.default_template
+            if not tpl_name:
+                continue
+            try:
+                tpl = self.templates.get(tpl_name)
+            except Exception as exc:
+                results["errors"].append(str(exc))
+                continue
+            try:
+                plan = self._get_day_plan(tpl_name, tpl, target_date)
+            except Exception as exc:
+                results["errors"].append(str(exc))
                 continue
-            local_time = sched.start
-            if local_time.tzinfo is None:
+            weekday = target_date.weekday()
+            for sched in plan.items:
                 try:
-                    tzname = self.config.location.timezone if getattr(self.config, 'location', None) and getattr(self.config.location, 'timezone', None) else None
-                    tz = ZoneInfo(tzname) if tzname else datetime.now().astimezone().tzinfo
-                except Exception:
-                    tz = datetime.now().astimezone().tzinfo
-                local_time = local_time.replace(tzinfo=tz)
-            sig = f"{ev_name}|{byday}|{local_time.strftime('%H:%M')}"
-            start_iso = local_time.isoformat()
-            if getattr(sched, "end", None):
-                end_local = sched.end.replace(tzinfo=tz) if sched.end.tzinfo is None else sched.end.astimezone(tz)
-            else:
-                end_local = (local_time + sched.event.duration)
-                if end_local.tzinfo is None:
-                    end_local = end_local.replace(tzinfo=tz)
-            end_iso = end_local.isoformat()
-            rrule = f"RRULE:FREQ=WEEKLY;BYDAY={byday}"
-            payload = {
-                "summary": ev_name,
-                "start": {"dateTime": start_iso, "timeZone": (tzname or 'UTC')},
-                "end": {"dateTime": end_iso, "timeZone": (tzname or 'UTC')},
-                "recurrence": [rrule],
-                "extendedProperties": {"private": {"munazzim_signature": sig, "munazzim_event": getattr(sched.event, 'name', '')}},
-            }
-            payloads.append(payload)
+                    payloads.append(_weekly_event_payload(sched, weekday, tz, tzname))
+                except Exception as exc:
+                    results["errors"].append(str(exc))
         return payloads
 
     def _sync_week_to_google_calendar_debug(self) -> dict:
@@ -3007,146 +3257,46 @@ class MunazzimApp(App):
             return results
         cal_name = self.config.planner.google_calendar or "Munazzim"
         # Determine timezone for calendar creation and event payloads
-        tzname = self.config.location.timezone if getattr(self.config, 'location', None) and getattr(self.config.location, 'timezone', None) else None
-        from zoneinfo import ZoneInfo
+        tz = self._resolve_tz()
+        tzname = self._tz_name
         try:
-            tz = ZoneInfo(tzname) if tzname else datetime.now().astimezone().tzinfo
-        except Exception:
-            tz = datetime.now().astimezone().tzinfo
-        try:
-            cals = self.google_calendar_service.list_calendars()
+            cal_id = self._resolve_calendar_id(cal_name, create_if_missing=True, tzname=tzname)
         except Exception as exc:
             results["errors"].append(str(exc))
             return results
-        cal_id: str | None = None
-        for c in cals:
-            if c.summary == cal_name:
-                cal_id = c.id
-                break
-        # If no calendar exists, we will create one (or attempt to) later.
-        created_cal = None
-        if not cal_id:
-            try:
-                try:
-                    created_cal = self.google_calendar_service.create_calendar(cal_name, time_zone=(tzname or 'UTC'))
-                except TypeError:
-                    # Older service or fake may not accept tz param; call without it
-                    created_cal = self.google_calendar_service.create_calendar(cal_name)
-                cal_id = created_cal.id
-            except Exception as exc:
-                results["errors"].append(str(exc))
-                return results
 
     # Do not fetch remote events for debug; always show the complete local plan
 
     # Build payloads and compute which events *would* be created as in normal sync
-        weekday_map = {
-            "monday": "MO",
-            "tuesday": "TU",
-            "wednesday": "WE",
-            "thursday": "TH",
-            "friday": "FR",
-            "saturday": "SA",
-            "sunday": "SU",
-        }
-        from datetime import timedelta as _td
-        try:
-            today = self.current_date
-        except Exception:
-            from datetime import date as _date
-            today = _date.today()
-        for day_name in WEEKDAY_ORDER:
-            tpl_name = self.week_assignments.get(day_name)
-            if not tpl_name:
-                tpl_name = self.active_template_name or self.config.planner.default_template
-            if not tpl_name:
-                continue
-            try:
-                tpl = self.templates.get(tpl_name)
-            except Exception as exc:
-                results["errors"].append(str(exc))
-                continue
-            try:
-                target_index = WEEKDAY_ORDER.index(day_name)
-                start_of_week_date = today - _td(days=today.weekday())
-                target_date = start_of_week_date + _td(days=target_index)
-            except Exception as exc:
-                results["errors"].append(str(exc))
-                continue
-            try:
-                prayer_schedule = self.prayer_service.get_schedule(target_date)
-                plan = self.scheduler.build_plan(tpl, plan_date=target_date, prayer_schedule=prayer_schedule)
-            except Exception as exc:
-                results["errors"].append(str(exc))
-                continue
-            for sched in plan.items:
-                try:
-                    ev_name = sched.display_name
-                except Exception as exc:
-                    results["errors"].append(str(exc))
-                    continue
-                byday = weekday_map.get(day_name, None)
-                if not byday:
-                    continue
-                local_time = sched.start.replace(tzinfo=tz) if sched.start.tzinfo is None else sched.start.astimezone(tz)
-                sig = f"{ev_name}|{byday}|{local_time.strftime('%H:%M')}"
-                results["planned_count"] += 1
-                start_iso = local_time.isoformat()
-                if getattr(sched, "end", None):
-                    end_local = sched.end.replace(tzinfo=tz) if sched.end.tzinfo is None else sched.end.astimezone(tz)
-                else:
-                    end_local = (local_time + sched.event.duration)
-                    if end_local.tzinfo is None:
-                        end_local = end_local.replace(tzinfo=tz)
-                end_iso = end_local.isoformat()
-                rrule = f"RRULE:FREQ=WEEKLY;BYDAY={byday}"
-                payload = {
-                    "summary": ev_name,
-                    "start": {"dateTime": start_iso, "timeZone": (tzname or 'UTC')},
-                    "end": {"dateTime": end_iso, "timeZone": (tzname or 'UTC')},
-                    "recurrence": [rrule],
-                    "extendedProperties": {"private": {"munazzim_signature": sig, "munazzim_event": getattr(sched.event, 'name', '')}},
-                }
-                # For the debug variant we do not actually create events; instead
-                # just count how many would be created. This keeps the debug
-                # operation non-destructive for diagnosis.
-                results["would_create_count"] = results.get("would_create_count", 0) + 1
+        planned = self._plan_week_payloads(tz, tzname, results)
+        results["planned_count"] += len(planned)
+        # For the debug variant we do not actually create events; instead
+        # just count how many would be created. This keeps the debug
+        # operation non-destructive for diagnosis.
+        if planned:
+            results["would_create_count"] = len(planned)
         return results
-    def _sync_week_to_google_calendar_apply(self) -> dict:
-        """Apply the sync and actually create events, returning stats and errors."""
+    def _sync_week_to_google_calendar_apply(self, force: bool = False) -> dict:
+        """Apply the sync and actually create events, returning stats and errors.
+
+        Existing events whose signature and times match a planned event are
+        kept as they are; everything else in the week is replaced. With
+        ``force`` every event in the week is deleted and recreated.
+        """
         results = {"planned_count": 0, "created_count": 0, "skipped_count": 0, "deleted_count": 0, "errors": []}
         if not getattr(self, "google_calendar_service", None):
             return results
         # Compute timezone for calendar creation
-        tzname = self.config.location.timezone if getattr(self.config, 'location', None) and getattr(self.config.location, 'timezone', None) else None
-        from zoneinfo import ZoneInfo
-        try:
-            tz = ZoneInfo(tzname) if tzname else datetime.now().astimezone().tzinfo
-        except Exception:
-            tz = datetime.now().astimezone().tzinfo
+        tz = self._resolve_tz()
+        tzname = self._tz_name
         # Create calendar if needed and then create events
         cal_name = self.config.planner.google_calendar or "Munazzim"
         try:
-            cals = self.google_calendar_service.list_calendars()
+            cal_id = self._resolve_calendar_id(cal_name, create_if_missing=True, tzname=tzname)
         except Exception as exc:
             results["errors"].append(str(exc))
             return results
-        cal_id = None
-        for c in cals:
-            if c.summary == cal_name:
-                cal_id = c.id
-                break
-        if not cal_id:
-            try:
-                try:
-                    created_cal = self.google_calendar_service.create_calendar(cal_name, time_zone=(tzname or 'UTC'))
-                except TypeError:
-                    created_cal = self.google_calendar_service.create_calendar(cal_name)
-                cal_id = created_cal.id
-            except Exception as exc:
-                results["errors"].append(str(exc))
-                return results
-    # Collect existing events for the week and delete them all (nuke the week)
+    # Collect existing events for the week; anything not kept below is deleted
         try:
             from datetime import timedelta as _td
             try:
@@ -3154,142 +3304,28 @@ class MunazzimApp(App):
             except Exception:
                 from datetime import date as _date
                 today = _date.today()
-            tzname = self.config.location.timezone if getattr(self.config, 'location', None) and getattr(self.config.location, 'timezone', None) else None
-            from zoneinfo import ZoneInfo
-            from datetime import timezone as _tz
-            try:
-                tz = ZoneInfo(tzname) if tzname else datetime.now().astimezone().tzinfo
-            except Exception:
-                tz = datetime.now().astimezone().tzinfo
-            start_of_week_date = today - _td(days=today.weekday())
-            start_dt = datetime.combine(start_of_week_date, datetime.min.time()).replace(tzinfo=tz)
-            end_dt = (start_dt + _td(days=7)).replace(tzinfo=tz)
-            time_min = start_dt.astimezone(_tz.utc).isoformat().replace("+00:00", "Z")
-            time_max = end_dt.astimezone(_tz.utc).isoformat().replace("+00:00", "Z")
-            existing = self.google_calendar_service.list_events(cal_id or "primary", timeMin=time_min, timeMax=time_max)
+            start_of_week_date = _week_dates(today)[0]
+            start_dt = _midnight(start_of_week_date, tz)
+            end_dt = _midnight(start_of_week_date + _td(days=7), tz)
+            time_min = self._format_rfc3339(start_dt)
+            time_max = self._format_rfc3339(end_dt)
+            existing = self._list_sync_events(cal_id, time_min, time_max)
         except Exception as exc:
             existing = []
-        # Map to event ids list and also collect generic existing ids for deletion
-        existing_ids: list[str] = []
-        existing_signatures_map: dict[str, list[str]] = {}
-        for ev in existing:
-            try:
-                event_id = getattr(ev, "recurring_event_id", None) or getattr(ev, "recurringEventId", None) or getattr(ev, "id", None)
-                props = getattr(ev, 'extended_properties', None) or {}
-                private = (props.get("private") or {})
-                sig = private.get("munazzim_signature")
-                if sig and event_id:
-                    existing_signatures_map.setdefault(sig, []).append(event_id)
-                if event_id:
-                    existing_ids.append(event_id)
-            except Exception:
-                continue
-        # Now compute planned payloads and decide which events to delete/create
-        # We use a two-pass approach: compute planned signatures, delete stale events
-        # (those that were created by Munazzim but are no longer planned), then
-        # create any remaining planned events that are missing.
-        planned_payloads = self._collect_weekly_event_payloads()
-        planned_signatures_map: dict[str, dict] = {}
-        for p in planned_payloads:
-            try:
-                props = p.get("extendedProperties", {})
-                private = props.get("private", {})
-                sig = private.get("munazzim_signature")
-            except Exception:
-                sig = None
-            if sig:
-                planned_signatures_map[sig] = p
 
-        existing_signatures = set(existing_signatures_map.keys())
-
-        # Nuke the week's events first by deleting all existing event ids in the range
-    # DEBUG-LOG (removed)
-        for eid in existing_ids:
-            if not eid:
-                continue
-            try:
-                self.google_calendar_service.delete_event(cal_id, eid)
-                results["deleted_count"] += 1
-            except Exception as exc:
-                results["errors"].append(str(exc))
-                continue
-
-        # Create any planned events that are not present in the existing set
-        # create planned events by iterating days from Monday -> Sunday; within
+        # Create the planned events by iterating days from Monday -> Sunday; within
         # each day, create events from first to last (scheduler already preserves order)
-        weekday_map = {
-            "monday": "MO",
-            "tuesday": "TU",
-            "wednesday": "WE",
-            "thursday": "TH",
-            "friday": "FR",
-            "saturday": "SA",
-            "sunday": "SU",
-        }
-        from datetime import timedelta as _td
-        try:
-            today = self.current_date
-        except Exception:
-            from datetime import date as _date
-            today = _date.today()
-        for day_name in WEEKDAY_ORDER:
-            tpl_name = self.week_assignments.get(day_name)
-            if not tpl_name:
-                tpl_name = self.active_template_name or self.config.planner.default_template
-            if not tpl_name:
-                continue
-            try:
-                tpl = self.templates.get(tpl_name)
-            except Exception as exc:
-                results["errors"].append(str(exc))
-                continue
-            try:
-                target_index = WEEKDAY_ORDER.index(day_name)
-                start_of_week_date = today - _td(days=today.weekday())
-                target_date = start_of_week_date + _td(days=target_index)
-            except Exception as exc:
-                results["errors"].append(str(exc))
-                continue
-            try:
-                prayer_schedule = self.prayer_service.get_schedule(target_date)
-                plan = self.scheduler.build_plan(tpl, plan_date=target_date, prayer_schedule=prayer_schedule)
-            except Exception as exc:
-                results["errors"].append(str(exc))
-                continue
-            for sched in plan.items:
-                try:
-                    ev_name = sched.display_name
-                except Exception as exc:
-                    results["errors"].append(str(exc))
-                    continue
-                byday = weekday_map.get(day_name, None)
-                if not byday:
-                    continue
-                local_time = sched.start.replace(tzinfo=tz) if sched.start.tzinfo is None else sched.start.astimezone(tz)
-                sig = f"{ev_name}|{byday}|{local_time.strftime('%H:%M')}"
-                start_iso = local_time.isoformat()
-                if getattr(sched, "end", None):
-                    end_local = sched.end.replace(tzinfo=tz) if sched.end.tzinfo is None else sched.end.astimezone(tz)
-                else:
-                    end_local = (local_time + sched.event.duration)
-                    if end_local.tzinfo is None:
-                        end_local = end_local.replace(tzinfo=tz)
-                end_iso = end_local.isoformat()
-                rrule = f"RRULE:FREQ=WEEKLY;BYDAY={byday}"
-                payload = {
-                    "summary": ev_name,
-                    "start": {"dateTime": start_iso, "timeZone": (tzname or 'UTC')},
-                    "end": {"dateTime": end_iso, "timeZone": (tzname or 'UTC')},
-                    "recurrence": [rrule],
-                    "extendedProperties": {"private": {"munazzim_signature": sig, "munazzim_event": getattr(sched.event, 'name', '')}},
-                }
-                results["planned_count"] += 1
-                try:
-                    self.google_calendar_service.create_event(cal_id, payload)
-                    results["created_count"] += 1
-                except Exception as exc:
-                    results["errors"].append(str(exc))
-                    continue
+        planned = self._plan_week_payloads(tz, tzname, results)
+        results["planned_count"] += len(planned)
+        if force:
+            kept: set[str] = set()
+            to_create = planned
+        else:
+            kept, to_create = _diff_weekly_events(existing, planned)
+            results["skipped_count"] += len(planned) - len(to_create)
+        # Delete every other event in the week's range, then create what's missing
+        self._delete_calendar_events(cal_id, [eid for eid in _event_series_ids(existing) if eid not in kept], results)
+        self._create_calendar_events(cal_id, to_create, results)
         return results
     def _sync_day_to_google_calendar_apply(self, target_date, delete_all: bool = False) -> dict:
         """Apply the daily sync: delete and create events for a single day.
@@ -3300,66 +3336,29 @@ class MunazzimApp(App):
         results = {"planned_count": 0, "created_count": 0, "skipped_count": 0, "deleted_count": 0, "errors": []}
         if not getattr(self, "google_calendar_service", None):
             return results
-        tzname = self.config.location.timezone if getattr(self.config, 'location', None) and getattr(self.config.location, 'timezone', None) else None
-        from zoneinfo import ZoneInfo
-        try:
-            tz = ZoneInfo(tzname) if tzname else datetime.now().astimezone().tzinfo
-        except Exception:
-            tz = datetime.now().astimezone().tzinfo
+        tz = self._resolve_tz()
+        tzname = self._tz_name
 
         cal_name = self.config.planner.google_calendar or "Munazzim"
         try:
-            cals = self.google_calendar_service.list_calendars()
+            cal_id = self._resolve_calendar_id(cal_name, create_if_missing=True, tzname=tzname)
         except Exception as exc:
             results["errors"].append(str(exc))
             return results
-        cal_id = None
-        for c in cals:
-            if c.summary == cal_name:
-                cal_id = c.id
-                break
-        if not cal_id:
-            try:
-                try:
-                    created_cal = self.google_calendar_service.create_calendar(cal_name, time_zone=(tzname or 'UTC'))
-                except TypeError:
-                    created_cal = self.google_calendar_service.create_calendar(cal_name)
-                cal_id = created_cal.id
-            except Exception as exc:
-                results["errors"].append(str(exc))
-                return results
 
         # Determine times for the day range
-        from datetime import timezone as _tz
-        start_dt = datetime.combine(target_date, datetime.min.time()).replace(tzinfo=tz)
-        end_dt = (start_dt + timedelta(days=1)).replace(tzinfo=tz)
-        time_min = start_dt.astimezone(_tz.utc).isoformat().replace("+00:00", "Z")
-        time_max = end_dt.astimezone(_tz.utc).isoformat().replace("+00:00", "Z")
+        start_dt = _midnight(target_date, tz)
+        end_dt = _midnight(target_date + timedelta(days=1), tz)
+        time_min = self._format_rfc3339(start_dt)
+        time_max = self._format_rfc3339(end_dt)
         try:
-            existing = self.google_calendar_service.list_events(cal_id or "primary", timeMin=time_min, timeMax=time_max)
+            existing = self._list_sync_events(cal_id, time_min, time_max)
         except Exception as exc:
             results["errors"].append(str(exc))
             existing = []
 
-        existing_signatures_map: dict[str, list[str]] = {}
-        existing_ids = []
-        for ev in existing:
-            try:
-                props = getattr(ev, 'extended_properties', None) or {}
-                private = (props.get("private") or {})
-                sig = private.get("munazzim_signature")
-                event_id = getattr(ev, "recurring_event_id", None) or getattr(ev, "recurringEventId", None) or getattr(ev, "id", None)
-                if sig:
-                    existing_signatures_map.setdefault(sig, []).append(event_id)
-                # Track all ids in case of delete_all
-                if event_id:
-                    existing_ids.append(event_id)
-            except Exception:
-                continue
-
         # Compute planned payloads for the date
         planned_payloads = self._collect_daily_event_payloads(target_date)
-        planned_signatures = set()
         planned_signatures_map: dict[str, dict] = {}
         for p in planned_payloads:
             try:
@@ -3369,46 +3368,93 @@ class MunazzimApp(App):
             except Exception:
                 sig = None
             if sig:
-                planned_signatures.add(sig)
                 planned_signatures_map[sig] = p
 
         # Nuke all existing events in the day range to ensure a clean slate
-        for eid in existing_ids:
-            try:
-                self.google_calendar_service.delete_event(cal_id, eid)
-                results["deleted_count"] += 1
-            except Exception as exc:
-                results["errors"].append(str(exc))
-                continue
+        self._delete_calendar_events(cal_id, _event_series_ids(existing), results)
 
         # Create events for the day, ordered by their start times
         # Build a list of (sig, payload, start_dt) so we can sort and create
-        ordered: list[tuple[str, dict, datetime]] = []
-        for sig, payload in planned_signatures_map.items():
+        # fromisoformat takes the 'Z' suffix as of Python 3.11; fall back
+        # to now (aware, so it still sorts) if we can't parse; it will still create
+        now_dt = datetime.now(tz)
+        ordered: list[tuple[str, dict, datetime]] = [
+            (sig, payload, _event_time(payload.get("start")) or now_dt)
+            for sig, payload in planned_signatures_map.items()
+        ]
+        ordered.sort(key=itemgetter(2))
+        results["planned_count"] += len(ordered)
+        self._create_calendar_events(cal_id, [payload for _, payload, _ in ordered], results)
+        return results
+
+    def _list_sync_events(self, cal_id: str | None, time_min: str, time_max: str) -> list:
+        """List the calendar's events in the range, fetching only what sync reads."""
+        try:
+            return self.google_calendar_service.list_events(
+                cal_id or "primary", timeMin=time_min, timeMax=time_max, fields=_SYNC_EVENT_FIELDS
+            )
+        except TypeError:
+            # Older service or fake may not accept a field mask; call without it
+            return self.google_calendar_service.list_events(cal_id or "primary", timeMin=time_min, timeMax=time_max)
+
+    def _create_calendar_events(self, cal_id: str, payloads: list[dict], results: dict) -> None:
+        """Create ``payloads`` in the calendar, batching requests when supported.
+
+        Successes and failures are tallied into the ``created_count`` and
+        ``errors`` entries of ``results``.
+        """
+        if not payloads:
+            return
+        create_bulk = getattr(self.google_calendar_service, "create_events_bulk", None)
+        if create_bulk is not None:
             try:
-                start_iso = payload.get("start", {}).get("dateTime")
-                if start_iso and isinstance(start_iso, str) and start_iso.endswith("Z"):
-                    start_iso = start_iso.replace("Z", "+00:00")
-                start_dt = datetime.fromisoformat(start_iso) if start_iso else None
-            except Exception:
-                start_dt = None
-            if start_dt is None:
-                # fallback to now if we can't parse; it will still create
-                start_dt = datetime.now()
-            ordered.append((sig, payload, start_dt))
-        ordered.sort(key=lambda t: t[2])
-        for sig, payload, _ in ordered:
-            results["planned_count"] += 1
+                created, errors = create_bulk(cal_id, payloads)
+            except Exception as exc:
+                results["errors"].append(str(exc))
+                return
+            results["created_count"] += len(created)
+            results["errors"].extend(str(exc) for exc in errors)
+            return
+        for payload in payloads:
             try:
                 self.google_calendar_service.create_event(cal_id, payload)
                 results["created_count"] += 1
             except Exception as exc:
                 results["errors"].append(str(exc))
-                continue
-        return results
+
+    def _delete_calendar_events(self, cal_id: str, event_ids: list[str], results: dict) -> None:
+        """Delete ``event_ids`` from the calendar, batching requests when supported.
+
+        Tallies into ``deleted_count`` and ``errors`` like _create_calendar_events.
+        """
+        if not event_ids:
+            return
+        delete_bulk = getattr(self.google_calendar_service, "delete_events_bulk", None)
+        if delete_bulk is not None:
+            try:
+                deleted, errors = delete_bulk(cal_id, event_ids)
+            except Exception as exc:
+                results["errors"].append(str(exc))
+                return
+            results["deleted_count"] += deleted
+            results["errors"].extend(str(exc) for exc in errors)
+            return
+        for eid in event_ids:
+            try:
+                self.google_calendar_service.delete_event(cal_id, eid)
+                results["deleted_count"] += 1
+            except Exception as exc:
+                results["errors"].append(str(exc))
 
 
     def _editor_command(self) -> list[str] | None:
+        """Return the editor command, resolved once per session.
+
+        The PATH scan for a fallback editor is only repeated after a
+        reload, or when no editor was found or the last one went missing.
+        """
+        if self._editor_cmd is not None:
+            return list(self._editor_cmd)
         raw = (
             os.environ.get("MUNAZZIM_EDITOR")
             or os.environ.get("VISUAL")
@@ -3421,7 +3467,8 @@ class MunazzimApp(App):
                     break
         if not raw:
             return None
-        return shlex.split(raw)
+        self._editor_cmd = shlex.split(raw)
+        return list(self._editor_cmd)
 
     def _launch_editor(self, directory: Path, target: Path | None = None) -> bool:
         command = self._editor_command()
@@ -3431,10 +3478,14 @@ class MunazzimApp(App):
         run_command = list(command)
         if target is not None:
             run_command.append(str(target))
+        # Write pending config changes first so the editor sees them and a
+        # later flush can't clobber edits made to the config file.
+        self._flush_config()
         try:
             with self.suspend():
                 result = subprocess.run(run_command, cwd=str(directory), check=False)
         except FileNotFoundError:
+            self._editor_cmd = None
             self._display_error("Editor not found", command[0])
             return False
         if result.returncode != 0:
@@ -3455,9 +3506,7 @@ class MunazzimApp(App):
         if open_requested and path:
             directory = path.parent if path.parent.exists() else Path.home()
             self._launch_editor(directory, path)
-        self.templates.reload()
-        self.task_engine.refresh()
-        self.refresh_plan()
+        self._schedule_refresh(reload_templates=True)
 
     # Layout helper functions -------------------------------------------------
     def _apply_layout_ratios(self) -> None:
@@ -3466,24 +3515,36 @@ class MunazzimApp(App):
         This updates the width values for the `#plan-panel` and `#side-panel`
         and the height values for the `#plan-table` and `#week-table`.
         """
-        # Update column widths
-        try:
-            plan_panel = self.query_one("#plan-panel")
-            side_panel = self.query_one("#side-panel")
-        except Exception:
+        widgets = self._layout_widgets()
+        if widgets is None:
+            # Not mounted yet — do nothing
             return
+        plan_panel, side_panel, plan_table, week_table = widgets
         plan_panel.styles.width = f"{self._plan_column_fr}fr"
         side_panel.styles.width = f"{self._side_column_fr}fr"
+        plan_table.styles.height = f"{self._plan_table_fr}fr"
+        week_table.styles.height = f"{self._week_table_fr}fr"
 
-        # Apply vertical ratio to the main table widgets; guard queries
-        try:
-            plan_table = self.query_one("#plan-table")
-            week_table = self.query_one("#week-table")
-            plan_table.styles.height = f"{self._plan_table_fr}fr"
-            week_table.styles.height = f"{self._week_table_fr}fr"
+    def _layout_widgets(self) -> tuple[Widget, Widget, Widget, Widget] | None:
+        """Return the panels and tables resized by the layout ratios.
+
+        The handles are looked up once and reused until one of them is
+        detached, so held-down resize keys don't re-run four DOM queries.
+        """
+        cached = self._layout_widget_cache
+        if cached is not None and all(widget.is_attached for widget in cached):
+            return cached
+        try:
+            cached = (
+                self.query_one("#plan-panel"),
+                self.query_one("#side-panel"),
+                self.query_one("#plan-table"),
+                self.query_one("#week-table"),
+            )
         except Exception:
-            # Not mounted yet — do nothing
-            pass
+            return None
+        self._layout_widget_cache = cached
+        return cached
 
     def _adjust_horizontal_ratio(self, delta: float) -> None:
         """Adjust column ratios while keeping the total constant.
@@ -3492,15 +3553,12 @@ class MunazzimApp(App):
         sum equals _column_total_fr. Keep both columns >= 0.5fr.
         """
         min_fr = 0.5
-        plan_new = max(min_fr, self._plan_column_fr + delta)
-        # clamp such that side >= min_fr
-        side_new = max(min_fr, self._column_total_fr - plan_new)
-        # If the sum changed because of clamping, re-normalize plan
-        if side_new + plan_new != self._column_total_fr:
-            # recompute plan such that sum == total after min clamp
-            plan_new = max(min_fr, self._column_total_fr - side_new)
+        total = self._column_total_fr
+        # clamp plan so that both plan and side stay >= min_fr
+        plan_new = min(total - min_fr, max(min_fr, self._plan_column_fr + delta))
         self._plan_column_fr = plan_new
-        self._side_column_fr = side_new
+        # max() absorbs float rounding in total - (total - min_fr)
+        self._side_column_fr = max(min_fr, total - plan_new)
         self._apply_layout_ratios()
 
     def action_set_side_half(self) -> None:
@@ -3517,12 +3575,10 @@ class MunazzimApp(App):
         at least 0.4fr.
         """
         min_fr = 0.4
-        plan_new = max(min_fr, self._plan_table_fr + delta)
-        week_new = max(min_fr, (self._plan_table_fr + self._week_table_fr) - plan_new)
-        if plan_new + week_new != (self._plan_table_fr + self._week_table_fr):
-            plan_new = max(min_fr, (self._plan_table_fr + self._week_table_fr) - week_new)
+        total = self._plan_table_fr + self._week_table_fr
+        plan_new = min(total - min_fr, max(min_fr, self._plan_table_fr + delta))
         self._plan_table_fr = plan_new
-        self._week_table_fr = week_new
+        self._week_table_fr = max(min_fr, total - plan_new)
         self._apply_layout_ratios()
 
     # Actions triggered by user key bindings ---------------------------------
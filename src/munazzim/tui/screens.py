@@ -2,16 +2,17 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 import tempfile
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 import os
 from typing import Iterable, Sequence
 
+from rich.text import Text  # type: ignore[import]
 from textual.app import ComposeResult  # type: ignore[import]
 from textual.binding import Binding  # type: ignore[import]
 from textual.containers import Vertical  # type: ignore[import]
 from textual.screen import ModalScreen, Screen  # type: ignore[import]
-from textual.widgets import DataTable, ListItem, ListView, Static  # type: ignore[import]
+from textual.widgets import DataTable, Input, ListItem, ListView, Static  # type: ignore[import]
 
 
 @dataclass(slots=True)
@@ -26,6 +27,13 @@ class TaskListChoice:
     title: str
 
 
+def _choice_label(title: str, detail: str) -> Text:
+    """Two-line picker label with a dimmed detail line, built without markup."""
+    label = Text(title)
+    label.append(f"\n{detail}", style="dim")
+    return label
+
+
 class TemplatePickerScreen(ModalScreen[str | None]):
     """Modal list for selecting a template."""
 
@@ -42,20 +50,21 @@ class TemplatePickerScreen(ModalScreen[str | None]):
         super().__init__()
         self.templates = templates
         self.list_view: ListView | None = None
-        self._id_to_template: dict[str, str] = {}
+        # Row index -> template name; rows are composed in this order
+        self._template_names: list[str] = [choice.name for choice in templates]
 
     def compose(self) -> ComposeResult:
         title = Static("Select a template", classes="dialog-title")
-        items = []
-        self._id_to_template.clear()
-        for idx, choice in enumerate(self.templates):
-            body = Static(
-                f"{choice.name}\n[dim]{choice.description or 'No description'}[/dim]",
-                classes="dialog-item",
+        items = [
+            ListItem(
+                Static(
+                    _choice_label(choice.name, choice.description or "No description"),
+                    classes="dialog-item",
+                    markup=False,
+                )
             )
-            safe_id = f"template-{idx}"
-            self._id_to_template[safe_id] = choice.name
-            items.append(ListItem(body, id=safe_id))
+            for choice in self.templates
+        ]
         self.list_view = ListView(*items, id="template-picker-list")
         help_text = Static(
             "Enter = Select • Esc = Cancel • j/k move • gg/G start/end",
@@ -63,6 +72,19 @@ class TemplatePickerScreen(ModalScreen[str | None]):
         )
         yield Vertical(title, self.list_view, help_text, id="template-picker")
 
+    def on_mount(self) -> None:
+        if self.list_view and self.list_view.children:
+            self.list_view.index = 0
+
+    def on_list_view_selected(self, event: ListView.Selected) -> None:
+        index = event.list_view.index
+        if index is None or not 0 <= index < len(self._template_names):
+            return
+        self.dismiss(self._template_names[index])
+
+    def action_cancel(self) -> None:
+        self.dismiss(None)
+
     def action_new_template(self) -> None:
         """Open the new-template editor scoped to the picker.
 
@@ -91,7 +113,8 @@ class TaskListPickerScreen(ModalScreen[str | None]):
 
     def __init__(self, lists: Iterable[TaskListChoice]) -> None:
         super().__init__()
-        self.lists = list(lists)
+        # Consumed once by compose; callers usually pass a fresh list
+        self.lists: Iterable[TaskListChoice] = lists
         self.list_view: ListView | None = None
         self._id_to_list: dict[str, str] = {}
 
@@ -100,7 +123,7 @@ class TaskListPickerScreen(ModalScreen[str | None]):
         items = []
         self._id_to_list.clear()
         for idx, choice in enumerate(self.lists):
-            body = Static(f"{choice.title}\n[dim]{choice.id}[/dim]", classes="dialog-item")
+            body = Static(_choice_label(choice.title, choice.id), classes="dialog-item", markup=False)
             safe_id = f"tasklist-{idx}"
             self._id_to_list[safe_id] = choice.id
             items.append(ListItem(body, id=safe_id))
@@ -135,9 +158,6 @@ class TextEntryScreen(ModalScreen[str | None]):
 
     def compose(self) -> ComposeResult:
         title = Static(self.prompt, classes="dialog-title")
-        # Textual's Input widget is only used during runtime; using Static as fallback
-        from textual.widgets import Input  # type: ignore[import]
-
         inp = Input(placeholder=self.placeholder, id=self._input_id)
         help_text = Static("Enter = OK • Esc = Cancel", classes="dialog-help")
         yield Vertical(title, inp, help_text, id="text-entry")
@@ -151,7 +171,7 @@ class TextEntryScreen(ModalScreen[str | None]):
     def action_cancel(self) -> None:
         self.dismiss(None)
 
-    def on_input_submitted(self, event: "Input.Submitted") -> None:  # type: ignore[name-defined]
+    def on_input_submitted(self, event: Input.Submitted) -> None:
         self.dismiss(event.value)
 
 
@@ -174,8 +194,6 @@ class TaskEditScreen(ModalScreen[dict | None]):
         self._notes_id = "task-edit-notes"
 
     def compose(self) -> ComposeResult:
-        from textual.widgets import Input  # type: ignore[import]
-
         title = Static(self.prompt, classes="dialog-title")
         inp_title = Input(placeholder="Task title", id=self._title_id, value=self._title)
         inp_notes = Input(placeholder="Notes (optional)", id=self._notes_id, value=self._notes)
@@ -191,7 +209,7 @@ class TaskEditScreen(ModalScreen[dict | None]):
     def action_cancel(self) -> None:
         self.dismiss(None)
 
-    def on_input_submitted(self, event: "Input.Submitted") -> None:  # type: ignore[name-defined]
+    def on_input_submitted(self, event: Input.Submitted) -> None:
         # Gather values from all inputs and return a dictionary
         try:
             t = self.query_one(f"#{self._title_id}").value
@@ -276,10 +294,16 @@ class ErrorScreen(ModalScreen[None]):
         status area if the app is running.
         """
         payload = "\n\n".join(self.messages)
-        # Try clipboard (pyperclip) first
+        # Try clipboard (pyperclip) first. Resolved per call so a clipboard
+        # backend installed while the app runs is picked up.
         try:
             import pyperclip  # type: ignore
-
+        except Exception:
+            pyperclip = None
+        if pyperclip is None:
+            copied = False
+            msg = "clipboard not available; saving to file"
+        else:
             try:
                 pyperclip.copy(payload)
                 copied = True
@@ -287,9 +311,6 @@ class ErrorScreen(ModalScreen[None]):
             except Exception:
                 copied = False
                 msg = "Failed to copy to clipboard"
-        except Exception:
-            copied = False
-            msg = "clipboard not available; saving to file"
 
         if not copied:
             # fallback: write to a file in ~/.local/state/munazzim
@@ -297,10 +318,9 @@ class ErrorScreen(ModalScreen[None]):
                 home = Path.home()
                 state_dir = home / ".local" / "state" / "munazzim"
                 state_dir.mkdir(parents=True, exist_ok=True)
-                ts = datetime.utcnow().strftime('%Y%m%dT%H%M%SZ')
+                ts = datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')
                 fname = state_dir / f"errors-{ts}.txt"
-                with fname.open("w", encoding="utf-8") as fh:
-                    fh.write(payload)
+                fname.write_text(payload, encoding="utf-8")
                 msg = f"Saved errors to {fname}"
             except Exception:
                 msg = "Failed to save errors to file"
@@ -387,6 +407,7 @@ class WeekPlannerScreen(Screen[dict[str, str] | None]):
         super().__init__()
         self.assignments = dict(assignments)
         self.template_names = list(template_names)
+        self._template_index = {name: index for index, name in enumerate(self.template_names)}
         self.table = DataTable(zebra_stripes=True)
         self._day_row_keys: dict[str, object] = {}
         self._template_column_key: object | None = None
@@ -399,6 +420,7 @@ class WeekPlannerScreen(Screen[dict[str, str] | None]):
             "saturday",
             "sunday",
         ]
+        self._day_display = [day.capitalize() for day in self.day_order]
 
     def compose(self) -> ComposeResult:
         self._day_row_keys.clear()
@@ -407,8 +429,7 @@ class WeekPlannerScreen(Screen[dict[str, str] | None]):
             self._template_column_key = column_keys[1]
         else:
             self._template_column_key = None
-        for day in self.day_order:
-            display = day.capitalize()
+        for day, display in zip(self.day_order, self._day_display):
             template = self.assignments.get(day, "")
             row_key = self.table.add_row(display, template)
             self._day_row_keys[day] = row_key
@@ -435,10 +456,7 @@ class WeekPlannerScreen(Screen[dict[str, str] | None]):
         if day_key is None or not self.template_names:
             return
         current = self.assignments.get(day_key)
-        try:
-            current_index = self.template_names.index(current) if current else -1
-        except ValueError:
-            current_index = -1
+        current_index = self._template_index.get(current, -1) if current else -1
         new_index = (current_index + delta) % len(self.template_names)
         chosen = self.template_names[new_index]
         self.assignments[day_key] = chosen
@@ -1,12 +1,368 @@
 from __future__ import annotations
 
-from datetime import date, datetime, time, timedelta
-import re
-from typing import Sequence
+from bisect import bisect_left
+from datetime import time, timedelta
+from functools import lru_cache
+from operator import attrgetter, itemgetter
+from typing import Callable, Sequence
 
 from .config import PrayerSchedule
-from .models import DayTemplate, FixedEvent, PrayerBoundEvent, PrayerEvent
-from .timeutils import format_duration
+from .models import DayTemplate, Event, FixedEvent, PrayerBoundEvent, PrayerEvent
+from .timeutils import format_duration, parse_prayer_offset
+
+
+# All internal time math is in integer seconds since midnight of the
+# validated day; times past midnight simply exceed _DAY_SECONDS.
+_DAY_SECONDS = 24 * 60 * 60
+
+# Canonical prayer key for every accepted spelling: lowercase names, the
+# duhr alias, and the title-cased forms the qalib parser stores.
+_PRAYER_ALIAS = {
+    spelling: canonical
+    for name, canonical in (
+        ("fajr", "fajr"),
+        ("sunrise", "sunrise"),
+        ("dhuhr", "dhuhr"),
+        ("duhr", "dhuhr"),
+        ("asr", "asr"),
+        ("maghrib", "maghrib"),
+        ("isha", "isha"),
+    )
+    for spelling in (name, name.title())
+}
+
+
+def _prayer_key(token: str) -> str | None:
+    """Canonical prayer key for ``token``, normalizing case and whitespace only on a miss."""
+    return _PRAYER_ALIAS.get(token) or _PRAYER_ALIAS.get(token.strip().lower())
+
+
+@lru_cache(maxsize=256)
+def _parse_prayer_ref(token: str) -> tuple[str, int] | None:
+    """Parse a prayer reference into (canonical prayer, offset in seconds).
+
+    Accepts plain names ("Fajr") and offsets ("maghrib-50"). The result
+    doesn't depend on the day's prayer times, so each distinct token is
+    parsed once per process rather than on every validation.
+    """
+    key = _prayer_key(token)
+    if key is not None:
+        return key, 0
+    offset = parse_prayer_offset(token.strip())
+    if offset is None:
+        return None
+    prayer, sign, minutes = offset
+    key = _PRAYER_ALIAS.get(prayer)
+    if key is None:
+        return None
+    return key, -minutes * 60 if sign == "-" else minutes * 60
+
+
+# Resolves a time or prayer reference to seconds since midnight
+_RefResolver = Callable[[time | str | None], int | None]
+
+
+def _time_seconds(value: time) -> int:
+    """Seconds since midnight for a wall-clock time."""
+    return value.hour * 3600 + value.minute * 60 + value.second
+
+
+def _duration_seconds(value: timedelta) -> int:
+    return value.days * _DAY_SECONDS + value.seconds
+
+
+# Where an event lands when the timeline cursor is at ``cursor``: its
+# (start, duration) in seconds, or None if its range can't be resolved.
+_EventSpan = Callable[[Event, int, _RefResolver], tuple[int, int] | None]
+
+
+def _relative_span(event: Event, cursor: int, resolve: _RefResolver) -> tuple[int, int] | None:
+    return cursor, _duration_seconds(event.duration)
+
+
+def _fixed_span(event: FixedEvent, cursor: int, resolve: _RefResolver) -> tuple[int, int] | None:
+    return _time_seconds(event.anchor), _duration_seconds(event.duration)
+
+
+def _prayer_span(event: PrayerEvent, cursor: int, resolve: _RefResolver) -> tuple[int, int] | None:
+    if event.anchor is not None:
+        start = _time_seconds(event.anchor)
+    else:
+        start = resolve(event.prayer)
+        if start is None:
+            start = cursor
+    return start, _duration_seconds(event.duration)
+
+
+def _prayer_bound_span(event: PrayerBoundEvent, cursor: int, resolve: _RefResolver) -> tuple[int, int] | None:
+    if event.end_ref is None:
+        return cursor, _duration_seconds(event.duration)
+    start = resolve(event.start_ref)
+    if start is None:
+        start = cursor
+    end = resolve(event.end_ref)
+    if end is None:
+        return None
+    if end <= start:
+        end += _DAY_SECONDS
+    return start, end - start
+
+
+_EVENT_SPANS: dict[type, _EventSpan] = {
+    Event: _relative_span,
+    FixedEvent: _fixed_span,
+    PrayerEvent: _prayer_span,
+    PrayerBoundEvent: _prayer_bound_span,
+}
+
+
+def _event_span(event_type: type) -> _EventSpan:
+    """Span function for an event type, matched through its MRO for subclasses."""
+    for base in event_type.__mro__:
+        span = _EVENT_SPANS.get(base)
+        if span is not None:
+            return span
+    return _relative_span
+
+
+_MIN_WAKE_BUFFER = timedelta(minutes=20)
+_MIN_WAKE_BUFFER_SECONDS = _duration_seconds(_MIN_WAKE_BUFFER)
+_PRAYER_SEQUENCE = ("fajr", "dhuhr", "asr", "maghrib", "isha")
+# Position of each canonical prayer key in _PRAYER_SEQUENCE
+_PRAYER_ORDER = {name: index for index, name in enumerate(_PRAYER_SEQUENCE)}
+
+
+# (fajr, dhuhr, asr, maghrib, isha, sunrise) of a PrayerSchedule
+_ScheduleKey = tuple[time, time, time, time, time, time | None]
+
+
+def _schedule_key(prayers: PrayerSchedule) -> _ScheduleKey:
+    return (prayers.fajr, prayers.dhuhr, prayers.asr, prayers.maghrib, prayers.isha, prayers.sunrise)
+
+
+@lru_cache(maxsize=4)
+def _schedule_context(key: _ScheduleKey) -> tuple[dict[str, int], _RefResolver]:
+    """Prayer times in seconds and a memoizing resolver for one schedule.
+
+    Prayer times only change from one day to the next, so the validations
+    run on every UI refresh share the converted times and resolved
+    references instead of rebuilding them per call.
+    """
+    fajr, dhuhr, asr, maghrib, isha, sunrise = key
+    prayer_secs = {
+        "fajr": _time_seconds(fajr),
+        "dhuhr": _time_seconds(dhuhr),
+        "asr": _time_seconds(asr),
+        "maghrib": _time_seconds(maghrib),
+        "isha": _time_seconds(isha),
+    }
+    if sunrise is not None:
+        prayer_secs["sunrise"] = _time_seconds(sunrise)
+    return prayer_secs, _cached_resolver(prayer_secs)
+
+
+def _cached_resolver(prayer_secs: dict[str, int]) -> _RefResolver:
+    """Return a _resolve_ref bound to ``prayer_secs`` that memoizes per reference."""
+    cache: dict[time | str | None, int | None] = {}
+
+    def resolve(value: time | str | None) -> int | None:
+        try:
+            return cache[value]
+        except KeyError:
+            resolved = cache[value] = _resolve_ref(value, prayer_secs)
+            return resolved
+
+    return resolve
+
+
+def _validate_wake_time(
+    template: DayTemplate,
+    prayer_secs: dict[str, int],
+    issues: list[str],
+) -> None:
+    wake = _time_seconds(template.start_time)
+    if wake > prayer_secs["fajr"] - _MIN_WAKE_BUFFER_SECONDS:
+        issues.append(
+            "Wake-up time must be at least 20 minutes before Fajr. Adjust your template's start_time."
+        )
+
+
+def _validate_fixed_events(fixed_events: list[FixedEvent], issues: list[str]) -> None:
+    fixed_events = sorted(fixed_events, key=attrgetter("anchor"))
+    # Anchors are never negative, so -1 can't overlap the first event
+    last_end = -1
+    for event in fixed_events:
+        start = _time_seconds(event.anchor)
+        end = start + _duration_seconds(event.duration)
+        if start < last_end:
+            issues.append(
+                f"Fixed event '{event.name}' overlaps with a previous Thabbat event."
+            )
+        if end > last_end:
+            last_end = end
+
+
+def _validate_events(
+    template: DayTemplate,
+    prayer_secs: dict[str, int],
+    resolve: _RefResolver,
+    issues: list[str],
+    warnings: list[str],
+) -> None:
+    """Check prayer windows, durations and '..' ranges in one walk of the events.
+
+    Issues keep their grouping: prayer windows and ranges first, then
+    fixed-event overlaps, then durations and the 24-hour total.
+    """
+    window_issues: list[str] = []
+    duration_issues: list[str] = []
+    fixed_events: list[FixedEvent] = []
+    # (time, template position, name) of events pinned to a clock time
+    fixed_refs: list[tuple[int, int, str]] = []
+    # (name, start, end, spans_midnight) of each prayer-bound '..' range
+    ranges: list[tuple[str, int, int, bool]] = []
+    total = 0
+    overage_event: str | None = None
+    # Running total when overage_event first pushed it past 24 hours
+    overage_total = 0
+    cursor = _time_seconds(template.start_time)
+    spans = _EVENT_SPANS
+    add_ref = fixed_refs.append
+    add_range = ranges.append
+    add_duration_issue = duration_issues.append
+    for event in template.events:
+        if isinstance(event, PrayerEvent):
+            if event.anchor is not None:
+                _check_prayer_window(event, prayer_secs, window_issues)
+                add_ref((_time_seconds(event.anchor), len(fixed_refs), event.name))
+            else:
+                resolved = resolve(event.prayer)
+                if resolved is not None:
+                    add_ref((resolved, len(fixed_refs), event.name))
+        elif isinstance(event, FixedEvent):
+            fixed_events.append(event)
+            add_ref((_time_seconds(event.anchor), len(fixed_refs), event.name))
+        is_range = isinstance(event, PrayerBoundEvent) and event.end_ref is not None
+        if is_range:
+            bound = _resolve_prayer_bound_duration(event, resolve, template.start_time)
+            if bound is not None and bound <= 0:
+                window_issues.append(
+                    f"Event '{event.name}' has an invalid prayer-bound range."
+                )
+        span = (spans.get(type(event)) or _event_span(type(event)))(event, cursor, resolve)
+        if span is None:
+            continue
+        start, duration = span
+        if is_range:
+            end = resolve(event.end_ref)
+            add_range((event.name, start, start + duration, end is not None and end <= start))
+        if duration <= 0:
+            add_duration_issue(f"Event '{event.name}' must have a positive duration.")
+        total += duration
+        cursor = start + duration
+        if overage_event is None and total > _DAY_SECONDS:
+            overage_event = event.name
+            overage_total = total
+
+    issues.extend(window_issues)
+    _validate_fixed_events(fixed_events, issues)
+    issues.extend(duration_issues)
+    if total > _DAY_SECONDS:
+        if overage_event:
+            overage_text = format_duration(timedelta(seconds=overage_total - _DAY_SECONDS))
+            total_text = format_duration(timedelta(seconds=total))
+            issues.append(
+                f"Template exceeds 24 hours of planned time. Total planned time is {total_text}. "
+                f"'{overage_event}' pushes it over by {overage_text}."
+            )
+        else:
+            issues.append("Template exceeds 24 hours of planned time.")
+
+    if not ranges:
+        return
+    fixed_refs.sort()
+    ref_times = [ref[0] for ref in fixed_refs]
+    warn = warnings.append
+    for name, start, end, spans_midnight in ranges:
+        if spans_midnight:
+            warn(
+                f"Event '{name}' spans midnight in its '..' range; review for overlaps."
+            )
+        lo = bisect_left(ref_times, start)
+        hi = bisect_left(ref_times, end, lo)
+        if lo < hi:
+            # Name the overlapped event that comes first in the template
+            other_name = min(fixed_refs[lo:hi], key=itemgetter(1))[2]
+            warn(
+                f"Event '{name}' overlaps with '{other_name}' due to its '..' range."
+            )
+
+
+def _check_prayer_window(
+    event: PrayerEvent,
+    prayer_secs: dict[str, int],
+    issues: list[str],
+) -> None:
+    """Check an anchored prayer sits inside its window, before the next prayer."""
+    key = _prayer_key(event.prayer)
+    idx = _PRAYER_ORDER.get(key)
+    if idx is None:
+        return
+    sequence = _PRAYER_SEQUENCE
+    base = prayer_secs[key]
+    next_time = None
+    if idx + 1 < len(sequence):
+        next_time = prayer_secs[sequence[idx + 1]]
+    anchor = _time_seconds(event.anchor)
+    if anchor < base:
+        issues.append(
+            f"Prayer '{event.prayer}' is scheduled before its calculated start time."
+        )
+    if next_time is not None:
+        if anchor >= next_time:
+            issues.append(
+                f"Prayer '{event.prayer}' must be before the next prayer time."
+            )
+        if event.duration and anchor + _duration_seconds(event.duration) > next_time:
+            issues.append(
+                f"Prayer '{event.prayer}' exceeds the next prayer window."
+            )
+
+
+def _resolve_prayer_bound_duration(
+    event: PrayerBoundEvent,
+    resolve: _RefResolver,
+    fallback_start: time,
+) -> int | None:
+    start = resolve(event.start_ref)
+    if start is None:
+        start = _time_seconds(fallback_start)
+    end = resolve(event.end_ref) if event.end_ref is not None else None
+    if end is None:
+        duration = _duration_seconds(event.duration)
+        if duration <= 0:
+            return None
+        end = start + duration
+    if end <= start:
+        end += _DAY_SECONDS
+    return end - start
+
+
+def _resolve_ref(
+    value: time | str | None,
+    prayer_secs: dict[str, int],
+) -> int | None:
+    """Resolve a time or prayer reference to seconds since midnight."""
+    if value is None:
+        return None
+    if isinstance(value, time):
+        return _time_seconds(value)
+    parsed = _parse_prayer_ref(value)
+    if parsed is None:
+        return None
+    key, offset = parsed
+    base = prayer_secs.get(key)
+    return base + offset if base is not None else None
 
 
 class TemplateValidationError(ValueError):
@@ -17,289 +373,15 @@ class TemplateValidationError(ValueError):
 
 
 class TemplateValidator:
-    MIN_WAKE_BUFFER = timedelta(minutes=20)
-    _PRAYER_OFFSET_TOKEN = re.compile(r"^(?P<prayer>[A-Za-z]+)(?P<sign>[+-])(?P<minutes>\d{1,3})$")
+    MIN_WAKE_BUFFER = _MIN_WAKE_BUFFER
 
-    @classmethod
-    def validate(cls, template: DayTemplate, prayers: PrayerSchedule) -> list[str]:
+    @staticmethod
+    def validate(template: DayTemplate, prayers: PrayerSchedule) -> list[str]:
         issues: list[str] = []
         warnings: list[str] = []
-        cls._validate_wake_time(template, prayers, issues)
-        cls._validate_prayer_bounds(template, prayers, issues)
-        cls._validate_fixed_events(template, issues)
-        cls._validate_total_duration(template, prayers, issues)
-        cls._warn_relative_ranges(template, prayers, warnings)
+        prayer_secs, resolve = _schedule_context(_schedule_key(prayers))
+        _validate_wake_time(template, prayer_secs, issues)
+        _validate_events(template, prayer_secs, resolve, issues, warnings)
         if issues:
             raise TemplateValidationError(issues)
         return warnings
-
-    @classmethod
-    def _validate_wake_time(
-        cls,
-        template: DayTemplate,
-        prayers: PrayerSchedule,
-        issues: list[str],
-    ) -> None:
-        anchor_day = date.today()
-        wake = datetime.combine(anchor_day, template.start_time)
-        fajr = datetime.combine(anchor_day, prayers.fajr)
-        if wake > fajr - cls.MIN_WAKE_BUFFER:
-            issues.append(
-                "Wake-up time must be at least 20 minutes before Fajr. Adjust your template's start_time."
-            )
-
-    @classmethod
-    def _validate_fixed_events(cls, template: DayTemplate, issues: list[str]) -> None:
-        anchor_day = date.today()
-        fixed_events = sorted(
-            (event for event in template.events if isinstance(event, FixedEvent)),
-            key=lambda ev: ev.anchor,
-        )
-        last_end: datetime | None = None
-        for event in fixed_events:
-            start = datetime.combine(anchor_day, event.anchor)
-            end = start + event.duration
-            if last_end and start < last_end:
-                issues.append(
-                    f"Fixed event '{event.name}' overlaps with a previous Thabbat event."
-                )
-            last_end = max(last_end, end) if last_end else end
-
-    @classmethod
-    def _validate_total_duration(
-        cls,
-        template: DayTemplate,
-        prayers: PrayerSchedule,
-        issues: list[str],
-    ) -> None:
-        total = timedelta()
-        overage_event: str | None = None
-        overage_amount: timedelta | None = None
-        anchor_day = date.today()
-        cursor = datetime.combine(anchor_day, template.start_time)
-        for event in template.events:
-            if isinstance(event, PrayerBoundEvent):
-                if event.end_ref is not None:
-                    start_dt = cls._resolve_ref(event.start_ref, prayers)
-                    if start_dt is None:
-                        start_dt = cursor
-                    end_dt = cls._resolve_ref(event.end_ref, prayers)
-                    if end_dt is None:
-                        continue
-                    if end_dt <= start_dt:
-                        end_dt = end_dt + timedelta(days=1)
-                    duration = end_dt - start_dt
-                    if duration <= timedelta():
-                        issues.append(f"Event '{event.name}' must have a positive duration.")
-                    total += duration
-                    if event.start_ref is not None:
-                        cursor = start_dt
-                    cursor = end_dt
-                else:
-                    duration = event.duration
-                    if duration <= timedelta():
-                        issues.append(f"Event '{event.name}' must have a positive duration.")
-                    total += duration
-                    cursor = cursor + duration
-                if overage_event is None and total > timedelta(hours=24):
-                    overage_event = event.name
-                    overage_amount = total - timedelta(hours=24)
-                continue
-            if event.duration <= timedelta():
-                issues.append(f"Event '{event.name}' must have a positive duration.")
-            if isinstance(event, FixedEvent):
-                start_dt = datetime.combine(anchor_day, event.anchor)
-            elif isinstance(event, PrayerEvent):
-                if event.anchor is not None:
-                    start_dt = datetime.combine(anchor_day, event.anchor)
-                else:
-                    resolved = cls._resolve_ref(event.prayer, prayers)
-                    start_dt = resolved if resolved is not None else cursor
-            else:
-                start_dt = cursor
-            total += event.duration
-            cursor = start_dt + event.duration
-            if overage_event is None and total > timedelta(hours=24):
-                overage_event = event.name
-                overage_amount = total - timedelta(hours=24)
-        if total > timedelta(hours=24):
-            if overage_event:
-                overage_text = format_duration(overage_amount or timedelta())
-                total_text = format_duration(total)
-                issues.append(
-                    f"Template exceeds 24 hours of planned time. Total planned time is {total_text}. "
-                    f"'{overage_event}' pushes it over by {overage_text}."
-                )
-            else:
-                issues.append("Template exceeds 24 hours of planned time.")
-
-    @classmethod
-    def _validate_prayer_bounds(
-        cls,
-        template: DayTemplate,
-        prayers: PrayerSchedule,
-        issues: list[str],
-    ) -> None:
-        prayer_order = ["fajr", "dhuhr", "asr", "maghrib", "isha"]
-        prayer_times = {
-            "fajr": prayers.fajr,
-            "dhuhr": prayers.dhuhr,
-            "duhr": prayers.dhuhr,
-            "asr": prayers.asr,
-            "maghrib": prayers.maghrib,
-            "isha": prayers.isha,
-        }
-        for event in template.events:
-            if isinstance(event, PrayerEvent) and event.anchor is not None:
-                key = event.prayer.strip().lower()
-                key = "dhuhr" if key == "duhr" else key
-                base = prayer_times.get(key)
-                if base is None:
-                    continue
-                try:
-                    idx = prayer_order.index("dhuhr" if key == "duhr" else key)
-                except ValueError:
-                    idx = -1
-                next_time = None
-                if idx != -1 and idx + 1 < len(prayer_order):
-                    next_time = prayer_times.get(prayer_order[idx + 1])
-                anchor_dt = datetime.combine(date.today(), event.anchor)
-                base_dt = datetime.combine(date.today(), base)
-                if anchor_dt < base_dt:
-                    issues.append(
-                        f"Prayer '{event.prayer}' is scheduled before its calculated start time."
-                    )
-                if next_time:
-                    next_dt = datetime.combine(date.today(), next_time)
-                    if anchor_dt >= next_dt:
-                        issues.append(
-                            f"Prayer '{event.prayer}' must be before the next prayer time."
-                        )
-                    if event.duration and anchor_dt + event.duration > next_dt:
-                        issues.append(
-                            f"Prayer '{event.prayer}' exceeds the next prayer window."
-                        )
-            if isinstance(event, PrayerBoundEvent) and event.end_ref is not None:
-                duration = cls._resolve_prayer_bound_duration(event, prayers, template.start_time)
-                if duration is not None and duration <= timedelta():
-                    issues.append(
-                        f"Event '{event.name}' has an invalid prayer-bound range."
-                    )
-
-    @classmethod
-    def _resolve_prayer_bound_duration(
-        cls,
-        event: PrayerBoundEvent,
-        prayers: PrayerSchedule,
-        fallback_start: time,
-    ) -> timedelta | None:
-        start_dt = cls._resolve_ref(event.start_ref, prayers)
-        if start_dt is None:
-            start_dt = datetime.combine(date.today(), fallback_start)
-        end_dt = cls._resolve_ref(event.end_ref, prayers) if event.end_ref is not None else None
-        if end_dt is None:
-            if event.duration <= timedelta():
-                return None
-            end_dt = start_dt + event.duration
-        if end_dt <= start_dt:
-            end_dt = end_dt + timedelta(days=1)
-        return end_dt - start_dt
-
-    @classmethod
-    def _resolve_ref(
-        cls,
-        value: time | str | None,
-        prayers: PrayerSchedule,
-    ) -> datetime | None:
-        if value is None:
-            return None
-        if isinstance(value, time):
-            return datetime.combine(date.today(), value)
-        raw = value.strip()
-        offset_match = cls._PRAYER_OFFSET_TOKEN.match(raw)
-        if offset_match:
-            key = offset_match.group("prayer").strip().lower()
-            sign = offset_match.group("sign")
-            minutes = int(offset_match.group("minutes"))
-            if key == "duhr":
-                key = "dhuhr"
-            base = getattr(prayers, key, None)
-            if base is None:
-                return None
-            base_dt = datetime.combine(date.today(), base)
-            delta = timedelta(minutes=minutes)
-            if sign == "-":
-                delta = -delta
-            return base_dt + delta
-        key = raw.lower()
-        if key == "duhr":
-            key = "dhuhr"
-        base = getattr(prayers, key, None)
-        if base is None:
-            return None
-        return datetime.combine(date.today(), base)
-
-    @classmethod
-    def _warn_relative_ranges(
-        cls,
-        template: DayTemplate,
-        prayers: PrayerSchedule,
-        warnings: list[str],
-    ) -> None:
-        anchor_day = date.today()
-        cursor = datetime.combine(anchor_day, template.start_time)
-        fixed_refs: list[tuple[str, datetime]] = []
-
-        for event in template.events:
-            if isinstance(event, FixedEvent):
-                fixed_refs.append((event.name, datetime.combine(anchor_day, event.anchor)))
-            if isinstance(event, PrayerEvent):
-                if event.anchor is not None:
-                    fixed_refs.append((event.name, datetime.combine(anchor_day, event.anchor)))
-                else:
-                    resolved = cls._resolve_ref(event.prayer, prayers)
-                    if resolved is not None:
-                        fixed_refs.append((event.name, resolved))
-
-        for event in template.events:
-            if isinstance(event, PrayerBoundEvent) and event.end_ref is not None:
-                start_dt = cls._resolve_ref(event.start_ref, prayers)
-                if start_dt is None:
-                    start_dt = cursor
-                end_dt = cls._resolve_ref(event.end_ref, prayers)
-                if end_dt is None:
-                    continue
-                if end_dt <= start_dt:
-                    warnings.append(
-                        f"Event '{event.name}' spans midnight in its '..' range; review for overlaps."
-                    )
-                    end_dt = end_dt + timedelta(days=1)
-                for other_name, other_dt in fixed_refs:
-                    if other_dt >= start_dt and other_dt < end_dt:
-                        warnings.append(
-                            f"Event '{event.name}' overlaps with '{other_name}' due to its '..' range."
-                        )
-                        break
-                if event.start_ref is not None:
-                    cursor = start_dt
-                cursor = end_dt
-                continue
-
-            if isinstance(event, FixedEvent):
-                cursor = datetime.combine(anchor_day, event.anchor) + event.duration
-                continue
-
-            if isinstance(event, PrayerEvent):
-                anchor = event.anchor
-                if anchor is None:
-                    resolved = cls._resolve_ref(event.prayer, prayers)
-                    if resolved is not None:
-                        cursor = resolved + event.duration
-                        continue
-                if anchor is not None:
-                    cursor = datetime.combine(anchor_day, anchor) + event.duration
-                else:
-                    cursor = cursor + event.duration
-                continue
-
-            cursor = cursor + event.duration
@@ -0,0 +1,62 @@
+import threading
+from pathlib import Path
+
+from munazzim.services.google_calendar import BATCH_LIMIT, GoogleCalendarService
+
+
+class FakeRequest:
+    def __init__(self, resp):
+        self._resp = resp
+
+    def execute(self):
+        return self._resp
+
+
+class FakeBatch:
+    def __init__(self, api, callback):
+        self._api = api
+        self._callback = callback
+        self._requests = []
+
+    def add(self, request, request_id=None):
+        self._requests.append((request_id or str(len(self._requests)), request))
+
+    def execute(self):
+        self._api.batch_threads.append(threading.current_thread())
+        for request_id, request in self._requests:
+            self._callback(request_id, request.execute(), None)
+
+
+class FakeCalendarAPI:
+    def __init__(self):
+        self.batch_threads = []
+
+    def events(self):
+        return self
+
+    def insert(self, calendarId=None, body=None):
+        return FakeRequest({"id": f"{calendarId}-{body['summary']}", **body})
+
+    def delete(self, calendarId=None, eventId=None):
+        return FakeRequest("")
+
+    def new_batch_http_request(self, callback=None):
+        return FakeBatch(self, callback)
+
+
+def test_bulk_calls_send_batches_concurrently(monkeypatch, tmp_path: Path) -> None:
+    svc = GoogleCalendarService(client_secrets_path=str(tmp_path / "creds.json"), token_path=str(tmp_path / "token.json"))
+    fake = FakeCalendarAPI()
+    monkeypatch.setattr(svc, "_ensure_authenticated", lambda: setattr(svc, "_service", fake))
+
+    bodies = [{"summary": f"E{index}"} for index in range(BATCH_LIMIT + 1)]
+    created, errors = svc.create_events_bulk("cal-1", bodies)
+    assert errors == []
+    assert [event.id for event in created] == [f"cal-1-E{index}" for index in range(BATCH_LIMIT + 1)]
+    assert len(fake.batch_threads) == 2
+    assert threading.main_thread() not in fake.batch_threads
+
+    fake.batch_threads.clear()
+    deleted, errors = svc.delete_events_bulk("cal-1", ["e1", "e2"])
+    assert (deleted, errors) == (2, [])
+    assert fake.batch_threads == [threading.main_thread()]
@@ -74,3 +74,83 @@ def test_ensure_auth_requires_client_secrets(tmp_path: Path) -> None:
     # The actual _ensure_authenticated would open a flow; since file doesn't exist it should raise FileNotFoundError
     with pytest.raises(FileNotFoundError):
         svc._ensure_authenticated()
+
+
+class FakeBatch:
+    def __init__(self, callback):
+        self._callback = callback
+        self._requests = []
+
+    def add(self, request, request_id=None):
+        self._requests.append((request_id, request))
+
+    def execute(self):
+        for request_id, request in self._requests:
+            self._callback(request_id, request.execute(), None)
+
+
+class FakeBatchTasksAPI(FakeTasksAPI):
+    def __init__(self):
+        super().__init__({})
+        self.batches = 0
+
+    def list(self, **kwargs):
+        return FakeTasksAPI({"items": [{"id": f"{kwargs['tasklist']}-1", "title": "Task"}]})
+
+    def new_batch_http_request(self, callback=None):
+        self.batches += 1
+        return FakeBatch(callback)
+
+
+def test_batch_list_tasks_groups_lists(monkeypatch, tmp_path: Path) -> None:
+    svc = GoogleTasksService(client_secrets_path=str(tmp_path / "creds.json"), token_path=str(tmp_path / "token.json"))
+    fake = FakeBatchTasksAPI()
+    monkeypatch.setattr(svc, "_ensure_authenticated", lambda: setattr(svc, "_service", fake))
+
+    results = svc.batch_list_tasks(["l1", "l2", "l1"])
+    assert fake.batches == 1
+    assert sorted(results) == ["l1", "l2"]
+    assert results["l2"][0].id == "l2-1"
+
+
+class FakeBatchInsertAPI(FakeTasksAPI):
+    def __init__(self):
+        super().__init__({})
+        self.batches = 0
+
+    def insert(self, tasklist=None, body=None):
+        return FakeTasksAPI({"id": f"{tasklist}-{body['title']}", **body})
+
+    def new_batch_http_request(self, callback=None):
+        self.batches += 1
+        return FakeBatch(callback)
+
+
+def test_create_tasks_bulk_batches_inserts(monkeypatch, tmp_path: Path) -> None:
+    svc = GoogleTasksService(client_secrets_path=str(tmp_path / "creds.json"), token_path=str(tmp_path / "token.json"))
+    fake = FakeBatchInsertAPI()
+    monkeypatch.setattr(svc, "_ensure_authenticated", lambda: setattr(svc, "_service", fake))
+
+    created = svc.create_tasks_bulk("l1", [{"title": "A", "due": "2025-12-31T10:00:00Z"}, {"title": "B", "notes": None}])
+    assert fake.batches == 1
+    assert [t.id for t in created] == ["l1-A", "l1-B"]
+    assert created[0].due == "2025-12-31T10:00:00Z"
+    assert created[1].notes is None
+
+
+def test_build_service_reuses_http_per_thread() -> None:
+    import threading
+
+    from google.oauth2.credentials import Credentials
+
+    from munazzim.services.google_http import build_service
+
+    service = build_service("tasks", "v1", Credentials(token="token"))
+    first = service.tasklists().list()
+    assert service.tasks().list(tasklist="l1").http is first.http
+
+    other = {}
+    worker = threading.Thread(target=lambda: other.setdefault("http", service.tasklists().list().http))
+    worker.start()
+    worker.join()
+    assert other["http"] is not first.http
@@ -8,7 +8,7 @@ SRC = ROOT / "src"
 if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
 
-from munazzim.timeutils import parse_duration, parse_hhmm
+from munazzim.timeutils import parse_duration, parse_hhmm, parse_prayer_offset
 
 
 class TimeUtilsTest(unittest.TestCase):
@@ -27,6 +27,12 @@ class TimeUtilsTest(unittest.TestCase):
     def test_parse_duration_suffix(self) -> None:
         self.assertEqual(parse_duration("90m"), timedelta(minutes=90))
 
+    def test_parse_prayer_offset(self) -> None:
+        self.assertEqual(parse_prayer_offset("Maghrib-50"), ("maghrib", "-", 50))
+        self.assertEqual(parse_prayer_offset("fajr+005"), ("fajr", "+", 5))
+        for token in ("Fajr", "+30", "fajr+", "fajr+1234", "fajr+-3", "fa jr+3", "fajr+3a"):
+            self.assertIsNone(parse_prayer_offset(token), token)
+
 
 if __name__ == "__main__":
     unittest.main()
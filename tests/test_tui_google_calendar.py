@@ -726,3 +726,237 @@ def test_force_sync_today_deletes_munazzim_events(monkeypatch):
     assert called.get('created')
     created_sigs = [c['extendedProperties']['private']['munazzim_signature'] for c in called.get('created', [])]
     assert new_sig in created_sigs
+
+
+def test_calendar_events_are_created_in_bulk_when_supported(monkeypatch):
+    app = MunazzimApp()
+    calls = []
+
+    class FakeService:
+        def create_events_bulk(self, calendar_id, event_bodies):
+            calls.append(list(event_bodies))
+            return event_bodies[:1], [RuntimeError("rejected")]
+
+        def create_event(self, calendar_id, event_body):
+            raise AssertionError("create_event should not be used")
+
+    app.google_calendar_service = FakeService()
+    results = {"created_count": 0, "errors": []}
+    app._create_calendar_events("cal-1", [{"summary": "A"}, {"summary": "B"}], results)
+    assert calls == [[{"summary": "A"}, {"summary": "B"}]]
+    assert results == {"created_count": 1, "errors": ["rejected"]}
+
+
+def test_template_file_hash_is_reused_until_file_changes(monkeypatch, tmp_path: Path):
+    import os
+
+    app = MunazzimApp()
+    path = tmp_path / "a.toml"
+    path.write_text("one")
+    reads = []
+    original = Path.read_bytes
+    monkeypatch.setattr(Path, "read_bytes", lambda self: reads.append(self) or original(self))
+    first = app._file_sha256(path)
+    assert app._file_sha256(path) == first
+    assert len(reads) == 1
+    path.write_text("two!")
+    os.utime(path, ns=(0, path.stat().st_mtime_ns + 1_000_000))
+    assert app._file_sha256(path) != first
+    assert len(reads) == 2
+
+
+def test_day_plans_are_shared_across_sync_passes(monkeypatch):
+    app = MunazzimApp()
+    app.week_assignments = {}
+    app.active_template_name = "Template A"
+    ev = Event(name="Reading", duration=timedelta(hours=1))
+    monkeypatch.setattr(app.templates, "get", lambda name: SimpleNamespace(name=name))
+    monkeypatch.setattr(app.templates, "reload", lambda: None)
+    schedules = []
+    monkeypatch.setattr(app.prayer_service, "get_schedule", lambda d: schedules.append(d))
+
+    def make_plan(template, plan_date=None, prayer_schedule=None):
+        start_dt = datetime.combine(plan_date, time(hour=8, minute=0))
+        return SimpleNamespace(items=[ScheduledEvent(event=ev, start=start_dt, end=start_dt + timedelta(hours=1))])
+
+    monkeypatch.setattr(app.scheduler, "build_plan", make_plan)
+    app.google_calendar_service = SimpleNamespace(list_calendars=lambda: [], list_events=lambda calendar_id, timeMin=None, timeMax=None: [])
+    app.config.location.timezone = "UTC"
+    assert len(app._collect_weekly_event_payloads()) == 7
+    assert len(app._collect_weekly_event_payloads()) == 7
+    assert len(schedules) == 7
+    app._reload_templates()
+    app._collect_weekly_event_payloads()
+    assert len(schedules) == 14
+
+
+def test_calendar_id_is_resolved_once_per_session():
+    app = MunazzimApp()
+    lists = []
+
+    def list_calendars():
+        lists.append(1)
+        return [SimpleNamespace(id="cal-1", summary="Munazzim")]
+
+    app.google_calendar_service = SimpleNamespace(list_calendars=list_calendars)
+    assert app._resolve_calendar_id("Munazzim") == "cal-1"
+    assert app._resolve_calendar_id("Munazzim", create_if_missing=True) == "cal-1"
+    assert len(lists) == 1
+    app._invalidate_cal_cache()
+    assert app._resolve_calendar_id("Munazzim") == "cal-1"
+    assert len(lists) == 2
+
+
+def test_week_day_plans_are_warmed_off_the_main_thread(monkeypatch):
+    import threading
+
+    app = MunazzimApp()
+    app.week_assignments = {}
+    app.active_template_name = "Template A"
+    monkeypatch.setattr(app.templates, "get", lambda name: SimpleNamespace(name=name))
+    threads = []
+    monkeypatch.setattr(app.prayer_service, "get_schedule", lambda d: threads.append(threading.current_thread()))
+    monkeypatch.setattr(app.scheduler, "build_plan", lambda template, plan_date=None, prayer_schedule=None: SimpleNamespace(items=[]))
+    monday = date.today() - timedelta(days=date.today().weekday())
+    week_dates = [monday + timedelta(days=offset) for offset in range(7)]
+    app._warm_week_day_plans(week_dates)
+    assert len(threads) == 7
+    assert threading.main_thread() not in threads
+    app._warm_week_day_plans(week_dates)
+    assert len(threads) == 7
+
+
+def test_calendar_events_are_deleted_in_bulk_when_supported():
+    app = MunazzimApp()
+    calls = []
+
+    class FakeService:
+        def delete_events_bulk(self, calendar_id, event_ids):
+            calls.append(list(event_ids))
+            return 1, [RuntimeError("gone")]
+
+        def delete_event(self, calendar_id, event_id):
+            raise AssertionError("delete_event should not be used")
+
+    app.google_calendar_service = FakeService()
+    results = {"deleted_count": 0, "errors": []}
+    app._delete_calendar_events("cal-1", ["e1", "e2"], results)
+    assert calls == [["e1", "e2"]]
+    assert results == {"deleted_count": 1, "errors": ["gone"]}
+
+
+def test_sync_lists_events_with_a_field_mask():
+    app = MunazzimApp()
+    seen = []
+
+    class FakeService:
+        def list_events(self, calendar_id, timeMin=None, timeMax=None, fields=None):
+            seen.append(fields)
+            return []
+
+    app.google_calendar_service = FakeService()
+    assert app._list_sync_events("cal-1", "a", "b") == []
+    assert seen == ["items(id,recurringEventId,start,end,extendedProperties/private)"]
+
+
+def test_week_apply_lists_remote_events_once(monkeypatch):
+    app = MunazzimApp()
+    app.week_assignments = {"monday": "A"}
+    monkeypatch.setattr(app.templates, "get", lambda name: SimpleNamespace(name=name))
+    monkeypatch.setattr(app.scheduler, "build_plan", lambda template, plan_date=None, prayer_schedule=None: SimpleNamespace(items=[]))
+    monkeypatch.setattr(app.prayer_service, "get_schedule", lambda d: None)
+    listed = []
+    app.google_calendar_service = SimpleNamespace(
+        list_calendars=lambda: [SimpleNamespace(id="cal-1", summary="Munazzim")],
+        list_events=lambda calendar_id, timeMin=None, timeMax=None: listed.append(calendar_id) or [],
+    )
+    app._sync_week_to_google_calendar_apply()
+    assert listed == ["cal-1"]
+
+
+def test_sync_state_file_is_replaced_atomically(monkeypatch, tmp_path: Path):
+    app = MunazzimApp()
+    state = tmp_path / "state" / "sync.json"
+    monkeypatch.setattr(app, "_state_file_path", lambda: state)
+    app._write_last_fingerprint("fp1")
+    app._write_last_fingerprint("fp2")
+    assert app._read_last_fingerprint() == "fp2"
+    assert [p.name for p in state.parent.iterdir()] == ["sync.json"]
+
+
+def test_collect_payloads_short_circuits_without_templates():
+    app = MunazzimApp()
+    app.week_assignments = {}
+    app.active_template_name = None
+    app.config.planner.default_template = None
+
+    def list_calendars():
+        raise AssertionError("list_calendars should not be called")
+
+    app.google_calendar_service = SimpleNamespace(list_calendars=list_calendars)
+    assert app._collect_weekly_event_payloads() == []
+
+
+def test_week_apply_keeps_unchanged_events(monkeypatch):
+    app = MunazzimApp()
+    app.week_assignments = {"monday": "A"}
+    monday_date = date.today() - timedelta(days=date.today().weekday())
+    start_dt = datetime.combine(monday_date, time(9, 0))
+    kept = ScheduledEvent(event=Event(name="Reading", duration=timedelta(hours=1)), start=start_dt, end=start_dt + timedelta(hours=1))
+    moved = ScheduledEvent(event=Event(name="Writing", duration=timedelta(hours=1)), start=start_dt + timedelta(hours=2), end=start_dt + timedelta(hours=3))
+    monkeypatch.setattr(app.templates, "get", lambda name: SimpleNamespace(name=name))
+    monkeypatch.setattr(app.scheduler, "build_plan", lambda template, plan_date=None, prayer_schedule=None: SimpleNamespace(items=[kept, moved] if plan_date == monday_date else []))
+    monkeypatch.setattr(app.prayer_service, "get_schedule", lambda d: None)
+    called = {}
+
+    def remote(event_id, sig, start, end):
+        return SimpleNamespace(
+            id=f"{event_id}-1",
+            recurring_event_id=event_id,
+            start={"dateTime": start.isoformat() + "+00:00"},
+            end={"dateTime": end.isoformat() + "+00:00"},
+            extended_properties={"private": {"munazzim_signature": sig}},
+        )
+
+    class FakeService:
+        def list_calendars(self):
+            return [SimpleNamespace(id="cal-1", summary="Munazzim")]
+
+        def list_events(self, calendar_id, timeMin=None, timeMax=None):
+            return [
+                remote("series-kept", "Reading|MO|09:00", start_dt, start_dt + timedelta(hours=1)),
+                # Same signature, but the event used to be shorter
+                remote("series-moved", "Writing|MO|11:00", start_dt + timedelta(hours=2), start_dt + timedelta(hours=2, minutes=30)),
+            ]
+
+        def create_event(self, calendar_id, event_body):
+            called.setdefault("created", []).append(event_body["summary"])
+
+        def delete_event(self, calendar_id, event_id):
+            called.setdefault("deleted", []).append(event_id)
+
+    app.google_calendar_service = FakeService()
+    app.config.location.timezone = "UTC"
+    stats = app._sync_week_to_google_calendar_apply()
+    assert called == {"deleted": ["series-moved"], "created": ["Writing"]}
+    assert (stats["planned_count"], stats["skipped_count"]) == (2, 1)
+    called.clear()
+    app._sync_week_to_google_calendar_apply(force=True)
+    assert called == {"deleted": ["series-kept", "series-moved"], "created": ["Reading", "Writing"]}
+
+
+def test_force_week_sync_action_rebuilds_week(monkeypatch):
+    app = MunazzimApp()
+    app.google_calendar_service = SimpleNamespace()
+    monkeypatch.setattr(app, "_compute_templates_fingerprint", lambda: None)
+    monkeypatch.setattr(app, "_resolve_calendar_id", lambda name: "cal")
+    forced = []
+
+    def apply(force=False):
+        forced.append(force)
+        return {"created_count": 0, "errors": []}
+
+    monkeypatch.setattr(app, "_sync_week_to_google_calendar_apply", apply)
+    app.action_sync_google_calendar_week()
+    app.action_force_sync_google_calendar_week()
+    assert forced == [False, True]
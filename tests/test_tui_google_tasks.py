@@ -421,6 +421,25 @@ def test_user_navigation_suppresses_auto_highlight(monkeypatch):
     assert not seen.get('jumps')
 
 
+def test_highlight_handles_out_of_order_plan():
+    from datetime import datetime, timedelta
+    from munazzim.models import DayPlan, Event, FixedEvent, ScheduledEvent
+
+    app = MunazzimApp()
+    jumps = []
+    app.plan_table = SimpleNamespace(jump_to_row=jumps.append)
+    now = datetime.now()
+    # A fixed event jumps back into the long event before it, so the
+    # plan's start times are not sorted.
+    items = [
+        ScheduledEvent(event=Event(name="Fajr", duration=timedelta(minutes=20)), start=now - timedelta(hours=4), end=now - timedelta(hours=3, minutes=40)),
+        ScheduledEvent(event=Event(name="Work", duration=timedelta(hours=4)), start=now - timedelta(hours=3), end=now + timedelta(hours=1)),
+        ScheduledEvent(event=FixedEvent(name="Call", anchor=(now - timedelta(hours=2)).time(), duration=timedelta(hours=1)), start=now - timedelta(hours=2), end=now - timedelta(hours=1)),
+    ]
+    app._highlight_current_event(DayPlan(template_name="t", generated_for=now.date(), items=items))
+    assert jumps == [1]
+
+
 def test_google_tasks_cache_hits(monkeypatch):
     from types import SimpleNamespace
     from datetime import datetime, timedelta
@@ -485,6 +504,38 @@ def test_on_google_task_toggled_calls_update(monkeypatch, tmp_path: Path):
     assert called["last"][2].get("status") == "needsAction"
 
 
+def test_google_task_calls_run_off_loop(monkeypatch):
+    import asyncio
+    import threading
+
+    app = MunazzimApp()
+    refreshed = []
+    monkeypatch.setattr(app, "refresh_plan", lambda **k: refreshed.append(k))
+    seen = {}
+
+    class FakeService:
+        def update_task(self, list_id, task_id, **kwargs):
+            seen["update"] = threading.current_thread()
+
+        def list_tasks(self, list_id, show_completed=True):
+            seen["list"] = threading.current_thread()
+            return [SimpleNamespace(id="tid-1", title="t", notes=None, due=None, status="completed")]
+
+    app.google_tasks_service = FakeService()
+    app.selected_google_tasklist = "L"
+
+    async def run():
+        app._on_google_task_toggled("tid-1", completed=True)
+        assert not seen
+        await asyncio.sleep(0.1)
+
+    asyncio.run(run())
+    assert seen["update"] is not threading.main_thread()
+    assert seen["list"] is not threading.main_thread()
+    assert app._get_cached_tasks("L")[0].status == "completed"
+    assert len(refreshed) == 1
+
+
 def test_on_new_task_creates_task(monkeypatch, tmp_path: Path):
     app = MunazzimApp()
     # Avoid Textual-dependent logic which requires an active app/context
@@ -576,3 +627,347 @@ def test_tui_applies_relative_prayer_placeholder(monkeypatch):
     assert delta == timedelta(minutes=20)
     assert any("Prayer overrides applied" in s for s in updates)
 
+
+
+def test_tasklist_by_title_uses_cached_index(monkeypatch):
+    app = MunazzimApp()
+    seen = {"list_calls": 0}
+
+    class FakeService:
+        def list_tasklists(self):
+            seen["list_calls"] += 1
+            return [SimpleNamespace(id="L1", title="Reading"), SimpleNamespace(id="L2", title="Reading")]
+
+    app.google_tasks_service = FakeService()
+    assert app._tasklist_by_title("Reading").id == "L1"
+    assert app._tasklist_by_title("Missing") is None
+    assert seen["list_calls"] == 1
+
+
+def test_list_tasklists_is_read_through(monkeypatch):
+    app = MunazzimApp()
+    seen = {"list_calls": 0}
+
+    class FakeService:
+        def list_tasklists(self):
+            seen["list_calls"] += 1
+            return [SimpleNamespace(id="L1", title="Reading")]
+
+    app.google_tasks_service = FakeService()
+    lists = app._list_tasklists()
+    lists.clear()
+    assert [l.id for l in app._list_tasklists()] == ["L1"]
+    assert seen["list_calls"] == 1
+    app._list_tasklists(refresh=True)
+    assert seen["list_calls"] == 2
+    app._invalidate_tasklist_cache()
+    app._list_tasklists()
+    assert seen["list_calls"] == 3
+
+
+def test_week_occurrence_index_builds_plans_once(monkeypatch):
+    from datetime import datetime, timedelta
+    from munazzim.models import DayPlan, Event, ScheduledEvent
+
+    app = MunazzimApp()
+    builds = []
+    start = datetime.combine(app.current_date, datetime.min.time()) + timedelta(hours=9)
+    items = [
+        ScheduledEvent(event=Event(name=name, duration=timedelta(hours=1)), start=start, end=start + timedelta(hours=1))
+        for name in ("Reading", "Writing")
+    ]
+
+    def build_plan(template, plan_date=None, prayer_schedule=None):
+        builds.append(plan_date)
+        return DayPlan(template_name="t", generated_for=plan_date, items=items)
+
+    monkeypatch.setattr(app.scheduler, "build_plan", build_plan)
+    monkeypatch.setattr(app, "_compute_templates_fingerprint", lambda: "fp")
+    app.week_assignments = {"monday": "Default"}
+    monkeypatch.setattr(app.templates, "get", lambda name: SimpleNamespace(name=name))
+    assert app._find_event_occurrence("Reading") is not None
+    assert app._find_event_occurrence("Writing") is not None
+    assert app._find_event_occurrence("Missing") is None
+    assert len(builds) == 1
+
+
+def test_sync_event_tasks_skips_due_lookup_when_nothing_is_missing(monkeypatch):
+    app = MunazzimApp()
+
+    class FakeService:
+        def list_tasklists(self):
+            return [SimpleNamespace(id="L", title="Reading")]
+
+        def list_tasks(self, list_id, show_completed=True):
+            return [SimpleNamespace(id="t1", title="Read book", notes=None, due=None, status="needsAction")]
+
+        def create_task(self, list_id, **kwargs):
+            raise AssertionError("nothing should be created")
+
+    app.google_tasks_service = FakeService()
+    monkeypatch.setattr(app.task_engine, "parse_event_file", lambda name: [TaskDefinition(task_id="t", event_name=name, label="Read book", note=None, total_occurrences=None)])
+
+    def _no_lookup(*args):
+        raise AssertionError("occurrence lookup")
+
+    monkeypatch.setattr(app, "_find_event_occurrence", _no_lookup)
+    app._sync_event_tasks_to_google("Reading")
+
+
+def test_tasklist_lookup_survives_concurrent_invalidation(monkeypatch):
+    app = MunazzimApp()
+    app.google_tasks_service = SimpleNamespace(list_tasklists=lambda: [SimpleNamespace(id="L1", title="Reading")])
+    set_cached = app._set_cached_tasklists
+
+    def set_then_invalidate(lists):
+        entry = set_cached(lists)
+        # A worker thread resets the cache right after it is filled
+        app._invalidate_tasklist_cache()
+        return entry
+
+    monkeypatch.setattr(app, "_set_cached_tasklists", set_then_invalidate)
+    assert app._tasklist_by_title("Reading").id == "L1"
+
+
+def test_resolve_due_uses_known_list_titles(monkeypatch):
+    app = MunazzimApp()
+    app.google_tasks_service = SimpleNamespace(list_tasklists=lambda: [SimpleNamespace(id="L1", title="Reading")])
+    app._list_tasklists()
+    # Titles outlive the list cache, so resolving a due makes no API call
+    app._invalidate_tasklist_cache()
+    def _unexpected():
+        raise AssertionError("list_tasklists called")
+
+    app.google_tasks_service = SimpleNamespace(list_tasklists=_unexpected)
+    looked_up = []
+    monkeypatch.setattr(app, "_find_event_occurrence", lambda name, start=None: looked_up.append(name))
+    assert app._resolve_due_for_list("L1") is None
+    assert looked_up == ["Reading"]
+
+
+def test_stale_tasks_are_served_and_cache_is_bounded(monkeypatch):
+    app = MunazzimApp()
+    app.google_tasks_service = SimpleNamespace(list_tasklists=lambda: [SimpleNamespace(id="L", title="Reading")])
+    app._set_cached_tasks("L", [SimpleNamespace(id="t1", title="Read book", notes=None, due=None, status="needsAction")])
+    # Age the entry past the TTL; no running loop so no refresh is attempted
+    ts, items = app._google_tasks_cache["L"]
+    app._google_tasks_cache["L"] = (ts - app._google_tasks_cache_ttl - 1, items)
+    assert app._get_cached_tasks("L") is None
+    todos = app._get_cached_tasks_for_event("Reading")
+    assert todos and todos[0].task == "Read book"
+
+    app._google_tasks_cache_max = 2
+    for list_id in ("A", "B"):
+        app._set_cached_tasks(list_id, [])
+    # A read marks the entry as recently used, so B is evicted first
+    app._get_cached_tasks("A")
+    app._set_cached_tasks("C", [])
+    assert list(app._google_tasks_cache) == ["A", "C"]
+
+
+def test_todo_view_is_reused_until_tasks_change(monkeypatch):
+    app = MunazzimApp()
+    app.google_tasks_service = SimpleNamespace(list_tasklists=lambda: [SimpleNamespace(id="L", title="Reading")])
+    task = SimpleNamespace(id="t1", title="Read book", notes=None, due=None, status="needsAction")
+    app._set_cached_tasks("L", [task])
+    first = app._get_cached_tasks_for_event("Reading")
+    assert app._get_cached_tasks_for_event("Reading") is first
+    # Refetching identical tasks keeps the built view
+    app._set_cached_tasks("L", [SimpleNamespace(**vars(task))])
+    assert app._get_cached_tasks_for_event("Reading") is first
+    # A status change rebuilds it
+    app._set_cached_tasks("L", [SimpleNamespace(**{**vars(task), "status": "completed"})])
+    rebuilt = app._get_cached_tasks_for_event("Reading")
+    assert rebuilt is not first and rebuilt[0].checked
+
+
+def test_task_toggles_coalesce_into_one_refresh(monkeypatch):
+    import asyncio
+
+    app = MunazzimApp()
+    calls = []
+    monkeypatch.setattr(app, "refresh_plan", lambda **k: calls.append(k))
+    monkeypatch.setattr(app.task_engine, "toggle_assignment", lambda *a: None)
+
+    async def burst():
+        for _ in range(5):
+            app._on_assignment_toggled("a1", True)
+        await asyncio.sleep(0.1)
+
+    asyncio.run(burst())
+    assert len(calls) == 1
+    # Without a running loop the refresh happens inline
+    app._on_assignment_toggled("a1", False)
+    assert len(calls) == 2
+
+
+def test_template_error_dismissals_coalesce_reloads(monkeypatch):
+    import asyncio
+
+    app = MunazzimApp()
+    calls = []
+    monkeypatch.setattr(app, "_reload_templates", lambda: calls.append("reload"))
+    monkeypatch.setattr(app.task_engine, "refresh", lambda: calls.append("tasks"))
+    monkeypatch.setattr(app, "refresh_plan", lambda **k: calls.append("plan"))
+
+    async def burst():
+        for _ in range(3):
+            app._on_template_error_closed(False, None)
+        # A plain refresh in the window keeps the pending reload
+        app._schedule_refresh()
+        await asyncio.sleep(0.1)
+
+    asyncio.run(burst())
+    assert calls == ["reload", "tasks", "plan"]
+
+
+def test_config_saves_are_coalesced(monkeypatch):
+    import asyncio
+
+    app = MunazzimApp()
+    saves = []
+    monkeypatch.setattr(app.config_manager, "save", lambda cfg: saves.append(cfg))
+
+    async def burst():
+        for list_id in ("A", "B", "C"):
+            app._select_event_tasklist(list_id)
+        assert saves == []
+        app._flush_config()
+
+    asyncio.run(burst())
+    assert len(saves) == 1
+    assert saves[0].planner.google_task_list == "C"
+    # Flushing with nothing pending does not write again
+    app._flush_config()
+    assert len(saves) == 1
+
+
+def test_failed_config_save_stays_pending(monkeypatch):
+    app = MunazzimApp()
+    statuses = []
+    monkeypatch.setattr(app.status_line, "update", statuses.append)
+
+    def failing_save(cfg):
+        raise OSError("read-only file system")
+
+    monkeypatch.setattr(app.config_manager, "save", failing_save)
+    # No running loop: the change is flushed immediately and the error reported
+    app._select_event_tasklist("A")
+    assert app._config_dirty
+    assert statuses and "read-only file system" in statuses[-1]
+    saves = []
+    monkeypatch.setattr(app.config_manager, "save", saves.append)
+    app._flush_config()
+    assert len(saves) == 1
+    assert not app._config_dirty
+
+
+def test_prefetch_event_tasks_batches_uncached_lists(monkeypatch):
+    import asyncio
+    from datetime import datetime, timedelta
+    from munazzim.models import DayPlan, Event, ScheduledEvent
+
+    app = MunazzimApp()
+    now = datetime.now()
+    items = [
+        ScheduledEvent(event=Event(name=name, duration=timedelta(hours=1)), start=now, end=now)
+        for name in ("Reading", "Writing", "Unlisted")
+    ]
+    plan = DayPlan(template_name="t", generated_for=now.date(), items=items)
+    seen = {}
+
+    class FakeService:
+        def list_tasklists(self):
+            return [SimpleNamespace(id="L1", title="Reading"), SimpleNamespace(id="L2", title="Writing")]
+
+        def batch_list_tasks(self, list_ids):
+            seen["batched"] = list(list_ids)
+            return {list_id: [] for list_id in list_ids}
+
+    app.google_tasks_service = FakeService()
+    app._set_cached_tasks("L1", [])
+    asyncio.run(app._prefetch_event_tasks(plan))
+    assert seen["batched"] == ["L2"]
+    assert app._get_cached_tasks("L2") == []
+
+
+def test_open_event_tasks_runs_api_calls_off_loop(monkeypatch):
+    import asyncio
+    import threading
+    from datetime import datetime, timedelta
+    from munazzim.models import Event, ScheduledEvent
+
+    app = MunazzimApp()
+    monkeypatch.setattr(app.week_panel, "set_data", lambda *a, **k: None)
+    monkeypatch.setattr(app, "refresh_plan", lambda **k: None)
+    monkeypatch.setattr(app, "_show_task_view", lambda: None)
+    monkeypatch.setattr(app.config_manager, "save", lambda cfg: None)
+    event = Event(name="Reading", duration=timedelta(hours=1))
+    now = datetime.now()
+    app.plan_table = SimpleNamespace(cursor_row=0, _row_metadata=[ScheduledEvent(event=event, start=now, end=now)])
+    seen = {}
+
+    class FakeService:
+        def list_tasklists(self):
+            seen["thread"] = threading.current_thread()
+            return []
+
+        def create_tasklist(self, title):
+            return SimpleNamespace(id="L", title=title)
+
+    app.google_tasks_service = FakeService()
+    app.selected_google_tasklist = ""
+
+    async def run():
+        app.action_open_event_tasks()
+        assert app.selected_google_tasklist != "L"
+        for _ in range(50):
+            await asyncio.sleep(0.01)
+            if app._selected_list_locked == "L":
+                break
+
+    asyncio.run(run())
+    assert app.selected_google_tasklist == "L"
+    assert seen["thread"] is not threading.main_thread()
+
+
+def test_open_event_tasks_reports_unlinked_tasks_on_loop_thread(monkeypatch):
+    import asyncio
+    import threading
+    from datetime import datetime, timedelta
+    from munazzim.models import Event, ScheduledEvent
+
+    app = MunazzimApp()
+    monkeypatch.setattr(app.week_panel, "set_data", lambda *a, **k: None)
+    monkeypatch.setattr(app, "refresh_plan", lambda **k: None)
+    monkeypatch.setattr(app, "_show_task_view", lambda: None)
+    monkeypatch.setattr(app.config_manager, "save", lambda cfg: None)
+    monkeypatch.setattr(app, "_find_event_occurrence", lambda name, start=None: None)
+    errors = []
+    monkeypatch.setattr(app, "_display_error", lambda prefix, detail: errors.append((prefix, threading.current_thread())))
+    event = Event(name="Reading", duration=timedelta(hours=1))
+    now = datetime.now()
+    app.plan_table = SimpleNamespace(cursor_row=0, _row_metadata=[ScheduledEvent(event=event, start=now, end=now)])
+    app.task_engine._tasks_by_event[event.name] = [TaskDefinition(task_id="t1", event_name=event.name, label="Read book", note=None, total_occurrences=None)]
+
+    class FakeService:
+        def list_tasklists(self):
+            return [SimpleNamespace(id="L", title="Reading")]
+
+        def list_tasks(self, list_id, show_completed=True):
+            return []
+
+        def create_task(self, list_id, **kwargs):
+            pass
+
+    app.google_tasks_service = FakeService()
+
+    async def run():
+        app.action_open_event_tasks()
+        for _ in range(50):
+            await asyncio.sleep(0.01)
+            if app._selected_list_locked == "L":
+                break
+
+    asyncio.run(run())
+    assert errors == [("Tasks Sync", threading.main_thread())]
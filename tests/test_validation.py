@@ -2,7 +2,7 @@ from datetime import time, timedelta
 import unittest
 
 from munazzim.config import PrayerSchedule
-from munazzim.models import DayTemplate, Event, FixedEvent
+from munazzim.models import DayTemplate, Event, FixedEvent, PrayerBoundEvent
 from munazzim.validation import TemplateValidationError, TemplateValidator
 
 
@@ -53,6 +53,45 @@ class TemplateValidatorTest(unittest.TestCase):
         )
         TemplateValidator.validate(template, self.prayers)
 
+    def test_reports_event_pushing_past_24_hours(self) -> None:
+        template = DayTemplate(
+            name="Overfull",
+            start_time=time(4, 0),
+            description="",
+            events=[
+                Event(name="Work", duration=timedelta(hours=20)),
+                Event(name="Study", duration=timedelta(hours=4, minutes=30)),
+                Event(name="Rest", duration=timedelta(hours=1)),
+            ],
+        )
+        with self.assertRaises(TemplateValidationError) as ctx:
+            TemplateValidator.validate(template, self.prayers)
+        self.assertEqual(
+            ctx.exception.issues,
+            [
+                "Template exceeds 24 hours of planned time. Total planned time is 25:30. "
+                "'Study' pushes it over by 00:30."
+            ],
+        )
+
+    def test_prayer_references_follow_the_schedule(self) -> None:
+        template = DayTemplate(
+            name="Evening",
+            start_time=time(4, 0),
+            description="",
+            events=[
+                PrayerBoundEvent(name="Prep", duration=timedelta(0), start_ref="Asr", end_ref="Maghrib-50"),
+                Event(name="Dinner", duration=timedelta(hours=1)),
+            ],
+        )
+        TemplateValidator.validate(template, self.prayers)
+        # Same tokens against a schedule where Maghrib-50 falls before Asr,
+        # wrapping the range past midnight and the template past 24 hours
+        late_asr = PrayerSchedule.from_dict({"fajr": "05:00", "asr": "17:30", "maghrib": "18:00"})
+        with self.assertRaises(TemplateValidationError):
+            TemplateValidator.validate(template, late_asr)
+        TemplateValidator.validate(template, self.prayers)
+
 
 if __name__ == "__main__":
     unittest.main()